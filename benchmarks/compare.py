@@ -0,0 +1,64 @@
+"""
+Compare two benchmark result files written by benchmarks.suite, e.g. the
+parent commit against the current one:
+
+    python -m benchmarks.compare benchmarks/results/abc1234.json benchmarks/results/def5678.json [--threshold 10]
+
+Lists the change of every benchmark median and exits with status 1 when one
+got worse by more than the threshold (percent), so it can gate a CI job.
+"""
+# 1. Standard Library
+import argparse
+import json
+import sys
+
+# 2. Third Party Library
+
+# 3. Internal Library
+
+
+def load(path) -> dict:
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)
+
+
+def compare(base: dict, head: dict, threshold: float) -> list:
+    """(name, base median, head median, change %, regressed) for the benchmarks found in both."""
+    rows = []
+    for name, before in base['results'].items():
+        after = head['results'].get(name)
+        if after is None:
+            continue
+        change = (after['median'] - before['median']) / before['median'] * 100 if before['median'] else 0.0
+        worse = -change if before.get('higher_is_better') else change
+        rows.append((name, before['median'], after['median'], change, worse > threshold))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare two benchmark result files.')
+    parser.add_argument('base', help='results of the reference commit')
+    parser.add_argument('head', help='results to check against it')
+    parser.add_argument('--threshold', type=float, default=10.0, help='regression limit in percent (default 10)')
+    args = parser.parse_args()
+
+    base, head = load(args.base), load(args.head)
+    print(f'base {base["meta"]["commit"]}  head {head["meta"]["commit"]}')
+    if base['meta'].get('rows') != head['meta'].get('rows'):
+        print(f'Warning: different row counts {base["meta"].get("rows")} / {head["meta"].get("rows")}')
+
+    rows = compare(base, head, args.threshold)
+    print(f'{"benchmark":<34}{"base":>12}{"head":>12}{"change":>9}')
+    for name, before, after, change, regressed in rows:
+        print(f'{name:<34}{before:>12.1f}{after:>12.1f}{change:>+8.1f}%{"  REGRESSION" if regressed else ""}')
+
+    missing = sorted(set(base['results']) ^ set(head['results']))
+    if missing:
+        print(f'Only in one of the files: {", ".join(missing)}')
+    regressions = sum(regressed for *_, regressed in rows)
+    print(f'{regressions} regression(s) over {args.threshold:g}%')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,51 @@
+"""
+Bulk currency conversion of invoice line items: a Decimal loop looking up
+the rates dict per item (the straightforward way), against CrossRateMatrix
+converting one column (every amount MYR -> SGD) and a ledger in mixed
+currencies (MYR, SGD, USD, EUR -> MYR). Amounts are random minor units.
+
+    python -m benchmarks.currency_convert [items]
+"""
+# 1. Standard Library
+import random
+import sys
+import time
+from array import array
+from decimal import Decimal
+
+# 2. Third Party Library
+# 3. Internal Library
+from core.utils.currency_convert import PREFERRED_CURRENCIES, CrossRateMatrix, from_minor, to_minor
+
+RATES = {'USD': 1, 'MYR': 4.2135, 'SGD': 1.3542, 'EUR': 0.92134, 'JPY': 149.87, 'GBP': 0.79021}
+
+
+def timed(fn, *args) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    return (time.perf_counter() - start) * 1000
+
+
+def decimal_loop(amounts, currencies, to_currency):
+    rates = {code: Decimal(str(rate)) for code, rate in RATES.items()}
+    return [to_minor(from_minor(amount, currency) * rates[to_currency] / rates[currency], to_currency)
+            for amount, currency in zip(amounts, currencies)]
+
+
+def main(count: int = 1_000_000):
+    rng = random.Random(24)
+    amounts = array('q', (rng.randint(-10 ** 6, 10 ** 8) for _ in range(count)))
+    currencies = [rng.choice(PREFERRED_CURRENCIES) for _ in range(count)]
+
+    build_ms = timed(CrossRateMatrix, RATES)
+    matrix = CrossRateMatrix(RATES)
+    codes = array('H', (matrix.index[currency] for currency in currencies))
+    print(f'{count:,} line items, ms (matrix built in {build_ms:.2f} ms)')
+    print(f'{"Decimal loop over dicts":<34}{timed(decimal_loop, amounts, currencies, "MYR"):>8.0f}')
+    print(f'{"convert_column MYR -> SGD":<34}{timed(matrix.convert_column, amounts, "MYR", "SGD"):>8.0f}')
+    print(f'{"convert_ledger -> MYR (codes)":<34}{timed(matrix.convert_ledger, amounts, currencies, "MYR"):>8.0f}')
+    print(f'{"convert_ledger -> MYR (indices)":<34}{timed(matrix.convert_ledger, amounts, codes, "MYR"):>8.0f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
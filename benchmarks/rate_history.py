@@ -0,0 +1,80 @@
+"""
+Exchange rate history lookups: a synthetic history (one provider update a
+day for `years` years and 160 currencies, quoted against the made-up base
+'ZZZ' so real rates are left alone) is stored in currency_rate_dev with
+store_rates, then timed as single index probes (fetch_rate_at, one query
+each), loaded once into a RateHistory (rate_at / rates_at / series), and
+deleted again. Apply database/migrations/005_currency_rate_history.sql first.
+
+    python -m benchmarks.rate_history [years]
+"""
+# 1. Standard Library
+import calendar
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+# 2. Third Party Library
+import psycopg2
+
+# 3. Internal Library
+from core.utils.rate_history import fetch_rate_at, load_rate_history, store_rates
+from database.database_functions import get_connection_settings
+
+TABLE = 'currency_rate_dev'
+BASE = 'ZZZ'
+CURRENCIES = [f'{chr(65 + i // 26)}{chr(65 + i % 26)}X' for i in range(160)]
+LOOKUPS = 100_000
+
+
+def main(years: int = 10):
+    rng = random.Random(23)
+    conn = psycopg2.connect(**get_connection_settings())
+    start = date.today() - timedelta(days=365 * years)
+    days = [start + timedelta(days=offset) for offset in range(365 * years)]
+    try:
+        rates = {currency: rng.uniform(0.1, 100) for currency in CURRENCIES}
+        began = time.perf_counter()
+        for day in days:
+            rates = {currency: rate * rng.uniform(0.99, 1.01) for currency, rate in rates.items()}
+            store_rates(conn, TABLE, BASE, rates, calendar.timegm(day.timetuple()))
+        stored = time.perf_counter() - began
+        print(f'{len(days)} updates x {len(CURRENCIES)} currencies stored in {stored:.1f} s '
+              f'({len(days) / stored:.0f} updates/s)')
+
+        queries = [(rng.choice(CURRENCIES), rng.choice(days)) for _ in range(2_000)]
+        began = time.perf_counter()
+        for currency, day in queries:
+            fetch_rate_at(conn, TABLE, currency, day, base=BASE)
+        print(f'fetch_rate_at: {len(queries) / (time.perf_counter() - began):,.0f} lookups/s (one query each)')
+
+        began = time.perf_counter()
+        history = load_rate_history(conn, TABLE, base=BASE)
+        print(f'load_rate_history: {len(history):,} rates in {(time.perf_counter() - began) * 1000:.0f} ms')
+
+        queries = [(rng.choice(CURRENCIES), rng.choice(days)) for _ in range(LOOKUPS)]
+        began = time.perf_counter()
+        for currency, day in queries:
+            history.rate_at(currency, day)
+        print(f'RateHistory.rate_at: {LOOKUPS / (time.perf_counter() - began):,.0f} lookups/s')
+
+        invoice_days = [rng.choice(days) for _ in range(LOOKUPS)]
+        began = time.perf_counter()
+        history.rates_at(CURRENCIES[0], invoice_days)
+        print(f'RateHistory.rates_at: {LOOKUPS / (time.perf_counter() - began):,.0f} lookups/s')
+
+        began = time.perf_counter()
+        for currency in CURRENCIES:
+            history.series(currency, days[-365], days[-1])
+        print(f'RateHistory.series (1 year): {(time.perf_counter() - began) / len(CURRENCIES) * 1000:.2f} ms each')
+    finally:
+        conn.rollback()
+        with conn.cursor() as cur:
+            cur.execute(f'DELETE FROM {TABLE} WHERE base = %s', (BASE,))
+        conn.commit()
+        conn.close()
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
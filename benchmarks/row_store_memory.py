@@ -0,0 +1,100 @@
+"""
+Memory held per 100k rows by the entity pages: raw fetchall() tuples, one
+QTableWidgetItem per cell (the pre-model table) and the ColumnStore.
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.row_store_memory [rows]
+"""
+# 1. Standard Library
+import gc
+import os
+import sys
+import tracemalloc
+
+# 2. Third Party Library
+from PySide6.QtWidgets import QApplication, QTableWidget, QTableWidgetItem
+
+# 3. Internal Library
+from benchmarks.synthetic import synthetic_rows
+from core.models.row_store import ColumnStore
+from core.utils.db_utils import format_value
+from database.clientdb.client_widget import CATEGORY_COLUMNS as CLIENT_CATEGORIES
+from database.clientdb.client_widget import COLUMN_ORDER as CLIENT_COLUMNS
+from database.partnerdb.partner_widget import CATEGORY_COLUMNS as PARTNER_CATEGORIES
+from database.partnerdb.partner_widget import COLUMN_ORDER as PARTNER_COLUMNS
+from database.supplierdb.supplier_widget import CATEGORY_COLUMNS as SUPPLIER_CATEGORIES
+from database.supplierdb.supplier_widget import COLUMN_ORDER as SUPPLIER_COLUMNS
+
+ENTITIES = {
+    'client': (CLIENT_COLUMNS, CLIENT_CATEGORIES),
+    'supplier': (SUPPLIER_COLUMNS, SUPPLIER_CATEGORIES),
+    'partner': (PARTNER_COLUMNS, PARTNER_CATEGORIES),
+}
+
+
+def rss_bytes() -> int:
+    with open('/proc/self/statm') as statm:
+        return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+
+def traced(build):
+    """Python heap allocated by `build()` and still alive afterwards."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def table_items_rss(rows, columns) -> int:
+    """Resident memory of a QTableWidget filled with one item per cell (C++ objects included)."""
+    gc.collect()
+    before = rss_bytes()
+    table = QTableWidget(len(rows), len(columns))
+    for row_idx, row in enumerate(rows):
+        for col_idx, value in enumerate(row):
+            table.setItem(row_idx, col_idx, QTableWidgetItem(format_value(value)))
+    used = rss_bytes() - before
+    table.deleteLater()
+    return used
+
+
+def measure(entity: str, count: int) -> dict:
+    columns, categories = ENTITIES[entity]
+    rows, tuples_bytes = traced(lambda: synthetic_rows(entity, count))
+
+    def build_store():
+        store = ColumnStore(columns, categories)
+        store.append_rows(rows)
+        return store
+
+    store, store_bytes = traced(build_store)
+    return {
+        'entity': entity,
+        'rows': count,
+        'tuples_bytes': tuples_bytes,
+        'table_items_bytes': table_items_rss(rows, columns),
+        'store_bytes': store_bytes,
+        'store_payload_bytes': store.nbytes(),
+    }
+
+
+def main(count: int = 100_000):
+    app = QApplication.instance() or QApplication(sys.argv[:1])  # noqa: F841
+    scale = 100_000 / count
+    print(f'Per 100k rows (measured with {count} rows), MiB')
+    print(f'{"page":<10}{"tuples":>10}{"+ items":>10}{"store":>10}{"vs tuples":>11}{"vs both":>10}')
+    for entity in ENTITIES:
+        result = measure(entity, count)
+        tuples_mib = result['tuples_bytes'] * scale / 2 ** 20
+        items_mib = result['table_items_bytes'] * scale / 2 ** 20
+        store_mib = result['store_bytes'] * scale / 2 ** 20
+        saved_tuples = 1 - store_mib / tuples_mib
+        saved_both = 1 - store_mib / (tuples_mib + items_mib)
+        print(f'{entity:<10}{tuples_mib:>10.1f}{items_mib:>10.1f}{store_mib:>10.1f}'
+              f'{saved_tuples:>11.0%}{saved_both:>10.0%}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,45 @@
+-- Base tables of the entity pages (client/supplier/partner and their _dev variants), for a fresh benchmark
+-- database. Existing tables are left alone; benchmarks/seed.py runs this, then database/migrations/*.sql.
+DO $$
+DECLARE
+    suffix text;
+BEGIN
+    FOREACH suffix IN ARRAY ARRAY['', '_dev'] LOOP
+        EXECUTE format('
+            CREATE TABLE IF NOT EXISTS %I (
+                client_id serial PRIMARY KEY,
+                client_name varchar(100) NOT NULL,
+                client_contact varchar(50),
+                client_type varchar(20),
+                status varchar(20),
+                description text,
+                created_at timestamp DEFAULT now(),
+                updated_at timestamp DEFAULT now(),
+                deleted_at timestamp
+            )', 'client' || suffix);
+        EXECUTE format('
+            CREATE TABLE IF NOT EXISTS %I (
+                supplier_id serial PRIMARY KEY,
+                supplier_name varchar(100) NOT NULL,
+                supplier_contact varchar(50),
+                supplier_type varchar(30),
+                supplier_status varchar(20),
+                description text,
+                contract_start date,
+                contract_end date,
+                created_at timestamp DEFAULT now(),
+                updated_at timestamp DEFAULT now(),
+                deleted_at timestamp
+            )', 'supplier' || suffix);
+        EXECUTE format('
+            CREATE TABLE IF NOT EXISTS %I (
+                partner_id serial PRIMARY KEY,
+                partner_name varchar(100) NOT NULL,
+                partner_contact varchar(50),
+                description text,
+                created_at timestamp DEFAULT now(),
+                updated_at timestamp DEFAULT now(),
+                deleted_at timestamp
+            )', 'partner' || suffix);
+    END LOOP;
+END $$;
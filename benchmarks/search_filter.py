@@ -0,0 +1,83 @@
+"""
+Per-keystroke cost of the table search: the previous row loop (lowercase every
+cell, setRowHidden row by row) against the trigram SearchIndex plus one filter
+reset of the model, while typing a name character by character.
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.search_filter [rows]
+"""
+# 1. Standard Library
+import sys
+import time
+
+# 2. Third Party Library
+from PySide6.QtWidgets import QApplication, QTableView
+
+# 3. Internal Library
+from benchmarks.synthetic import synthetic_rows
+from core.models.entity_table_model import EntityTableModel
+from core.utils.search_index import SearchIndex
+from database.clientdb.client_widget import CATEGORY_COLUMNS, COLUMN_ORDER, HEADERS
+
+NAME_COLUMN = 1
+DESCRIPTION_COLUMN = COLUMN_ORDER.index('description')
+
+
+def loop_filter(view, model, column, text):
+    """The filter_table loop this replaced."""
+    for row in range(model.rowCount()):
+        view.setRowHidden(row, text not in model.display_text(row, column).lower())
+
+
+def index_filter(view, model, column, text):
+    index = model.search_index
+    model.set_filter(lambda row: index.matches(column, row, text), matches=index.search(column, text))
+
+
+def build_view(rows):
+    model = EntityTableModel(HEADERS, columns=COLUMN_ORDER, categorical=CATEGORY_COLUMNS)
+    model.reset_rows(rows)
+    view = QTableView()
+    view.setModel(model)
+    view.resize(1000, 600)
+    view.show()
+    return view, model
+
+
+def type_query(app, view, model, column, query, filter_fn) -> list:
+    """Milliseconds per keystroke (repaint included) while typing `query`."""
+    timings = []
+    for length in range(1, len(query) + 1):
+        start = time.perf_counter()
+        filter_fn(view, model, column, query[:length].lower())
+        app.processEvents()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main(count: int = 50_000):
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    rows = list(synthetic_rows('client', count))
+    queries = [(NAME_COLUMN, rows[count // 2][1]), (NAME_COLUMN, 'Global'), (DESCRIPTION_COLUMN, 'asia pacific')]
+
+    view, model = build_view(rows)
+    start = time.perf_counter()
+    model.search_index.build(NAME_COLUMN)
+    model.search_index.build(DESCRIPTION_COLUMN)
+    print(f'{count} client rows, index build for 2 columns: {(time.perf_counter() - start) * 1000:.0f} ms '
+          f'(done in {SearchIndex.INDEX_SLICE}-row slices while the GUI is idle)')
+    print(f'{"query":<32}{"loop avg":>10}{"loop max":>10}{"index avg":>11}{"index max":>11}')
+
+    for column, query in queries:
+        loop_view, loop_model = build_view(rows)
+        loop_ms = type_query(app, loop_view, loop_model, column, query, loop_filter)
+        loop_view.deleteLater()
+
+        index_ms = type_query(app, view, model, column, query, index_filter)
+        model.set_filter(None)
+
+        print(f'{query!r:<32}{sum(loop_ms) / len(loop_ms):>10.1f}{max(loop_ms):>10.1f}'
+              f'{sum(index_ms) / len(index_ms):>11.1f}{max(index_ms):>11.1f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -0,0 +1,139 @@
+"""
+Seed the entity tables of the local database (DB_* settings / .env) with
+synthetic rows for the benchmark suite: creates the tables if needed
+(benchmarks/schema.sql), applies database/migrations, then REPLACES the
+content of every table with `rows` generated rows, COPYed in chunks. Only
+the _dev tables the app reads in dev mode are seeded unless --tables says
+otherwise.
+
+    python -m benchmarks.seed --rows 100000 [--tables client_dev supplier_dev] [--seed 42]
+
+Same seed and row count, same rows, so results from different machines or
+commits compare like for like.
+
+The seeded tables are emptied first (TRUNCATE), so a database that is not on
+this machine is refused: point --dsn at a separate database, or pass --yes
+to seed the DB_* database anyway.
+
+    python -m benchmarks.seed --dsn "host=localhost dbname=crm_bench user=postgres"
+"""
+# 1. Standard Library
+import argparse
+import glob
+import io
+import itertools
+import os
+import time
+
+# 2. Third Party Library
+import psycopg2
+
+# 3. Internal Library
+from benchmarks.synthetic import iter_synthetic_rows
+from database.clientdb.client_widget import COLUMN_ORDER as CLIENT_COLUMNS
+from database.database_functions import get_connection_settings
+from database.partnerdb.partner_widget import COLUMN_ORDER as PARTNER_COLUMNS
+from database.supplierdb.supplier_widget import COLUMN_ORDER as SUPPLIER_COLUMNS
+
+TABLES = ['client', 'supplier', 'partner', 'client_dev', 'supplier_dev', 'partner_dev']
+DEV_TABLES = [table for table in TABLES if table.endswith('_dev')]
+COLUMNS = {
+    'client': CLIENT_COLUMNS,
+    'supplier': SUPPLIER_COLUMNS,
+    'partner': PARTNER_COLUMNS,
+}
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCHEMA = os.path.join(ROOT, 'benchmarks', 'schema.sql')
+MIGRATIONS = os.path.join(ROOT, 'database', 'migrations')
+CHUNK_ROWS = 50_000  # Rows per COPY, keeps memory flat at 1M rows
+LOCAL_HOSTS = {None, '', 'localhost', '127.0.0.1', '::1'}
+
+
+def _copy_value(value) -> str:
+    """Value in COPY text format."""
+    if value is None:
+        return '\\N'
+    return str(value).replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n')
+
+
+def apply_sql(conn, path) -> bool:
+    """Run a SQL file in its own transaction, a failure (e.g. pg_trgm not installed) is reported and skipped."""
+    with open(path, encoding='utf-8') as file:
+        sql = file.read()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(sql)
+        conn.commit()
+        return True
+    except psycopg2.Error as e:
+        conn.rollback()
+        print(f'Skipped {os.path.basename(path)}: {str(e).strip()}')
+        return False
+
+
+def seed_table(conn, table, count, seed=42):
+    """Replace the rows of `table` with `count` synthetic rows and reset its ID sequence."""
+    entity = table.split('_')[0]
+    columns = COLUMNS[entity]
+    rows = iter_synthetic_rows(entity, count, seed)
+    with conn.cursor() as cur:
+        cur.execute(f'TRUNCATE {table} RESTART IDENTITY')
+        # The change notify triggers would queue one NOTIFY per copied row
+        cur.execute(f'ALTER TABLE {table} DISABLE TRIGGER USER')
+        while True:
+            chunk = io.StringIO()
+            for row in itertools.islice(rows, CHUNK_ROWS):
+                chunk.write('\t'.join(map(_copy_value, row)))
+                chunk.write('\n')
+            if not chunk.tell():
+                break
+            chunk.seek(0)
+            cur.copy_expert(f'COPY {table} ({", ".join(columns)}) FROM STDIN', chunk)
+        cur.execute(f'ALTER TABLE {table} ENABLE TRIGGER USER')
+        cur.execute('SELECT setval(pg_get_serial_sequence(%s, %s), %s, %s)',
+                    (table, columns[0], max(count, 1), count > 0))
+        cur.execute(f'ANALYZE {table}')
+    conn.commit()
+
+
+def is_local(settings) -> bool:
+    """Whether the connection settings point at this machine (TCP loopback or a Unix socket directory)."""
+    host = settings.get('host')
+    return host in LOCAL_HOSTS or host.startswith('/')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Seed the entity tables with synthetic rows.')
+    parser.add_argument('--rows', type=int, default=10_000, help='rows per table (e.g. 10000, 100000, 1000000)')
+    parser.add_argument('--tables', nargs='+', default=DEV_TABLES, choices=TABLES,
+                        help='tables to seed (default: the _dev tables)')
+    parser.add_argument('--seed', type=int, default=42, help='random seed of the generated rows')
+    parser.add_argument('--dsn', help='connection string of the database to seed (default: the DB_* settings)')
+    parser.add_argument('--yes', action='store_true',
+                        help='seed the DB_* database even if it is not on this machine (its rows are replaced)')
+    args = parser.parse_args()
+
+    if args.dsn:
+        conn = psycopg2.connect(args.dsn)
+    else:
+        settings = get_connection_settings()
+        if not (is_local(settings) or args.yes):
+            parser.error(f'DB_HOST {settings["host"]} is not local and seeding TRUNCATEs {", ".join(args.tables)}; '
+                         f'use --dsn for a separate database or --yes to replace its rows anyway')
+        conn = psycopg2.connect(**settings)
+    try:
+        apply_sql(conn, SCHEMA)
+        for path in sorted(glob.glob(os.path.join(MIGRATIONS, '*.sql'))):
+            apply_sql(conn, path)
+
+        for table in args.tables:
+            started = time.perf_counter()
+            seed_table(conn, table, args.rows, args.seed)
+            elapsed = time.perf_counter() - started
+            print(f'{table:<14}{args.rows:>12,} rows{elapsed:>8.1f} s{args.rows / elapsed:>12,.0f} rows/s')
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Time to sort 100k client rows by column: the pre-model QTableWidget (one
+item per cell, NumericTableWidgetItem.__lt__ called from C++ for the ID
+column), the generic `sort_key` tuples built on every sort, and the typed
+sort keys of EntityTableModel (built on the first sort of a column, reused
+afterwards).
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.sort_keys [rows]
+"""
+# 1. Standard Library
+import sys
+import time
+from array import array
+
+# 2. Third Party Library
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication, QTableWidget, QTableWidgetItem
+
+# 3. Internal Library
+from benchmarks.synthetic import synthetic_rows
+from core.models.entity_table_model import EntityTableModel, sort_key
+from core.utils.db_utils import format_value
+from database.clientdb.client_widget import CATEGORY_COLUMNS, COLUMN_ORDER, HEADERS
+
+KINDS = ('number', 'text', 'text', 'text', 'text', 'text', 'datetime', 'datetime')  # column_kinds of the load
+COLUMNS = ['client_id', 'client_name', 'created_at']
+
+
+class NumericTableWidgetItem(QTableWidgetItem):
+    """The item the pre-model table used for IDs, compares as integer from Python."""
+    def __init__(self, value):
+        super().__init__(str(value))
+        self._num = int(value)
+
+    def __lt__(self, other):
+        return self._num < other._num
+
+
+def widget_sort(rows, column) -> float:
+    table = QTableWidget(len(rows), len(HEADERS))
+    for row, values in enumerate(rows):
+        for col, value in enumerate(values):
+            item = NumericTableWidgetItem(value) if col == 0 else QTableWidgetItem(format_value(value))
+            table.setItem(row, col, item)
+    start = time.perf_counter()
+    table.sortItems(column, Qt.SortOrder.AscendingOrder)
+    return time.perf_counter() - start
+
+
+def generic_sort(model, column) -> float:
+    start = time.perf_counter()
+    keys = [sort_key(value) for value in model.store.column_values(column)]
+    array('i', sorted(model._order, key=keys.__getitem__))
+    return time.perf_counter() - start
+
+
+def typed_sort(model, column) -> float:
+    start = time.perf_counter()
+    model.sort(column)
+    return time.perf_counter() - start
+
+
+def main(count: int = 100_000):
+    QApplication.instance() or QApplication(sys.argv[:1])
+    rows = list(synthetic_rows('client', count))
+    model = EntityTableModel(HEADERS, columns=COLUMN_ORDER, categorical=CATEGORY_COLUMNS)
+    model.set_sort_kinds(KINDS)
+    model.reset_rows(rows)
+
+    print(f'{count} client rows, ms per ascending sort')
+    print(f'{"column":<14}{"QTableWidget":>14}{"sort_key":>10}{"typed 1st":>11}{"typed next":>12}')
+    for name in COLUMNS:
+        column = COLUMN_ORDER.index(name)
+        widget_ms = widget_sort(rows, column) * 1000
+        generic_ms = generic_sort(model, column) * 1000
+        first_ms = typed_sort(model, column) * 1000
+        next_ms = typed_sort(model, column) * 1000
+        print(f'{name:<14}{widget_ms:>14.0f}{generic_ms:>10.0f}{first_ms:>11.0f}{next_ms:>12.0f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
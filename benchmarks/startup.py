@@ -0,0 +1,61 @@
+"""
+MainWindow startup, measured in a fresh process so the imports are cold.
+benchmarks.suite runs it once per repeat under the offscreen platform.
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.startup
+
+Prints one JSON object, seconds since the process started timing:
+`imports` (PySide6 and the app modules), `window` (MainWindow constructed
+and shown), `first_idle` (the event loop ran for the first time) and
+`loaded` (every page built so far finished loading its rows).
+"""
+# 1. Standard Library
+import json
+import sys
+import time
+
+# 2. Third Party Library
+
+# 3. Internal Library
+
+TIMEOUT = 300  # Seconds to wait for the pages to load
+
+
+def main():
+    started = time.perf_counter()
+    from PySide6.QtCore import QTimer
+    from PySide6.QtWidgets import QApplication
+
+    from core import BasePageWidget
+    from ui.main_window import MainWindow
+    timings = {'imports': time.perf_counter() - started}
+
+    app = QApplication(sys.argv[:1])
+    window = MainWindow()
+    window.show()
+    timings['window'] = time.perf_counter() - started
+
+    def first_idle():
+        timings['first_idle'] = time.perf_counter() - started
+
+    def check_loaded():
+        pages = window.findChildren(BasePageWidget)
+        if all(page.load_task is None for page in pages):
+            timings['loaded'] = time.perf_counter() - started
+            app.quit()
+        elif time.perf_counter() - started > TIMEOUT:
+            app.quit()
+
+    QTimer.singleShot(0, first_idle)
+    poll = QTimer()
+    poll.timeout.connect(check_loaded)
+    poll.start(5)
+    app.exec()
+    window.close()
+
+    print(json.dumps(timings))
+    return 0 if 'loaded' in timings else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,264 @@
+"""
+Benchmark suite against the local database (DB_* settings / .env, seed it
+first with benchmarks.seed), written as JSON so runs from different commits
+can be compared with benchmarks.compare.
+
+    QT_QPA_PLATFORM=offscreen python -m benchmarks.suite [--repeat 5] [--writes 200] [--output file.json]
+
+Every benchmark drives the real code path and keeps each of its --repeat runs:
+
+- <entity>.load: a page reload through load_data_from_db, streamed into the
+  model, until the page's on_data_loaded ran (ms).
+- client.filter.<text>: filter_table on the name column, and clearing it (ms).
+- client.sort.<column>.first / client.sort.<column>: the first sort of a
+  column after a reload (sort keys built) and the sorts after it (ms).
+- client.insert / client.edit: insert_entity / edit_entity throughput, one
+  save after the other as the form dialog does (saves per second). The rows
+  are deleted again afterwards.
+- startup.imports / .window / .first_idle / .loaded: benchmarks.startup in a
+  fresh process per run (ms since it started timing).
+"""
+# 1. Standard Library
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+
+# 2. Third Party Library
+import PySide6
+from PySide6.QtCore import QEventLoop, Qt, QTimer
+from PySide6.QtWidgets import QApplication, QMessageBox
+
+# 3. Internal Library
+from benchmarks.synthetic import client_row
+from core.utils.db_utils import edit_entity, insert_entity
+from core.utils.table_utils import filter_table
+from database import ClientPage, ConnectionPool, PartnerPage, SupplierPage
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(ROOT, 'benchmarks', 'results')
+PAGES = {
+    'client': ClientPage,
+    'supplier': SupplierPage,
+    'partner': PartnerPage,
+}
+FILTER_TEXTS = ['g', 'tra', 'global trading', '123', 'no such name']
+SORT_COLUMNS = ['client_id', 'client_name', 'created_at']
+SORTS_PER_RUN = 3
+TIMEOUT = 600  # Seconds a single load or write batch may take
+
+
+def result(runs, unit='ms', higher_is_better=False) -> dict:
+    """One benchmark in the JSON output."""
+    return {
+        'unit': unit,
+        'higher_is_better': higher_is_better,
+        'median': statistics.median(runs),
+        'best': max(runs) if higher_is_better else min(runs),
+        'runs': runs,
+    }
+
+
+@contextlib.contextmanager
+def quiet_messages(errors: list):
+    """Replace the modal message boxes of the app, errors are collected instead of waiting for a click."""
+    saved = QMessageBox.information, QMessageBox.warning, QMessageBox.critical
+    QMessageBox.information = staticmethod(lambda *args, **kwargs: None)
+    QMessageBox.warning = QMessageBox.critical = staticmethod(lambda parent, title, text, *args, **kwargs:
+                                                              errors.append(f'{title}: {text}'))
+    try:
+        yield
+    finally:
+        QMessageBox.information, QMessageBox.warning, QMessageBox.critical = saved
+
+
+def wait_until(predicate, errors, timeout=TIMEOUT):
+    """Run the event loop until `predicate()` holds, raise if an error was shown or it took too long."""
+    loop = QEventLoop()
+    poll = QTimer()
+    poll.timeout.connect(lambda: (predicate() or errors) and loop.quit())
+    poll.start(1)
+    QTimer.singleShot(int(timeout * 1000), loop.quit)
+    if not predicate():
+        loop.exec()
+    poll.stop()
+    if errors:
+        raise RuntimeError(errors[0])
+    if not predicate():
+        raise TimeoutError(f'Gave up after {timeout} s')
+
+
+def bench_load(page, errors) -> float:
+    started = time.perf_counter()
+    page.load_data()
+    wait_until(lambda: page.load_task is None, errors)
+    return (time.perf_counter() - started) * 1000
+
+
+def bench_filters(page, runs):
+    page.filter_box.setCurrentIndex(0)  # Name column
+    for text in FILTER_TEXTS + ['']:
+        started = time.perf_counter()
+        filter_table(page, text)
+        runs.setdefault(f'client.filter.{text or "<clear>"}', []).append((time.perf_counter() - started) * 1000)
+
+
+def bench_sorts(page, runs):
+    model = page.table_model
+    for name in SORT_COLUMNS:
+        column = page.COLUMN_ORDER.index(name)
+        for i in range(SORTS_PER_RUN + 1):
+            order = Qt.SortOrder.DescendingOrder if i % 2 else Qt.SortOrder.AscendingOrder
+            started = time.perf_counter()
+            model.sort(column, order)
+            key = f'client.sort.{name}.first' if i == 0 else f'client.sort.{name}'
+            runs.setdefault(key, []).append((time.perf_counter() - started) * 1000)
+
+
+def save_serially(rows, save, saved: list):
+    """Save the rows one after the other, each once the previous save is done (as the form dialog does)."""
+    def on_done(outcome):
+        saved.append(outcome and outcome['row'])
+        if len(saved) < len(rows):
+            save(rows[len(saved)], on_done)
+
+    if rows:
+        save(rows[0], on_done)
+
+
+def bench_writes(pool, table, count, errors, runs):
+    """Insert `count` client rows through insert_entity, edit each through edit_entity, then delete them."""
+    tag = uuid.uuid4().hex[:8]
+    rng = random.Random(count)
+    rows = []
+    for i in range(count):
+        _, _, contact, client_type, status, description, _, _ = client_row(rng, i)
+        rows.append({'client_name': f'Bench {tag} {i}', 'client_contact': contact, 'client_type': client_type,
+                     'status': status, 'description': description})
+
+    def insert(data, on_done):
+        insert_entity(pool, table, data, 'client_id', 'Client', 'client_name', on_done=on_done)
+
+    def edit(data, on_done):
+        edit_entity(pool, table, 'client_id', data, 'Client', 'client_name', on_done=on_done)
+
+    try:
+        saved = []
+        started = time.perf_counter()
+        save_serially(rows, insert, saved)
+        wait_until(lambda: len(saved) == len(rows), errors)
+        runs.setdefault('client.insert', []).append(len(rows) / (time.perf_counter() - started))
+
+        edits = [{'client_id': row['client_id'], **data, 'description': f'{data["description"]} (edited)'}
+                 for row, data in zip(saved, rows) if row]
+        saved = []
+        started = time.perf_counter()
+        save_serially(edits, edit, saved)
+        wait_until(lambda: len(saved) == len(edits), errors)
+        runs.setdefault('client.edit', []).append(len(edits) / (time.perf_counter() - started))
+    finally:
+        with pool.connection() as conn, conn.cursor() as cur:
+            cur.execute(f'DELETE FROM {table} WHERE client_name LIKE %s', (f'Bench {tag} %',))
+            conn.commit()
+
+
+def bench_startup(repeat, runs):
+    env = {**os.environ, 'QT_QPA_PLATFORM': os.getenv('QT_QPA_PLATFORM', 'offscreen')}
+    for _ in range(repeat):
+        process = subprocess.run([sys.executable, '-m', 'benchmarks.startup'], cwd=ROOT, env=env,
+                                 capture_output=True, text=True, timeout=TIMEOUT)
+        if process.returncode:
+            raise RuntimeError(f'Startup benchmark failed:\n{process.stderr or process.stdout}')
+        timings = json.loads(process.stdout.strip().splitlines()[-1])
+        for name, seconds in timings.items():
+            runs.setdefault(f'startup.{name}', []).append(seconds * 1000)
+
+
+def environment(pool, tables) -> dict:
+    def git(*args):
+        try:
+            return subprocess.run(['git', *args], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+        except OSError:
+            return ''
+
+    with pool.connection() as conn, conn.cursor() as cur:
+        cur.execute('SHOW server_version')
+        server_version = cur.fetchone()[0]
+        rows = {}
+        for table in tables:
+            cur.execute(f'SELECT count(*) FROM {table} WHERE deleted_at IS NULL')
+            rows[table] = cur.fetchone()[0]
+        conn.commit()
+    return {
+        'commit': git('rev-parse', '--short', 'HEAD'),
+        'dirty': bool(git('status', '--porcelain', '--untracked-files=no')),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'pyside': PySide6.__version__,
+        'postgres': server_version,
+        'platform': platform.platform(),
+        'qt_platform': QApplication.platformName(),
+        'rows': rows,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the benchmark suite and write the results as JSON.')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per benchmark')
+    parser.add_argument('--writes', type=int, default=200, help='rows inserted and edited per run')
+    parser.add_argument('--prod', action='store_true', help='use the plain tables instead of the _dev ones')
+    parser.add_argument('--skip-startup', action='store_true', help='leave out the MainWindow startup runs')
+    parser.add_argument('--output', help='JSON file (default: benchmarks/results/<commit>.json)')
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    pool = ConnectionPool(min_size=1, max_size=5)
+    runs = {}
+    errors = []
+    with quiet_messages(errors):
+        pages = {name: page_class(dev_mode=not args.prod, conn=pool) for name, page_class in PAGES.items()}
+        for page in pages.values():
+            page.show()
+        wait_until(lambda: all(page.load_task is None for page in pages.values()), errors)  # warm-up load
+        meta = environment(pool, [page.table_name for page in pages.values()])
+
+        for run in range(args.repeat):
+            for name, page in pages.items():
+                runs.setdefault(f'{name}.load', []).append(bench_load(page, errors))
+            bench_filters(pages['client'], runs)
+            bench_sorts(pages['client'], runs)
+            if args.writes:
+                bench_writes(pool, pages['client'].table_name, args.writes, errors, runs)
+            print(f'run {run + 1}/{args.repeat} done')
+        if not args.skip_startup:
+            bench_startup(args.repeat, runs)
+
+    for page in pages.values():
+        page.close()
+    pool.closeall()
+    app.processEvents()
+
+    results = {name: result(values, 'saves/s' if name in ('client.insert', 'client.edit') else 'ms',
+                            higher_is_better=name in ('client.insert', 'client.edit'))
+               for name, values in runs.items()}
+    output = args.output or os.path.join(RESULTS_DIR, f'{meta["commit"] or "unknown"}'
+                                                      f'{"-dirty" if meta["dirty"] else ""}.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as file:
+        json.dump({'meta': meta, 'results': results}, file, indent=2)
+
+    print(f'{"benchmark":<34}{"median":>12}{"best":>12}  unit')
+    for name, item in results.items():
+        print(f'{name:<34}{item["median"]:>12.1f}{item["best"]:>12.1f}  {item["unit"]}')
+    print(f'Rows: {meta["rows"]}\nWritten to {output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+# 1. Standard Library
+import random
+from datetime import date, datetime, timedelta
+
+# 2. Third Party Library
+# 3. Internal Library
+from database.clientdb.client_form_dialog import client_status, client_types
+from database.supplierdb.supplier_form_dialog import supplier_status, supplier_types
+
+_WORDS = ['global', 'trading', 'asia', 'pacific', 'logistics', 'digital', 'payments', 'travel',
+          'resources', 'holdings', 'ventures', 'systems', 'media', 'express', 'partners', 'link']
+_SUFFIXES = ['Sdn Bhd', 'Pte Ltd', 'Ltd', 'Inc', 'Group', 'Co']
+
+
+def _name(rng, i):
+    return f'{rng.choice(_WORDS).title()} {rng.choice(_WORDS).title()} {i} {rng.choice(_SUFFIXES)}'
+
+
+def _contact(rng):
+    return f'+{rng.choice((60, 65, 62, 66))} {rng.randint(10, 99)}-{rng.randint(1000000, 9999999)}'
+
+
+def _description(rng):
+    return ' '.join(rng.choice(_WORDS) for _ in range(rng.randint(3, 12))).capitalize()
+
+
+def _timestamps(rng, start=datetime(2023, 1, 1)):
+    created = start + timedelta(seconds=rng.randint(0, 3 * 365 * 86400))
+    return created, created + timedelta(seconds=rng.randint(0, 90 * 86400))
+
+
+def client_row(rng, i):
+    created, updated = _timestamps(rng)
+    return (i, _name(rng, i), _contact(rng), rng.choice(client_types), rng.choice(client_status),
+            _description(rng), created, updated)
+
+
+def supplier_row(rng, i):
+    created, updated = _timestamps(rng)
+    start = date(2022, 1, 1) + timedelta(days=rng.randint(0, 1500)) if rng.random() < 0.8 else None
+    end = start + timedelta(days=rng.randint(180, 1100)) if start and rng.random() < 0.9 else None
+    return (i, _name(rng, i), _contact(rng), rng.choice(supplier_types), rng.choice(supplier_status),
+            _description(rng), start, end, created, updated)
+
+
+def partner_row(rng, i):
+    created, updated = _timestamps(rng)
+    return i, _name(rng, i), _contact(rng), _description(rng), created, updated
+
+
+ROW_FACTORIES = {
+    'client': client_row,
+    'supplier': supplier_row,
+    'partner': partner_row,
+}
+
+
+def iter_synthetic_rows(entity: str, count: int, seed: int = 42, first_id: int = 1):
+    """Realistic rows in COLUMN_ORDER of the entity page, generated one at a time (same seed, same rows)."""
+    rng = random.Random(seed)
+    factory = ROW_FACTORIES[entity]
+    return (factory(rng, i) for i in range(first_id, first_id + count))
+
+
+def synthetic_rows(entity: str, count: int, seed: int = 42, first_id: int = 1) -> list:
+    """`iter_synthetic_rows` as a list."""
+    return list(iter_synthetic_rows(entity, count, seed, first_id))
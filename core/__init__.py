@@ -1,21 +1,38 @@
 from core.dialogs.currency_dialog import CurrencyWindow
 from core.dialogs.form_dialog import FormDialog
-from core.utils.db_utils import edit_entity, entity_name_exists, insert_entity, load_data_from_db, remove_entity
+from core.utils.db_utils import edit_entity, insert_entity, load_data_from_db, remove_entities, update_entities
+from core.utils.db_worker import QueryTask, checkout, run_in_background
 from core.utils.widget_utils import update_counter, update_refresh_btn
-from core.validators import validate_characters, validate_max_length, validate_required, validate_selection
+from core.validators import (
+    check_characters,
+    check_max_length,
+    check_required,
+    check_selection,
+    validate_characters,
+    validate_max_length,
+    validate_required,
+    validate_selection,
+)
 from core.widgets.base_page_widget import BasePageWidget
 
 # Explicitly define what this package exports
 __all__ = [
     'BasePageWidget',
+    'check_characters',
+    'check_max_length',
+    'check_required',
+    'check_selection',
+    'checkout',
     'edit_entity',
-    'entity_name_exists',
     'CurrencyWindow',
     'FormDialog',
     'insert_entity',
     'load_data_from_db',
-    'remove_entity',
+    'QueryTask',
+    'remove_entities',
+    'run_in_background',
     'update_counter',
+    'update_entities',
     'update_refresh_btn',
     'validate_characters',
     'validate_max_length',
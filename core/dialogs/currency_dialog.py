@@ -1,32 +1,13 @@
 # 1. Standard Library
+from datetime import datetime
 
 # 2. Third Party Library
-import requests
-from PySide6.QtCore import QThread, Signal
-from PySide6.QtWidgets import QLineEdit, QTableWidget, QTableWidgetItem, QVBoxLayout, QWidget
+from PySide6.QtWidgets import QAbstractItemView, QLabel, QLineEdit, QTableView, QVBoxLayout, QWidget
 
 # 3. Internal Library
-
-
-# Thread to fetch rates
-class FetchRatesThread(QThread):
-    finished = Signal(dict)  # Emit rates as a dictionary
-
-    def run(self):
-        try:
-            url = 'https://open.er-api.com/v6/latest/USD'
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-
-            if data.get('result') != 'success':
-                self.finished.emit({})
-                return
-
-            rates = data.get('rates', {})
-            self.finished.emit(rates)
-        except Exception:
-            self.finished.emit({})
+from core.models.rate_table_model import RateTableModel
+from core.utils.currency_convert import PREFERRED_CURRENCIES
+from core.utils.currency_rates import currency_rate_service
 
 
 class CurrencyWindow(QWidget):
@@ -43,52 +24,52 @@ class CurrencyWindow(QWidget):
         self.search_bar.textChanged.connect(self.filter_table)
         layout.addWidget(self.search_bar)
 
-        # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(2)
-        self.table.setHorizontalHeaderLabels(['Currency', 'Rate'])
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        # Table: the rates are set on the model once per refresh, searching only changes which rows are shown
+        self.model = RateTableModel(['Currency', 'Rate'], self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.verticalHeader().setVisible(False)
         layout.addWidget(self.table)
 
-        self.setLayout(layout)
+        # Last update of the rates
+        self.status = QLabel('Loading rates...')
+        layout.addWidget(self.status)
 
-        # Start fetching rates
-        self.thread = FetchRatesThread()
-        self.thread.finished.connect(self.populate_table)
-        self.thread.start()
+        self.setLayout(layout)
 
-        # Store rates for filtering
+        # Latest rates shown
         self.rates = {}
 
+        # Rates come from the shared service: the cached ones right away, new ones whenever it refreshes
+        self.service = currency_rate_service()
+        self.service.failed.connect(self.show_status)
+        self.service.subscribe(self.populate_table)
+
+    def show_status(self, error=None):
+        """Show when the rates were updated, or why they could not be refreshed."""
+        if not self.rates:
+            self.status.setText('Loading rates...' if error is None else f'⚠️ Could not load rates: {error}')
+            return
+        text = 'Updated'
+        if self.service.updated_at:
+            text += f' {datetime.fromtimestamp(self.service.updated_at):%Y-%m-%d %H:%M}'
+        if error is not None:
+            text += ' (refresh failed, retrying)'
+        elif self.service.is_stale():
+            text += ' (outdated)'
+        self.status.setText(text)
+
     def populate_table(self, rates):
         self.rates = rates
-        self.table.setRowCount(0)
-
-        # Define preferred currencies order
-        preferred = ['MYR', 'SGD', 'USD', 'EUR']
+        self.show_status()
 
-        # Create two lists: preferred first, then the rest sorted
-        preferred_rates = [(cur, rates[cur]) for cur in preferred if cur in rates]
+        # Preferred currencies first, then the rest sorted
+        preferred_rates = [(cur, rates[cur]) for cur in PREFERRED_CURRENCIES if cur in rates]
         other_rates = sorted((cur, rate) for cur, rate
-                             in rates.items() if cur not in preferred)
-
-        final_list = preferred_rates + other_rates
-
-        # Populate table
-        for row, (currency, rate) in enumerate(final_list):
-            self.table.insertRow(row)
-            self.table.setItem(row, 0, QTableWidgetItem(currency))
-            self.table.setItem(row, 1, QTableWidgetItem(f'{rate:.4f}'))
+                             in rates.items() if cur not in PREFERRED_CURRENCIES)
+        self.model.set_rates(preferred_rates + other_rates)
 
     def filter_table(self, text):
-        text = text.upper()
-        self.table.setRowCount(0)
-        for row, (currency, rate) in enumerate(sorted(self.rates.items())):
-            if text in currency:
-                self.table.insertRow(self.table.rowCount())
-                self.table.setItem(
-                    self.table.rowCount()-1, 0, QTableWidgetItem(currency))
-                self.table.setItem(
-                    self.table.rowCount()-1, 1, QTableWidgetItem(f'{rate:.4f}'))
+        self.model.set_filter_text(text)
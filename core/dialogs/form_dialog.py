@@ -1,10 +1,12 @@
 # 1. Standard Library
 
 # 2. Third Party Library
+from PySide6.QtCore import Qt
 from PySide6.QtGui import QColor, QPalette
-from PySide6.QtWidgets import QApplication, QDialog, QHBoxLayout, QMessageBox, QPushButton, QSizePolicy, QVBoxLayout
+from PySide6.QtWidgets import QDialog, QHBoxLayout, QMessageBox, QPushButton, QSizePolicy, QVBoxLayout
 
 # 3. Internal Library
+from core.utils.db_utils import edit_entity, insert_entity
 
 
 class FormDialog(QDialog):
@@ -15,6 +17,7 @@ class FormDialog(QDialog):
         self.main_layout = QVBoxLayout(self)
         self.btn_add = QPushButton('Accept')
         self.btn_cancel = QPushButton('Cancel')
+        self.pending_task = None  # Background save, cancelled when the dialog closes (unless it already committed)
         self.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Expanding)
         self.setMinimumSize(500, 500)
         self.setMaximumSize(500, 16777215)
@@ -33,31 +36,86 @@ class FormDialog(QDialog):
         self.btn_add.clicked.connect(self.accept)  # close with Accepted
         self.btn_cancel.clicked.connect(self.reject)
 
-    def handle_duplicate_name(self, input_widget, entity_label, name, name_exists):
+    def reject(self):
+        if self.pending_task:
+            self.pending_task.cancel()
+            self.pending_task = None
+        super().reject()
+
+    @staticmethod
+    def record_errors(record: dict) -> list:
+        """(column, message) for every invalid field of a record, overridden per entity."""
+        return []
+
+    def check_record(self, record: dict, field_widgets: dict) -> bool:
+        """Warn about the first invalid field of `record` and focus its input, True when it is valid."""
+        errors = self.record_errors(record)
+        if not errors:
+            return True
+        column, message = errors[0]
+        QMessageBox.warning(self, 'Validation Error', message)
+        field_widgets[column].setFocus()
+        return False
+
+    def set_busy(self, busy: bool):
+        """Block the accept button while a save is running in the background."""
+        self.btn_add.setEnabled(not busy)
+        if busy:
+            self.setCursor(Qt.CursorShape.BusyCursor)
+        else:
+            self.unsetCursor()
+
+    def save_entity(self, entity_label, name_column, id_column, entity_data, saved_signal):
         """
-        Reusable duplicate-name handler.
+        Insert or update the row in the background, in one statement that also enforces the unique name.
 
-        Returns True if the name is valid (no duplicate),
-        False if duplicate found or error occurred.
+        A name already used by another active row comes back as a duplicate result
+        (see `save_result`): nothing is written and the name input is highlighted.
+        A row deleted while the dialog was open comes back as missing and the dialog closes.
+
+        Args:
+            entity_label: Human readable name ('Supplier' / 'Client').
+            name_column: Column that has to stay unique (e.g. 'client_name').
+            id_column: Primary key column, the row is updated when `entity_data` has it.
+            entity_data: dict of column_name: value.
+            saved_signal: Signal emitted with the stored row before the dialog closes.
         """
-        if name_exists:
-            QMessageBox.warning(
-                self, 'Duplicate Name',
-                f'A {entity_label.lower()} with the name "{name}" already exists.'
-            )
-            # highlight in red
-            palette = input_widget.palette()
-            palette.setColor(QPalette.ColorRole.Base, QColor('#ffcccc'))
-            palette.setColor(QPalette.ColorRole.Text, QColor('black'))
-            input_widget.setPalette(palette)
-
-            input_widget.setFocus()
-            return False
-
-        elif name_exists is None:  # DB error or query failed
-            self.accept()
-            return False
-
-        # Reset palette back to normal
-        input_widget.setPalette(QApplication.palette())
-        return True
+        def on_saved(result):
+            self.pending_task = None
+            if result is None:  # DB error, already reported
+                self.set_busy(False)
+                return
+            if result['duplicate']:
+                _, name = result['duplicate']
+                self.set_busy(False)
+                self.handle_duplicate_name(self.input_name, entity_label, name)
+                return
+            if result['missing']:  # deleted in the meantime, already reported
+                self.reject()
+                return
+            saved_signal.emit(result['row'])  # also after Cancel, when the save committed before it
+            if self.isVisible():
+                self.accept()
+
+        self.set_busy(True)
+        if entity_data.get(id_column):
+            self.pending_task = edit_entity(self.conn, self.table_name, id_column, entity_data, entity_label,
+                                            name_column, on_done=on_saved)
+        else:
+            self.pending_task = insert_entity(self.conn, self.table_name, entity_data, id_column, entity_label,
+                                              name_column, on_done=on_saved)
+        if self.pending_task is None:
+            self.set_busy(False)
+
+    def handle_duplicate_name(self, input_widget, entity_label, name):
+        """Reusable duplicate-name handler, warns and highlights the name input in red."""
+        QMessageBox.warning(
+            self, 'Duplicate Name',
+            f'A {entity_label.lower()} with the name "{name}" already exists.'
+        )
+        palette = input_widget.palette()
+        palette.setColor(QPalette.ColorRole.Base, QColor('#ffcccc'))
+        palette.setColor(QPalette.ColorRole.Text, QColor('black'))
+        input_widget.setPalette(palette)
+
+        input_widget.setFocus()
@@ -0,0 +1,461 @@
+# 1. Standard Library
+from array import array
+from datetime import date, datetime, time
+
+# 2. Third Party Library
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, QTimer
+
+# 3. Internal Library
+from core.models.row_store import ColumnStore, parse_date
+from core.utils.db_utils import format_value
+from core.utils.profiler import profiler
+from core.utils.search_index import DateRangeIndex, SearchIndex
+
+
+def sort_key(value):
+    """Sort numbers numerically, dates chronologically, text case-insensitively and empty values last."""
+    if value is None or value == '':
+        return 3, ''
+    if isinstance(value, (int, float)):
+        return 0, value
+    if isinstance(value, date):
+        return 1, value.isoformat()
+    return 2, str(value).casefold()
+
+
+# Typed sort keys, one plain int/float/str per cell so sorting compares in C; empty values sort last
+_NUMBER_LAST = float('inf')
+_TEXT_LAST = '\U0010ffff'
+
+
+def _number_key(value):
+    return _NUMBER_LAST if value is None else value
+
+
+def _date_key(value):
+    if value is None:
+        return _NUMBER_LAST
+    if isinstance(value, str):  # a date as text, as the form dialogs emit it
+        value = parse_date(value)
+    return value.toordinal()
+
+
+def _datetime_key(value):
+    if value is None:
+        return _NUMBER_LAST
+    if isinstance(value, str):
+        return datetime.combine(parse_date(value), time()).timestamp()
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, time())
+    return value.timestamp()
+
+
+def _text_key(value):
+    return str(value).casefold() if value is not None and value != '' else _TEXT_LAST
+
+
+SORT_KEYS = {'number': _number_key, 'date': _date_key, 'datetime': _datetime_key, 'text': _text_key}
+
+
+class EntityTableModel(QAbstractTableModel):
+    """
+    Read-only table model over a ColumnStore of raw DB values.
+
+    The store keeps rows in arrival order; `_order` maps each display row to its
+    storage index, so sorting only permutes one int array. Cells are formatted
+    only when the view paints them, so no per-cell item objects are allocated.
+
+    Sort keys are typed per column from the query's column kinds (`set_sort_kinds`),
+    computed once per column on its first sort and kept up to date as rows change,
+    so each sort is a single keyed sort of `_order`.
+
+    A filter narrows the display to `_visible`, the accepted subset of `_order`,
+    in one model reset instead of hiding view rows one by one; rows added while
+    it is active are checked as they arrive.
+    """
+    def __init__(self, headers, parent=None, columns=None, categorical=()):
+        super().__init__(parent)
+        self.headers = list(headers)
+        self.columns = list(columns or headers)
+        self.categorical = set(categorical)
+        self.store = ColumnStore(self.columns, self.categorical)
+        self.search_index = SearchIndex(self.store)
+        self.date_index = DateRangeIndex(self.store)
+        self._index_timer = QTimer(self)  # Builds the search index posting lists while the GUI is idle
+        self._index_timer.timeout.connect(self._index_more)
+        self._order = array('i')  # Display order of every loaded row (storage indices)
+        self._visible = None  # Rows passing the filter, in display order (None = no filter, show `_order`)
+        self._filter = None  # predicate(storage index) of the active filter
+        self._id_index = {}  # Row ID -> storage index
+        self._positions = None  # Storage index -> display row (-1 = not shown), rebuilt lazily
+        self._order_positions = None  # Storage index -> position in `_order`, rebuilt lazily
+        self._sort_kinds = ()  # Sort kind of each column ('number', 'date', 'datetime', 'text'), from the query
+        self._sort_keys = {}  # Column -> sort key by storage index, built on the first sort of the column
+
+    def _rows(self):
+        return self._order if self._visible is None else self._visible
+
+    # --- Qt model interface ---
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows())
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return format_value(self.store.value(self._rows()[index.row()], index.column()))
+        if role == Qt.ItemDataRole.UserRole:
+            return self.store.value(self._rows()[index.row()], index.column())
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.headers[section] if section < len(self.headers) else None
+        return str(section + 1)
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        if column < 0 or column >= len(self.headers):
+            return
+        with profiler.span('table.sort'):
+            layout = self._begin_layout_change()
+            keys = self._sort_keys.get(column)
+            if keys is None:
+                key = self._sort_key_function(column)
+                keys = self._sort_keys[column] = [key(value) for value in self.store.column_values(column)]
+            self._order = array('i', sorted(self._order, key=keys.__getitem__,
+                                            reverse=order == Qt.SortOrder.DescendingOrder))
+            if self._visible is not None:
+                shown = set(self._visible)
+                self._visible = array('i', (index for index in self._order if index in shown))
+            self._order_changed()
+            self._end_layout_change(layout)
+
+    # --- Filtering ---
+
+    def set_filter(self, predicate=None, matches=None):
+        """
+        Show only the rows `predicate(storage_index)` accepts, None shows every row.
+
+        Args:
+            predicate: Filter for the loaded rows and the ones added later.
+            matches: Optional set of the storage indices already known to match
+                (e.g. from the search index), saves calling `predicate` per row.
+        """
+        self.beginResetModel()
+        self._filter = predicate
+        if predicate is None:
+            self._visible = None
+        elif matches is not None and len(matches) * 8 < len(self._order):
+            # Few matches: order them by their display position instead of scanning every row
+            position = self._order_position()
+            self._visible = array('i', sorted(matches, key=position.__getitem__))
+        elif matches is not None:
+            self._visible = array('i', (index for index in self._order if index in matches))
+        else:
+            self._visible = array('i', filter(predicate, self._order))
+        self._positions = None
+        self.endResetModel()
+
+    def is_filtered(self) -> bool:
+        return self._filter is not None
+
+    def prepare_search(self, column: int):
+        """Index a column for searching, the posting lists are built in slices while the GUI is idle."""
+        self.search_index.track(column)
+        self._schedule_indexing()
+
+    def _schedule_indexing(self):
+        if not self._index_timer.isActive() and self.search_index.pending():
+            self._index_timer.start(0)
+
+    def _index_more(self):
+        if not self.search_index.index_more():
+            self._index_timer.stop()
+
+    # --- Row access ---
+
+    def set_sort_kinds(self, kinds):
+        """Sort kinds of the columns (see `column_kinds`), columns without one sort by `sort_key`."""
+        kinds = tuple(kinds or ())
+        self.store.kinds = kinds  # also types the columns that only held NULLs so far
+        if kinds != self._sort_kinds:
+            self._sort_kinds = kinds
+            self._sort_keys = {}
+
+    def sort_kinds(self) -> tuple:
+        return self._sort_kinds
+
+    def set_headers(self, headers):
+        if list(headers) != self.headers:
+            self.beginResetModel()
+            self.headers = list(headers)
+            if len(self.columns) != len(self.headers):
+                self.columns = list(headers)
+                self._reset_store()
+            self.endResetModel()
+
+    def reset_rows(self, rows=()):
+        """Replace every row (an active filter stays and applies to the new rows)."""
+        self.beginResetModel()
+        self._reset_store()
+        for index in self._store_rows(rows):
+            self._order.append(index)
+            if self._filter and self._filter(index):
+                self._visible.append(index)
+        self.endResetModel()
+        self._schedule_indexing()
+
+    def restore_rows(self, store):
+        """Replace every row with those of a saved ColumnStore (see core.utils.snapshot_cache), in storage order."""
+        self.beginResetModel()
+        self._reset_store(store)
+        self._order = array('i', range(len(store)))
+        if self._filter:
+            self._visible = array('i', (index for index in self._order if self._filter(index)))
+        ids = store.column_values(0)
+        self._id_index = {ids[index]: index for index in self._order}
+        self.endResetModel()
+        self._schedule_indexing()
+
+    def append_rows(self, rows):
+        """Append rows at the bottom (used for streamed batches)."""
+        if not rows:
+            return
+        indices = self._store_rows(rows)
+        self._schedule_indexing()
+        shown = indices if self._filter is None else [index for index in indices if self._filter(index)]
+        if not shown:
+            self._order.extend(indices)
+            self._order_changed()
+            return
+
+        first = len(self._rows())
+        self.beginInsertRows(QModelIndex(), first, first + len(shown) - 1)
+        self._order.extend(indices)
+        if self._visible is not None:
+            self._visible.extend(shown)
+        self._order_changed()
+        self.endInsertRows()
+
+    def loaded_row_count(self) -> int:
+        """Rows loaded, including those hidden by the filter."""
+        return len(self._order)
+
+    def load_order(self) -> array:
+        """Storage indices of the loaded rows, highest ID first (the order of a fresh load)."""
+        ids = self.store.column_values(0)
+        return array('i', sorted(self._order, key=ids.__getitem__, reverse=True))
+
+    def row_values(self, row: int) -> tuple:
+        return self.store.row(self._rows()[row])
+
+    def display_text(self, row: int, column: int) -> str:
+        return format_value(self.store.value(self._rows()[row], column))
+
+    def insert_row(self, row: int, values):
+        self.insert_rows(row, [values])
+
+    def insert_rows(self, row: int, rows):
+        """Insert several rows at one display position with a single model notification."""
+        if not rows:
+            return
+        rows_shown = self._rows()
+        if row == 0:
+            order_position = 0
+        else:
+            order_position = self._order.index(rows_shown[row]) if row < len(rows_shown) else len(self._order)
+        indices = self._store_rows(rows)
+        shown = indices if self._filter is None else [index for index in indices if self._filter(index)]
+
+        if shown:
+            self.beginInsertRows(QModelIndex(), row, row + len(shown) - 1)
+        self._order[order_position:order_position] = array('i', indices)
+        if self._visible is not None:
+            self._visible[row:row] = array('i', shown)
+        self._order_changed()
+        if shown:
+            self.endInsertRows()
+
+    def update_row(self, row: int, values):
+        self._update_stored(self._rows()[row], values)
+
+    def remove_row(self, row: int):
+        index = self._rows()[row]
+        self.beginRemoveRows(QModelIndex(), row, row)
+        if self._visible is not None:
+            self._visible.pop(row)
+            self._order.remove(index)
+        else:
+            self._order.pop(row)
+        self._drop(index)
+        self.endRemoveRows()
+
+    def update_by_id(self, row_id, values) -> bool:
+        """Rewrite the row with this ID wherever it is displayed, False when it is not loaded."""
+        index = self._id_index.get(row_id)
+        if index is None:
+            return False
+        self._update_stored(index, values)
+        return True
+
+    def remove_by_id(self, row_id) -> bool:
+        """Remove the row with this ID (also when it is filtered out), False when it is not loaded."""
+        return self.remove_ids([row_id]) > 0
+
+    def remove_ids(self, row_ids) -> int:
+        """
+        Remove the rows with these IDs in one layout change (the display order is
+        filtered once instead of a removal per row), returns how many were loaded.
+        """
+        removed = {self._id_index[row_id] for row_id in row_ids if row_id in self._id_index}
+        if removed:
+            self._relayout(removed=removed)
+        return len(removed)
+
+    def find_row(self, row_id) -> int:
+        """Display row of the row with this ID, -1 when it is not loaded or filtered out."""
+        index = self._id_index.get(row_id)
+        return -1 if index is None else self._display_row(index)
+
+    def apply_changes(self, changed_rows, removed_ids=()):
+        """
+        Patch the loaded rows in place: known IDs are updated, unknown ones are
+        inserted at the top (newest first) and `removed_ids` are dropped.
+        """
+        new_rows = []
+        updated = []
+        for values in changed_rows:
+            index = self._id_index.get(values[0])
+            if index is not None:
+                self._update_stored(index, values, notify=False)
+                updated.append(index)
+            else:
+                new_rows.append(values)
+        updated_rows = [row for row in map(self._display_row, updated) if row >= 0]
+        if updated_rows:  # one notification spanning every updated row
+            self.dataChanged.emit(self.index(min(updated_rows), 0),
+                                  self.index(max(updated_rows), len(self.headers) - 1))
+
+        # Rows that now pass or fail the filter and the removed ones, in one layout change
+        refiltered = self._filter_flips(updated)
+        removed = {self._id_index[row_id] for row_id in removed_ids if row_id in self._id_index}
+        if refiltered or removed:
+            self._relayout(refiltered, removed)
+
+        new_rows.sort(key=lambda values: sort_key(values[0]), reverse=True)
+        self.insert_rows(0, new_rows)
+
+    def _reset_store(self, store=None):
+        self.store = ColumnStore(self.columns, self.categorical, self._sort_kinds) if store is None else store
+        self.search_index.reset(self.store)
+        self.date_index.reset(self.store)
+        self._sort_keys = {}
+        self._order = array('i')
+        self._visible = array('i') if self._filter else None
+        self._id_index = {}
+        self._order_changed()
+
+    def _store_rows(self, rows) -> list:
+        """Append rows to the store and the indexes, returns their storage indices."""
+        indices = []
+        for values in rows:
+            index = self.store.append_row(values)
+            self._id_index[values[0]] = index
+            self.search_index.add(index)
+            for column, keys in self._sort_keys.items():
+                keys.append(self._sort_key_function(column)(self.store.value(index, column)))
+            indices.append(index)
+        self.date_index.build(indices)  # sorted once per batch
+        return indices
+
+    def _update_stored(self, index, values, notify=True):
+        self.store.set_row(index, values)
+        self.search_index.update(index)
+        self.date_index.update(index)
+        for column, keys in self._sort_keys.items():
+            keys[index] = self._sort_key_function(column)(self.store.value(index, column))
+        if not notify:
+            return
+        if self._filter_flips([index]):  # now passes or fails the filter, shown or hidden
+            self._relayout([index])
+            return
+        row = self._display_row(index)
+        if row >= 0:
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.headers) - 1))
+
+    def _filter_flips(self, indices) -> list:
+        """The storage indices among `indices` whose filter result no longer matches whether they are shown."""
+        if self._filter is None:
+            return []
+        return [index for index in indices if bool(self._filter(index)) != (self._display_row(index) >= 0)]
+
+    def _relayout(self, refiltered=(), removed=()):
+        """
+        Show or hide the `refiltered` rows by the active filter and drop the `removed` ones,
+        in one layout change (the display order is filtered once instead of a notification per row).
+        """
+        layout = self._begin_layout_change()
+        if removed:
+            self._order = array('i', (index for index in self._order if index not in removed))
+        if self._visible is not None:
+            shown = set(self._visible)
+            for index in refiltered:
+                if self._filter(index):
+                    shown.add(index)
+                else:
+                    shown.discard(index)
+            self._visible = array('i', (index for index in self._order if index in shown))
+        for index in removed:
+            self._drop(index)
+        self._end_layout_change(layout)
+
+    def _drop(self, index):
+        """Forget a removed row, its storage index is not reused."""
+        self._id_index.pop(self.store.value(index, 0), None)
+        self.search_index.remove(index)
+        self.date_index.remove(index)
+        self.store.clear_row(index)
+        self._order_changed()
+
+    def _begin_layout_change(self):
+        """Start a reorder, remembers which row each persistent index (selection, current row) points at."""
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        rows = self._rows()
+        return persistent, [rows[index.row()] for index in persistent]
+
+    def _end_layout_change(self, layout):
+        """Move the persistent indexes to the new display rows of their rows (removed rows become invalid)."""
+        persistent, indices = layout
+        self._order_changed()
+        self.changePersistentIndexList(
+            persistent, [self.index(self._display_row(index), old.column()) for old, index in zip(persistent, indices)])
+        self.layoutChanged.emit()
+
+    def _sort_key_function(self, column):
+        kind = self._sort_kinds[column] if column < len(self._sort_kinds) else None
+        return SORT_KEYS.get(kind, sort_key)
+
+    def _order_changed(self):
+        self._positions = None
+        self._order_positions = None
+
+    def _order_position(self):
+        if self._order_positions is None:
+            self._order_positions = array('i', [-1]) * len(self.store)
+            for position, storage_index in enumerate(self._order):
+                self._order_positions[storage_index] = position
+        return self._order_positions
+
+    def _display_row(self, index) -> int:
+        if self._positions is None:
+            self._positions = array('i', [-1]) * len(self.store)
+            for row, storage_index in enumerate(self._rows()):
+                self._positions[storage_index] = row
+        return self._positions[index] if index < len(self._positions) else -1
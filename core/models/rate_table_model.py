@@ -0,0 +1,106 @@
+# 1. Standard Library
+from array import array
+
+# 2. Third Party Library
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+# 3. Internal Library
+from core.utils.db_utils import format_value
+
+
+class RateTableModel(QAbstractTableModel):
+    """
+    Read-only two-column model of (key, rate) rows: currency rates, or the dated series of one currency.
+
+    The rows are set in one reset and then stay as they are: the keys in a
+    list, the rates in an array('d') and the upper-cased display text of every
+    key precomputed in `search_keys`. Cells are formatted only when the view
+    paints them.
+
+    Filtering works like a proxy model over these rows: `_visible` maps each
+    display row to a source row, so a new filter text only rebuilds that int
+    array (among the previous matches when the text just got longer) in one
+    model reset. A QSortFilterProxyModel would call a Python filterAcceptsRow
+    once per row on every keystroke instead.
+
+    Args:
+        headers: Column titles, e.g. ['Currency', 'Rate'] or ['Date', 'Rate'].
+        decimals: Decimals the rates are shown with.
+    """
+    def __init__(self, headers, parent=None, decimals=4):
+        super().__init__(parent)
+        self.headers = list(headers)
+        self.decimals = decimals
+        self.keys = []  # Currency code or date of every row
+        self.search_keys = []  # Upper-cased display text of every key, what the filter matches against
+        self.rates = array('d')
+        self._text = ''  # Upper-cased filter text, '' shows every row
+        self._visible = None  # Source rows containing the filter text, in row order (None = no filter)
+
+    def set_rates(self, rows):
+        """Replace every row with the (key, rate) pairs of `rows`, shown in that order (the filter stays)."""
+        self.beginResetModel()
+        self.keys = []
+        self.rates = array('d')
+        for key, rate in rows:
+            self.keys.append(key)
+            self.rates.append(rate)
+        self.search_keys = [format_value(key).upper() for key in self.keys]
+        self._visible = self._match(self._text) if self._text else None
+        self.endResetModel()
+
+    def source_row(self, row: int) -> int:
+        """Index in `keys` / `rates` of a display row."""
+        return row if self._visible is None else self._visible[row]
+
+    # --- Filtering ---
+
+    def set_filter_text(self, text: str):
+        """Show only the rows whose key contains `text`, case-insensitively, '' shows every row."""
+        text = text.strip().upper()
+        if text == self._text:
+            return
+        narrowing = self._visible is not None and self._text in text
+        self.beginResetModel()
+        self._visible = self._match(text, self._visible if narrowing else None) if text else None
+        self._text = text
+        self.endResetModel()
+
+    def filter_text(self) -> str:
+        return self._text
+
+    def is_filtered(self) -> bool:
+        return self._visible is not None
+
+    def _match(self, text, candidates=None) -> array:
+        keys = self.search_keys
+        if candidates is None:
+            return array('i', [row for row, key in enumerate(keys) if text in key])
+        return array('i', [row for row in candidates if text in keys[row]])
+
+    # --- Qt model interface ---
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.keys) if self._visible is None else len(self._visible)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self.source_row(index.row())
+        if role == Qt.ItemDataRole.DisplayRole:
+            return format_value(self.keys[row]) if index.column() == 0 else f'{self.rates[row]:.{self.decimals}f}'
+        if role == Qt.ItemDataRole.UserRole:
+            return self.keys[row] if index.column() == 0 else self.rates[row]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.headers[section] if section < len(self.headers) else None
+        return str(section + 1)
@@ -0,0 +1,473 @@
+# 1. Standard Library
+from array import array
+from datetime import date, datetime, timedelta, timezone
+
+# 2. Third Party Library
+
+# 3. Internal Library
+
+INT_NULL = -(2 ** 63)  # Stands for NULL in integer and timestamp columns
+_EPOCH = datetime(1970, 1, 1)
+
+
+def parse_date(value: str) -> date:
+    """Parse 'yyyy-mm-dd' (form dialogs) or 'dd-mm-yyyy' (table display) back into a date."""
+    value = value.strip()[:10]
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return datetime.strptime(value, '%d-%m-%Y').date()
+
+
+def _is_date_text(value: str) -> bool:
+    try:
+        parse_date(value)
+        return True
+    except ValueError:
+        return False
+
+
+class _PendingColumn:
+    """Column that only received NULLs so far, its type is decided by the first real value."""
+    def __init__(self):
+        self.size = 0
+
+    def append(self, value):
+        self.size += 1
+
+    def get(self, index):
+        return None
+
+    def set(self, index, value):
+        pass
+
+    def nbytes(self):
+        return 0
+
+    def take(self, indices):
+        column = _PendingColumn()
+        column.size = len(indices)
+        return column
+
+    def export(self):
+        return {'type': 'pending'}, []
+
+    @classmethod
+    def restore(cls, spec, blobs, size):
+        column = cls()
+        column.size = size
+        return column
+
+
+class _IntColumn:
+    def __init__(self, size=0):
+        self.data = array('q', [INT_NULL]) * size
+
+    def append(self, value):
+        self.data.append(INT_NULL if value is None else int(value))
+
+    def get(self, index):
+        value = self.data[index]
+        return None if value == INT_NULL else value
+
+    def set(self, index, value):
+        self.data[index] = INT_NULL if value is None else int(value)
+
+    def nbytes(self):
+        return self.data.itemsize * len(self.data)
+
+    def take(self, indices):
+        column = _IntColumn()
+        column.data = array('q', map(self.data.__getitem__, indices))
+        return column
+
+    def export(self):
+        return {'type': 'int'}, [self.data.tobytes()]
+
+    @classmethod
+    def restore(cls, spec, blobs, size):
+        column = cls()
+        column.data.frombytes(blobs[0])
+        return column
+
+
+class _DateColumn:
+    """Dates as proleptic ordinals (0 = NULL, real ordinals start at 1)."""
+    def __init__(self, size=0):
+        self.data = array('i', [0]) * size
+
+    @staticmethod
+    def _encode(value):
+        if value is None:
+            return 0
+        if isinstance(value, str):
+            value = parse_date(value)
+        if isinstance(value, datetime):
+            value = value.date()
+        return value.toordinal()
+
+    def append(self, value):
+        self.data.append(self._encode(value))
+
+    def get(self, index):
+        ordinal = self.data[index]
+        return date.fromordinal(ordinal) if ordinal else None
+
+    def set(self, index, value):
+        self.data[index] = self._encode(value)
+
+    def nbytes(self):
+        return self.data.itemsize * len(self.data)
+
+    def take(self, indices):
+        column = _DateColumn()
+        column.data = array('i', map(self.data.__getitem__, indices))
+        return column
+
+    def export(self):
+        return {'type': 'date'}, [self.data.tobytes()]
+
+    @classmethod
+    def restore(cls, spec, blobs, size):
+        column = cls()
+        column.data.frombytes(blobs[0])
+        return column
+
+
+class _DateTimeColumn:
+    """Timestamps as microseconds since 1970 in the time zone of the first value seen."""
+    def __init__(self, size=0, tzinfo=None):
+        self.data = array('q', [INT_NULL]) * size
+        self.tzinfo = tzinfo
+
+    def _encode(self, value):
+        if value is None:
+            return INT_NULL
+        if isinstance(value, str):
+            value = datetime.combine(parse_date(value), datetime.min.time())
+        elif not isinstance(value, datetime):
+            value = datetime.combine(value, datetime.min.time())
+        if value.tzinfo is not None:
+            value = value.astimezone(self.tzinfo).replace(tzinfo=None) if self.tzinfo else value.replace(tzinfo=None)
+        return (value - _EPOCH) // timedelta(microseconds=1)
+
+    def append(self, value):
+        self.data.append(self._encode(value))
+
+    def get(self, index):
+        micros = self.data[index]
+        if micros == INT_NULL:
+            return None
+        value = _EPOCH + timedelta(microseconds=micros)
+        return value.replace(tzinfo=self.tzinfo) if self.tzinfo else value
+
+    def set(self, index, value):
+        self.data[index] = self._encode(value)
+
+    def nbytes(self):
+        return self.data.itemsize * len(self.data)
+
+    def take(self, indices):
+        column = _DateTimeColumn(tzinfo=self.tzinfo)
+        column.data = array('q', map(self.data.__getitem__, indices))
+        return column
+
+    def export(self):
+        offset = self.tzinfo.utcoffset(None) if self.tzinfo else None
+        if self.tzinfo and offset is None:  # a zone with DST rules, not a fixed offset
+            return None
+        seconds = None if offset is None else offset.total_seconds()  # UTC is a zero offset, not a naive column
+        return {'type': 'datetime', 'utcoffset': seconds}, [self.data.tobytes()]
+
+    @classmethod
+    def restore(cls, spec, blobs, size):
+        offset = spec.get('utcoffset')
+        column = cls(tzinfo=None if offset is None else timezone(timedelta(seconds=offset)))
+        column.data.frombytes(blobs[0])
+        return column
+
+
+class _CategoryColumn:
+    """Dictionary-encoded text for low-cardinality columns (code 0 = NULL)."""
+    def __init__(self, size=0):
+        self.codes = array('B', [0]) * size
+        self.values = [None]
+        self.lookup = {}
+
+    def _encode(self, value):
+        if value is None:
+            return 0
+        code = self.lookup.get(value)
+        if code is None:
+            code = self.lookup[value] = len(self.values)
+            self.values.append(value)
+            if code > 255 and self.codes.typecode == 'B':
+                self.codes = array('I', self.codes)
+        return code
+
+    def append(self, value):
+        self.codes.append(self._encode(value))
+
+    def get(self, index):
+        return self.values[self.codes[index]]
+
+    def set(self, index, value):
+        self.codes[index] = self._encode(value)
+
+    def nbytes(self):
+        return self.codes.itemsize * len(self.codes) + sum(len(v.encode()) for v in self.values[1:])
+
+    def take(self, indices):
+        column = _CategoryColumn()
+        column.codes = array(self.codes.typecode, map(self.codes.__getitem__, indices))
+        column.values = list(self.values)
+        column.lookup = dict(self.lookup)
+        return column
+
+    def export(self):
+        return {'type': 'category', 'typecode': self.codes.typecode, 'values': self.values[1:]}, [self.codes.tobytes()]
+
+    @classmethod
+    def restore(cls, spec, blobs, size):
+        column = cls()
+        column.codes = array(spec['typecode'])
+        column.codes.frombytes(blobs[0])
+        column.values += spec['values']
+        column.lookup = {value: code for code, value in enumerate(column.values) if code}
+        return column
+
+
+class _TextColumn:
+    """Free text as one UTF-8 buffer plus offsets (length -1 = NULL), no str object per cell."""
+    def __init__(self, size=0):
+        self.buffer = bytearray()
+        self.starts = array('q', [0]) * size
+        self.lengths = array('i', [-1]) * size
+
+    def append(self, value):
+        self.starts.append(len(self.buffer))
+        self.lengths.append(self._write(value))
+
+    def _write(self, value):
+        if value is None:
+            return -1
+        encoded = str(value).encode()
+        self.buffer += encoded
+        return len(encoded)
+
+    def get(self, index):
+        length = self.lengths[index]
+        if length < 0:
+            return None
+        start = self.starts[index]
+        return self.buffer[start:start + length].decode()
+
+    def set(self, index, value):
+        # Replaced text stays in the buffer until the store is rebuilt on the next reload
+        self.starts[index] = len(self.buffer)
+        self.lengths[index] = self._write(value)
+
+    def nbytes(self):
+        return len(self.buffer) + self.starts.itemsize * len(self.starts) + self.lengths.itemsize * len(self.lengths)
+
+    def take(self, indices):
+        """Copy of the rows at `indices`, the buffer rebuilt from their current text only."""
+        column = _TextColumn()
+        buffer, starts, lengths = self.buffer, self.starts, self.lengths
+        for index in indices:
+            length = lengths[index]
+            column.starts.append(len(column.buffer))
+            column.lengths.append(length)
+            if length > 0:
+                start = starts[index]
+                column.buffer += buffer[start:start + length]
+        return column
+
+    def export(self):
+        return {'type': 'text'}, [bytes(self.buffer), self.starts.tobytes(), self.lengths.tobytes()]
+
+    @classmethod
+    def restore(cls, spec, blobs, size):
+        column = cls()
+        column.buffer = bytearray(blobs[0])
+        column.starts.frombytes(blobs[1])
+        column.lengths.frombytes(blobs[2])
+        return column
+
+
+class _ObjectColumn:
+    """Fallback for values without a compact encoding (bool, Decimal, mixed types...)."""
+    def __init__(self, values=None):
+        self.data = list(values or [])
+
+    def append(self, value):
+        self.data.append(value)
+
+    def get(self, index):
+        return self.data[index]
+
+    def set(self, index, value):
+        self.data[index] = value
+
+    def nbytes(self):
+        return 8 * len(self.data)
+
+    def take(self, indices):
+        return _ObjectColumn(map(self.data.__getitem__, indices))
+
+    def export(self):
+        return None  # No compact encoding to save
+
+
+_COLUMN_TYPES = {
+    'pending': _PendingColumn,
+    'int': _IntColumn,
+    'date': _DateColumn,
+    'datetime': _DateTimeColumn,
+    'category': _CategoryColumn,
+    'text': _TextColumn,
+}
+
+
+class ColumnStore:
+    """
+    Compact columnar storage for the rows of an entity page.
+
+    Every column is typed by its kind from the query (`column_kinds`) when the
+    first non-NULL value arrives, or from that value when the kind is unknown:
+    integers in array('q'), dates as ordinals in array('i'), timestamps as
+    microseconds in array('q'), the `categorical` columns dictionary-encoded and
+    other text in a single UTF-8 buffer. A date column stays a date column even
+    if its first value is 'yyyy-mm-dd' text from a form dialog. Rows are
+    addressed by their storage index, which never changes until the store is
+    rebuilt.
+
+    Args:
+        columns: Column names in row order (COLUMN_ORDER).
+        categorical: Low-cardinality text columns to dictionary-encode.
+        kinds: Kind of each column ('number', 'date', 'datetime', 'text'), see `column_kinds`.
+    """
+    def __init__(self, columns, categorical=(), kinds=()):
+        self.columns = list(columns)
+        self.categorical = set(categorical)
+        self.kinds = tuple(kinds or ())
+        self._columns = [_PendingColumn() for _ in self.columns]
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def append_row(self, values) -> int:
+        """Store a row, returns its storage index."""
+        for col_idx, value in enumerate(values):
+            self._column_for(col_idx, value).append(value)
+        self._size += 1
+        return self._size - 1
+
+    def append_rows(self, rows):
+        for row in rows:
+            self.append_row(row)
+
+    def row(self, index: int) -> tuple:
+        return tuple(column.get(index) for column in self._columns)
+
+    def value(self, index: int, col_idx: int):
+        return self._columns[col_idx].get(index)
+
+    def column_values(self, col_idx: int) -> list:
+        """Every value of a column in storage order."""
+        column = self._columns[col_idx]
+        if isinstance(column, _IntColumn):  # IDs, read straight from the array
+            return [None if value == INT_NULL else value for value in column.data]
+        return [column.get(index) for index in range(self._size)]
+
+    def set_row(self, index: int, values):
+        for col_idx, value in enumerate(values):
+            self._column_for(col_idx, value).set(index, value)
+
+    def clear_row(self, index: int):
+        """Drop the values of a removed row, its storage index is not reused."""
+        for column in self._columns:
+            column.set(index, None)
+
+    def nbytes(self) -> int:
+        """Approximate payload size of all columns in bytes."""
+        return sum(column.nbytes() for column in self._columns)
+
+    def take(self, indices) -> 'ColumnStore':
+        """
+        New store holding only the rows at `indices`, renumbered 0..len(indices) - 1 in that order.
+
+        Rows dropped by `clear_row` and text replaced by `set_row` are left behind, so the
+        copy is as small as its rows (e.g. to save a snapshot without a session's garbage).
+        """
+        store = ColumnStore(self.columns, self.categorical, self.kinds)
+        store._columns = [column.take(indices) for column in self._columns]
+        store._size = len(indices)
+        return store
+
+    def export(self):
+        """
+        Raw column buffers, e.g. for a snapshot file: (specs, blobs) with one JSON-able spec per column
+        and its buffers as bytes in column order, or None when a column has no compact encoding.
+        """
+        specs, blobs = [], []
+        for column in self._columns:
+            exported = column.export()
+            if exported is None:
+                return None
+            specs.append({**exported[0], 'blobs': len(exported[1])})
+            blobs.extend(exported[1])
+        return specs, blobs
+
+    @classmethod
+    def from_export(cls, columns, categorical, size, specs, blobs, kinds=()) -> 'ColumnStore':
+        """Rebuild a store from `export` output, the buffers are copied without decoding any value."""
+        store = cls(columns, categorical, kinds)
+        if len(specs) != len(store.columns):
+            raise ValueError('column count does not match')
+        blobs = iter(blobs)
+        for col_idx, spec in enumerate(specs):
+            column_blobs = [next(blobs) for _ in range(spec['blobs'])]
+            store._columns[col_idx] = _COLUMN_TYPES[spec['type']].restore(spec, column_blobs, size)
+        store._size = size
+        return store
+
+    def _column_for(self, col_idx, value):
+        column = self._columns[col_idx]
+        if value is None:
+            return column
+        if isinstance(column, _PendingColumn):
+            column = self._columns[col_idx] = self._new_column(col_idx, value, column.size)
+        elif not self._accepts(column, value):
+            column = self._columns[col_idx] = _ObjectColumn(column.get(i) for i in range(self._size))
+        return column
+
+    def _new_column(self, col_idx, value, size):
+        kind = self.kinds[col_idx] if col_idx < len(self.kinds) else None
+        if kind in ('date', 'datetime') and isinstance(value, str) and _is_date_text(value):
+            return _DateColumn(size) if kind == 'date' else _DateTimeColumn(size)
+        if isinstance(value, bool):
+            return _ObjectColumn([None] * size)
+        if isinstance(value, int):
+            return _IntColumn(size)
+        if isinstance(value, datetime):
+            return _DateTimeColumn(size, value.tzinfo)
+        if isinstance(value, date):
+            return _DateColumn(size)
+        if isinstance(value, str):
+            return _CategoryColumn(size) if self.columns[col_idx] in self.categorical else _TextColumn(size)
+        return _ObjectColumn([None] * size)
+
+    @staticmethod
+    def _accepts(column, value) -> bool:
+        """Whether `value` can be stored without losing information (or parsed from text for dates)."""
+        if isinstance(column, (_ObjectColumn, _TextColumn, _CategoryColumn)):
+            return isinstance(column, _ObjectColumn) or isinstance(value, str)
+        if isinstance(column, _IntColumn):
+            return isinstance(value, int) and not isinstance(value, bool)
+        if isinstance(value, str):
+            return _is_date_text(value)
+        if isinstance(column, _DateTimeColumn):
+            return isinstance(value, date)
+        return isinstance(value, date) and not isinstance(value, datetime)
@@ -0,0 +1,136 @@
+# 1. Standard Library
+import csv
+import io
+
+# 2. Third Party Library
+
+# 3. Internal Library
+
+
+def read_csv_records(path, columns, headers=()):
+    """
+    Yield (line, record) pairs from a CSV file, records are keyed by column name.
+
+    The header row may use the column names ('client_name') or the table headers
+    ('Client Name'), case-insensitively. Cells are stripped and empty ones become None.
+
+    Raises:
+        ValueError: If a heading matches no importable column.
+    """
+    by_heading = {column.lower(): column for column in columns}
+    by_heading.update((header.lower(), column) for header, column in zip(headers, columns))
+
+    with open(path, newline='', encoding='utf-8-sig') as file:
+        reader = csv.reader(file)
+        headings = next(reader, [])
+        unknown = [heading for heading in headings if heading.strip().lower() not in by_heading]
+        if unknown:
+            raise ValueError(f'Unknown column(s) in the CSV header: {", ".join(unknown)}')
+        keys = [by_heading[heading.strip().lower()] for heading in headings]
+
+        for cells in reader:
+            if not any(cell.strip() for cell in cells):
+                continue  # skip blank lines
+            yield reader.line_num, {key: cell.strip() or None for key, cell in zip(keys, cells)}
+
+
+def import_csv(db, path, table, columns, headers, name_column, record_errors):
+    """
+    Validate a CSV of new rows and insert the valid ones in a single transaction.
+
+    Every row is checked with the same rules as the form dialog (`record_errors`)
+    and names repeated within the file are rejected. The remaining rows are
+    copied into a staging table with COPY, rows whose name is already taken by
+    an active row are found with one set-based query, and the rest is merged
+    into `table` with one INSERT ... SELECT.
+
+    Args:
+        db: Checked-out psycopg2 connection.
+        path: CSV file to import.
+        table: Target table name.
+        columns: Importable columns (no ID or timestamps).
+        headers: Table headers matching `columns`, accepted as CSV headings.
+        name_column: Column that has to stay unique among active rows.
+        record_errors: Validator returning (column, message) pairs for a record.
+
+    Returns:
+        dict with the number of data rows ('total'), rows inserted ('inserted'),
+        rows skipped because their name is taken ('duplicates') and the rejected
+        rows as sorted (line, message) pairs ('errors').
+    """
+    errors = []
+    valid = []
+    first_line = {}  # Name -> first line using it
+    total = 0
+
+    for line, record in read_csv_records(path, columns, headers):
+        total += 1
+        messages = [message for _, message in record_errors(record)]
+        name = record.get(name_column)
+        if not messages and name in first_line:
+            messages.append(f'Duplicate name "{name}", already used on line {first_line[name]}.')
+        if messages:
+            errors.extend((line, message) for message in messages)
+        else:
+            first_line[name] = line
+            valid.append((line, record))
+
+    inserted, taken = 0, []
+    if valid:
+        inserted, taken = merge_records(db, table, columns, name_column, valid)
+        errors.extend((line, f'A row with the name "{name}" already exists.') for line, name in taken)
+
+    return {'total': total, 'inserted': inserted, 'duplicates': len(taken), 'errors': sorted(errors)}
+
+
+def merge_records(db, table, columns, name_column, records):
+    """
+    COPY (line, record) pairs into a staging table and insert those whose name is free.
+
+    A name taken between the check and the INSERT (by a concurrent save) is
+    skipped by ON CONFLICT DO NOTHING: the staged rows missing from the rows
+    the INSERT returned are reported as duplicates too.
+
+    Returns:
+        (inserted row count, [(line, name)] of the rows skipped as duplicates).
+    """
+    column_list = ', '.join(columns)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)  # None is written unquoted, which COPY reads as NULL
+    for line, record in records:
+        writer.writerow([line, *(record.get(column) for column in columns)])
+    buffer.seek(0)
+
+    name_taken = f'''
+        EXISTS (
+            SELECT 1 FROM {table} t
+            WHERE t.{name_column} = s.{name_column}
+              AND t.deleted_at IS NULL
+        )
+    '''
+    with db.cursor() as cur:
+        cur.execute(f'''
+            CREATE TEMP TABLE import_stage ON COMMIT DROP AS
+            SELECT 0 AS import_line, {column_list} FROM {table} WITH NO DATA
+        ''')
+        cur.copy_expert(f'COPY import_stage (import_line, {column_list}) FROM STDIN WITH (FORMAT csv)', buffer)
+
+        cur.execute(f'SELECT import_line, {name_column} FROM import_stage s WHERE {name_taken}')
+        taken = cur.fetchall()
+
+        cur.execute(f'''
+            INSERT INTO {table} ({column_list})
+            SELECT {column_list} FROM import_stage s
+            WHERE NOT {name_taken}
+            ORDER BY import_line
+            ON CONFLICT ({name_column}) WHERE deleted_at IS NULL DO NOTHING
+            RETURNING {name_column}
+        ''')
+        inserted = {name for name, in cur.fetchall()}
+    db.commit()
+
+    # Names are unique within the file, so a staged row is identified by its name
+    taken_lines = {line for line, _ in taken}
+    skipped = [(line, record[name_column]) for line, record in records
+               if line not in taken_lines and record[name_column] not in inserted]
+    return len(inserted), sorted(taken + skipped)
@@ -0,0 +1,172 @@
+# 1. Standard Library
+from array import array
+from decimal import ROUND_HALF_EVEN, ROUND_HALF_UP, Decimal
+from math import gcd
+
+# 2. Third Party Library
+
+# 3. Internal Library
+
+PREFERRED_CURRENCIES = ('MYR', 'SGD', 'USD', 'EUR')  # Shown first, the currencies invoices are usually in
+DEFAULT_MINOR_UNITS = 2
+MINOR_UNITS = {  # ISO 4217 decimals of the currencies without 2
+    'BHD': 3, 'IQD': 3, 'JOD': 3, 'KWD': 3, 'LYD': 3, 'OMR': 3, 'TND': 3,
+    'BIF': 0, 'CLP': 0, 'DJF': 0, 'GNF': 0, 'ISK': 0, 'JPY': 0, 'KMF': 0, 'KRW': 0, 'PYG': 0,
+    'RWF': 0, 'UGX': 0, 'VND': 0, 'VUV': 0, 'XAF': 0, 'XOF': 0, 'XPF': 0,
+}
+ROUNDINGS = (ROUND_HALF_UP, ROUND_HALF_EVEN)
+
+
+def minor_units(currency: str) -> int:
+    """Decimals of `currency` (2 for most, 0 for JPY, 3 for KWD...)."""
+    return MINOR_UNITS.get(currency, DEFAULT_MINOR_UNITS)
+
+
+def to_minor(amount, currency: str, rounding=ROUND_HALF_UP) -> int:
+    """Amount (Decimal, str or int; a float goes through its shortest repr) as an integer of minor units."""
+    amount = amount if isinstance(amount, Decimal) else Decimal(str(amount))
+    return int(amount.scaleb(minor_units(currency)).quantize(Decimal(1), rounding=rounding))
+
+
+def from_minor(amount: int, currency: str) -> Decimal:
+    """Integer of minor units back to a Decimal with the decimals of `currency`."""
+    return Decimal(amount).scaleb(-minor_units(currency))
+
+
+def _ratio(rate) -> tuple:
+    """Exact numerator/denominator of a published rate, 1.3542 is 13542/10000 and not the float's binary value."""
+    numerator, denominator = Decimal(str(rate)).as_integer_ratio()
+    if numerator <= 0:
+        raise ValueError(f'rate must be positive: {rate!r}')
+    return numerator, denominator
+
+
+class CrossRateMatrix:
+    """
+    Conversion factors between every pair of currencies, built once from rates against one base.
+
+    Amounts are integers of minor units (cents, yen, fils) and every factor is
+    the exact fraction rate[to] / rate[from] scaled by the decimals of both
+    currencies, so a conversion is one integer multiplication and division
+    with the rounding of `decimal` (ROUND_HALF_UP or ROUND_HALF_EVEN) and no
+    float error. Columns of amounts are converted as array('q') batches: the
+    factor is looked up once per column, or once per currency of a ledger.
+
+    Args:
+        rates: Currency -> units per 1 base currency, as given by the rate provider (USD based).
+        currencies: Currencies of the matrix, in index order (default: PREFERRED_CURRENCIES, then the rest sorted).
+    """
+    def __init__(self, rates: dict, currencies=None):
+        if currencies is None:
+            currencies = [code for code in PREFERRED_CURRENCIES if code in rates]
+            currencies += sorted(code for code in rates if code not in PREFERRED_CURRENCIES)
+        self.currencies = list(currencies)
+        self.index = {code: i for i, code in enumerate(self.currencies)}  # Currency -> row/column of the matrix
+        ratios = [_ratio(rates[code]) for code in self.currencies]
+        scales = [minor_units(code) for code in self.currencies]
+
+        # _factors[from][to] = (numerator, denominator) of the minor units of `to` per minor unit of `from`
+        self._factors = []
+        for from_ratio, from_scale in zip(ratios, scales):
+            row = []
+            for to_ratio, to_scale in zip(ratios, scales):
+                numerator = to_ratio[0] * from_ratio[1] * 10 ** max(to_scale - from_scale, 0)
+                denominator = to_ratio[1] * from_ratio[0] * 10 ** max(from_scale - to_scale, 0)
+                common = gcd(numerator, denominator)
+                row.append((numerator // common, denominator // common))
+            self._factors.append(row)
+
+    def __contains__(self, currency):
+        return currency in self.index
+
+    def factor(self, from_currency: str, to_currency: str) -> tuple:
+        """(numerator, denominator) turning minor units of `from_currency` into minor units of `to_currency`."""
+        return self._factors[self.index[from_currency]][self.index[to_currency]]
+
+    def rate(self, from_currency: str, to_currency: str, places: int = 6) -> Decimal:
+        """Cross rate (units of `to_currency` per unit of `from_currency`) for display, rounded to `places`."""
+        numerator, denominator = self.factor(from_currency, to_currency)
+        scale = minor_units(from_currency) - minor_units(to_currency)
+        return (Decimal(numerator) / Decimal(denominator)).scaleb(scale).quantize(Decimal(1).scaleb(-places))
+
+    def convert(self, amount: int, from_currency: str, to_currency: str, rounding=ROUND_HALF_UP) -> int:
+        """One amount of minor units, use `convert_column` / `convert_ledger` for many."""
+        return self.convert_column((amount,), from_currency, to_currency, rounding)[0]
+
+    def convert_column(self, amounts, from_currency: str, to_currency: str, rounding=ROUND_HALF_UP) -> array:
+        """
+        Convert a column of amounts in one currency.
+
+        Args:
+            amounts: Integers of minor units of `from_currency` (array('q'), list...).
+            from_currency: Currency of the amounts.
+            to_currency: Currency to convert to.
+            rounding: ROUND_HALF_UP (halves away from zero) or ROUND_HALF_EVEN.
+
+        Returns:
+            array('q') of minor units of `to_currency`, in the order of `amounts`.
+        """
+        numerator, denominator = self.factor(from_currency, to_currency)
+        return array('q', _scale(amounts, numerator, denominator, rounding))
+
+    def convert_ledger(self, amounts, currencies, to_currency: str, rounding=ROUND_HALF_UP) -> array:
+        """
+        Convert line items in mixed currencies into one currency, e.g. an invoice ledger into MYR.
+
+        Args:
+            amounts: Integers of minor units, each in the currency at the same position of `currencies`.
+            currencies: Currency code of every amount, or its index in `currencies` of this matrix
+                (array('H') of codes, as from a dictionary-encoded column).
+            to_currency: Currency to convert to.
+            rounding: ROUND_HALF_UP (halves away from zero) or ROUND_HALF_EVEN.
+
+        Returns:
+            array('q') of minor units of `to_currency`, in the order of `amounts`.
+        """
+        if len(amounts) != len(currencies):
+            raise ValueError('amounts and currencies differ in length')
+        # One factor lookup per distinct currency, then a single pass over the line items
+        target = self.index[to_currency]
+        factors = {}
+        for currency in set(currencies):
+            source = currency if isinstance(currency, int) else self.index[currency]
+            factors[currency] = self._factors[source][target]
+        return array('q', _scale_each(amounts, map(factors.__getitem__, currencies), rounding))
+
+
+def _scale(amounts, numerator, denominator, rounding) -> list:
+    """round(amount * numerator / denominator) of every amount in exact integer arithmetic."""
+    if denominator == 1:
+        return [amount * numerator for amount in amounts]
+    if rounding == ROUND_HALF_UP:  # half away from zero: floor((2|a|n + d) / 2d) with the sign put back
+        twice, double = 2 * numerator, 2 * denominator
+        return [(amount * twice + denominator) // double if amount >= 0
+                else -((denominator - amount * twice) // double) for amount in amounts]
+    if rounding == ROUND_HALF_EVEN:
+        result = []
+        for amount in amounts:
+            quotient, remainder = divmod(amount * numerator, denominator)  # floor division, 0 <= remainder < d
+            remainder *= 2
+            if remainder > denominator or (remainder == denominator and quotient & 1):
+                quotient += 1
+            result.append(quotient)
+        return result
+    raise ValueError(f'unsupported rounding: {rounding}')
+
+
+def _scale_each(amounts, factors, rounding) -> list:
+    """`_scale` with its own (numerator, denominator) for every amount."""
+    if rounding == ROUND_HALF_UP:
+        return [(amount * 2 * numerator + denominator) // (2 * denominator) if amount >= 0
+                else -((denominator - amount * 2 * numerator) // (2 * denominator))
+                for amount, (numerator, denominator) in zip(amounts, factors)]
+    if rounding == ROUND_HALF_EVEN:
+        result = []
+        for amount, (numerator, denominator) in zip(amounts, factors):
+            quotient, remainder = divmod(amount * numerator, denominator)
+            remainder *= 2
+            if remainder > denominator or (remainder == denominator and quotient & 1):
+                quotient += 1
+            result.append(quotient)
+        return result
+    raise ValueError(f'unsupported rounding: {rounding}')
@@ -0,0 +1,208 @@
+# 1. Standard Library
+import json
+import os
+import time
+
+# 2. Third Party Library
+import requests
+from PySide6.QtCore import QCoreApplication, QObject, QThread, QTimer, Signal
+
+# 3. Internal Library
+from core.utils.currency_convert import CrossRateMatrix
+
+DEFAULT_RATES_URL = 'https://open.er-api.com/v6/latest/USD'
+
+_service = None
+
+
+def default_cache_path() -> str:
+    cache_home = os.getenv('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'crmmaster', 'currency_rates.json')
+
+
+class FetchRatesThread(QThread):
+    """Download the rates once with the service's session, emits the provider's JSON or an error message."""
+    fetched = Signal(dict)
+    failed = Signal(str)
+
+    def __init__(self, session, url, timeout, parent=None):
+        super().__init__(parent)
+        self.session = session
+        self.url = url
+        self.timeout = timeout
+
+    def run(self):
+        try:
+            response = self.session.get(self.url, timeout=self.timeout)
+            response.raise_for_status()
+            data = response.json()
+            if data.get('result') != 'success' or not isinstance(data.get('rates'), dict):
+                raise ValueError(f'unexpected answer: {data.get("error-type") or data.get("result")}')
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.fetched.emit(data)
+
+
+class CurrencyRateService(QObject):
+    """
+    Application-wide exchange rates: one HTTP session, one refresh timer, any number of subscribers.
+
+    The last rates are cached on disk and stay valid until the provider's
+    `time_next_update_unix` (TTL seconds when it gives none), so subscribing
+    hands over the cached rates at once and only expired rates cost a request.
+    The refresh timer fetches them again when they expire; a failed refresh
+    keeps the last rates and retries after RETRY_DELAYS.
+
+    Args:
+        parent: Owner, the QApplication for the shared instance (see `currency_rate_service`).
+        url: Rates endpoint in the open.er-api.com format (default: CURRENCY_RATES_URL, else USD based open.er-api).
+        cache_path: Cache file (default: CURRENCY_CACHE_PATH, else crmmaster/currency_rates.json in the user cache).
+        ttl: Seconds the rates stay valid when the provider gives no next update time.
+        timeout: Seconds an HTTP request may take.
+    """
+    rates_changed = Signal(dict)  # Currency -> rate against `base`
+    failed = Signal(str)  # Error message of a failed refresh
+    fetched = Signal(dict)  # Provider's JSON of every successful download, e.g. to keep a rate history
+
+    TTL = 3600
+    RETRY_DELAYS = (30, 60, 300, 900)  # Seconds, the last one repeats
+    MIN_REFRESH = 60  # Seconds between two scheduled refreshes at least, whatever the provider says
+    MAX_TIMER = 86400  # Seconds, QTimer intervals are limited, a longer wait is re-armed when it fires
+
+    def __init__(self, parent=None, url: str = None, cache_path: str = None, ttl: int = None, timeout: float = 10):
+        super().__init__(parent)
+        self.url = url or os.getenv('CURRENCY_RATES_URL') or DEFAULT_RATES_URL
+        self.cache_path = cache_path or os.getenv('CURRENCY_CACHE_PATH') or default_cache_path()
+        self.ttl = self.TTL if ttl is None else ttl
+        self.timeout = timeout
+        self.session = requests.Session()  # Keeps the connection to the provider alive between refreshes
+        self.rates = {}
+        self.base = None  # Currency the rates are quoted against
+        self.updated_at = None  # Unix time the provider last updated the rates
+        self.expires_at = 0.0  # Unix time the rates are due for a refresh
+        self.fetch_thread = None  # Running download, None when idle
+        self._matrix = None  # CrossRateMatrix of the current rates, built on first use
+        self._failures = 0
+        self._started = False
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._on_timer)
+
+    def start(self):
+        """Load the disk cache and schedule the next refresh (right away when there are no valid rates)."""
+        if self._started:
+            return
+        self._started = True
+        self.load_cache()
+        self._schedule(self.expires_at - time.time())
+
+    def stop(self):
+        """Stop refreshing and wait for a running download (the app is quitting)."""
+        self._timer.stop()
+        if self.fetch_thread is not None:
+            self.fetch_thread.wait(int(self.timeout * 1000) + 1000)
+        self.session.close()
+
+    def subscribe(self, slot):
+        """Connect `slot` to `rates_changed` and hand it the current rates right away, if there are any."""
+        self.rates_changed.connect(slot)
+        self.start()
+        if self.rates:
+            slot(dict(self.rates))
+
+    def cross_rates(self) -> CrossRateMatrix:
+        """Conversion matrix of the current rates, built once per refresh (None until there are rates)."""
+        if self._matrix is None and self.rates:
+            self._matrix = CrossRateMatrix(self.rates)
+        return self._matrix
+
+    def is_stale(self) -> bool:
+        return time.time() >= self.expires_at
+
+    def refresh(self):
+        """Download the rates now, unless a download is already running."""
+        if self.fetch_thread is not None:
+            return
+        self._timer.stop()
+        thread = self.fetch_thread = FetchRatesThread(self.session, self.url, self.timeout, self)
+        thread.fetched.connect(self._on_fetched)
+        thread.failed.connect(self._on_failed)
+        thread.finished.connect(thread.deleteLater)
+        thread.start()
+
+    def load_cache(self) -> bool:
+        """Take the rates from the cache file (even expired ones, shown until fresh ones arrive)."""
+        try:
+            with open(self.cache_path, encoding='utf-8') as file:
+                cached = json.load(file)
+            if cached.get('url') != self.url or not isinstance(cached.get('rates'), dict):
+                return False
+            self.rates = cached['rates']
+            self._matrix = None
+            self.base = cached.get('base')
+            self.updated_at = cached.get('updated_at')
+            self.expires_at = float(cached.get('expires_at') or 0)
+        except (OSError, ValueError, TypeError, AttributeError):
+            return False
+        return True
+
+    def save_cache(self):
+        cached = {
+            'url': self.url,
+            'base': self.base,
+            'updated_at': self.updated_at,
+            'expires_at': self.expires_at,
+            'rates': self.rates,
+        }
+        partial = f'{self.cache_path}.part'
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or '.', exist_ok=True)
+            with open(partial, 'w', encoding='utf-8') as file:
+                json.dump(cached, file)
+            os.replace(partial, self.cache_path)
+        except OSError as e:
+            print('Currency rates not cached:', e)
+
+    def _on_timer(self):
+        if self.is_stale():
+            self.refresh()
+        else:  # woke up early, the wait was longer than MAX_TIMER
+            self._schedule(self.expires_at - time.time())
+
+    def _on_fetched(self, data):
+        self.fetch_thread = None
+        self._failures = 0
+        now = time.time()
+        next_update = data.get('time_next_update_unix')
+        self.rates = data['rates']
+        self._matrix = None
+        self.base = data.get('base_code')
+        self.updated_at = data.get('time_last_update_unix')
+        self.expires_at = next_update if isinstance(next_update, (int, float)) and next_update > now else now + self.ttl
+        self.save_cache()
+        self._schedule(max(self.expires_at - now, self.MIN_REFRESH))
+        self.fetched.emit(data)
+        self.rates_changed.emit(dict(self.rates))
+
+    def _on_failed(self, error):
+        self.fetch_thread = None
+        delay = self.RETRY_DELAYS[min(self._failures, len(self.RETRY_DELAYS) - 1)]
+        self._failures += 1
+        print(f'Currency rates refresh failed (retrying in {delay} s):', error)
+        self._schedule(delay)
+        self.failed.emit(error)
+
+    def _schedule(self, seconds):
+        self._timer.start(int(min(max(seconds, 0), self.MAX_TIMER) * 1000))
+
+
+def currency_rate_service() -> CurrencyRateService:
+    """The application-wide CurrencyRateService, created on first use and stopped when the app quits."""
+    global _service
+    if _service is None:
+        app = QCoreApplication.instance()
+        _service = CurrencyRateService(app)
+        app.aboutToQuit.connect(_service.stop)
+    return _service
@@ -1,66 +1,73 @@
 # 1. Standard Library
-from datetime import date, datetime
+import os
+import uuid
+from datetime import date, datetime, timedelta
 
 # 2. Third Party Library
-from PySide6.QtWidgets import QMessageBox, QTableWidgetItem
+from psycopg2 import errors, extensions
+from PySide6.QtWidgets import QMessageBox
 
 # 3. Internal Library
+from core.utils.db_worker import run_in_background
+from core.utils.profiler import profiler
 
 
-class NumericTableWidgetItem(QTableWidgetItem):
-    """Table item that compares as integer if possible."""
-    def __init__(self, value):
-        super().__init__(str(value))
-        self._num = None
-        try:
-            self._num = int(value)
-        except (ValueError, TypeError):
-            pass
-
-    def __lt__(self, other):
-        if isinstance(other, NumericTableWidgetItem):
-            if self._num is not None and other._num is not None:
-                return self._num < other._num
-        return super().__lt__(other)
-
-
-def load_data_from_db(widget, conn, query, headers, refresh_btn=None):
+def load_data_from_db(widget, conn, query, headers, refresh_btn=None, on_loaded=None, batch_size=None, params=None):
     """
-    Generic DB loader for QTableWidget.
+    Generic DB loader for a QTableView backed by an EntityTableModel, the query runs in the background.
 
     Args:
-        widget: QTableWidget to populate.
-        conn: psycopg2 or other DB connection.
+        widget: QTableView to populate (its model receives the rows).
+        conn: psycopg2 connection or ConnectionPool.
         query: SQL query string to run.
         headers: list of header labels for the table.
         refresh_btn: optional QPushButton to update with status.
+        on_loaded: optional callback receiving the fetched rows and whether the query succeeded
+            (([], False) if it failed, the table may then hold only part of the rows).
+            When streaming, the rows are not kept and it receives the row count instead.
+        batch_size: optional batch size, streams the result through a server-side cursor
+            and appends rows to the table batch by batch as they arrive.
+        params: optional query parameters.
+
+    Returns:
+        The running QueryTask, or None if there is no connection.
     """
     if not conn:
         QMessageBox.critical(widget, 'DB Error', '❌ Could not connect to database')
-        return []
-
-    try:
-        with conn.cursor() as cur:
-            cur.execute(query)
-            data = cur.fetchall()
-
-        # Disable sorting to safely reload rows
-        widget.setSortingEnabled(False)
-
-        # Set headers
-        widget.setColumnCount(len(headers))
-        widget.setHorizontalHeaderLabels(headers)
+        return None
 
-        # Fill rows
-        widget.setRowCount(len(data))
-        for row_idx, row_data in enumerate(reversed(data)):
-            for col_idx, value in enumerate(row_data):
-                display_value = format_value(value)
+    model = widget.model()
+    received = {'batches': 0, 'kinds': None}
+    task = None
 
-                if col_idx == 0:  # ID column
-                    widget.setItem(row_idx, col_idx, NumericTableWidgetItem(display_value))
-                else:
-                    widget.setItem(row_idx, col_idx, QTableWidgetItem(str(display_value)))
+    def on_progress(item):
+        if received['kinds'] is None:  # the column kinds come before the first batch
+            received['kinds'] = item
+        else:
+            append_rows(item)
+
+    def append_rows(rows):
+        if task.is_cancelled():  # superseded by a newer load, drop the batches still queued
+            return
+        if received['batches'] == 0:
+            # Disable sorting while rows arrive, the view re-sorts once it is enabled again
+            widget.setSortingEnabled(False)
+            model.set_headers(headers)
+            model.set_sort_kinds(received['kinds'])
+            model.reset_rows()
+        received['batches'] += 1
+        with profiler.span('table.append_rows'):
+            model.append_rows(rows)
+
+    def on_finished(result):
+        if task.is_cancelled():
+            return
+        if batch_size:
+            if received['batches'] == 0:  # empty result
+                append_rows([])
+        else:
+            received['kinds'], result = result
+            append_rows(result)
 
         # Re-enable sorting
         widget.setSortingEnabled(True)
@@ -69,14 +76,31 @@ def load_data_from_db(widget, conn, query, headers, refresh_btn=None):
             from core import update_refresh_btn
             update_refresh_btn(refresh_btn, True)
 
-        return data
-    except Exception as e:
+        if on_loaded:
+            on_loaded(result, True)
+
+    def on_cancelled():
+        widget.setSortingEnabled(True)
+
+    def on_failed(error):
+        widget.setSortingEnabled(True)
+
         if refresh_btn:
             from core import update_refresh_btn
             update_refresh_btn(refresh_btn, False)
 
-        QMessageBox.critical(widget, 'DB Error', f'⚠️ Failed to fetch data:\n{e}')
-        return []
+        QMessageBox.critical(widget, 'DB Error', f'⚠️ Failed to fetch data:\n{error}')
+        if on_loaded:
+            on_loaded(0 if batch_size else [], False)
+
+    if batch_size:
+        task = run_in_background(conn, stream_rows, query, params, batch_size=batch_size, describe=True,
+                                 on_progress=on_progress, on_finished=on_finished, on_failed=on_failed,
+                                 on_cancelled=on_cancelled)
+    else:
+        task = run_in_background(conn, fetch_rows, query, params, describe=True, on_finished=on_finished,
+                                 on_failed=on_failed, on_cancelled=on_cancelled)
+    return task
 
 
 def format_value(value):
@@ -91,128 +115,371 @@ def format_value(value):
     return str(value)
 
 
-def insert_entity(conn, table, entity_data, id_column, display_name):
+def search_condition(column, text):
+    """
+    SQL condition for rows whose `column` contains `text`, case-insensitively, the
+    server-side equivalent of `filter_table`.
+
+    Returns:
+        (sql, params) to combine into a WHERE clause.
     """
-    Generic insert function.
+    pattern = '%' + text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+    return f'{column} ILIKE %s', (pattern,)
+
+
+def date_range_condition(column, start, end):
+    """
+    SQL condition for rows whose date/timestamp `column` falls between the days
+    `start` and `end`, both included, the server-side equivalent of `filter_table_by_dates`.
+
+    A half-open range on the raw column (no to_char) so an index on it can be used.
+
+    Returns:
+        (sql, params) to combine into a WHERE clause.
+    """
+    return f'{column} >= %s AND {column} < %s', (start, end + timedelta(days=1))
+
+
+def insert_entity(conn, table, entity_data, id_column, display_name, name_column, on_done=None):
+    """
+    Generic insert function, the INSERT runs in the background.
     - table: name of the table ('supplier' or 'client')
     - data: dict of column_name: value (excluding ID)
     - id_column: primary key column (e.g. 'supplier_id')
     - display_name: human readable name ('Supplier' / 'Client')
+    - name_column: column unique among active rows (e.g. 'supplier_name')
+    - on_done: optional callback receiving the save result (see `save_result`, None on failure)
     """
     if not conn:
         QMessageBox.critical(None, 'DB Error', '❌ Could not connect to database')
         return None
 
-    try:
-        with conn.cursor() as cur:
-            columns = ', '.join(entity_data.keys())
-            placeholders = ', '.join(['%s'] * len(entity_data))
-            sql = (
-                f'INSERT INTO {table} ({columns}) '
-                f'VALUES ({placeholders}) '
-                f'RETURNING {id_column}, created_at, updated_at;'
-            )
-            cur.execute(sql, tuple(entity_data.values()))
-            new_id, created_at, updated_at = cur.fetchone()
-
-        entity_data = {
-            id_column: new_id,
-            **entity_data,
-            'created_at': format_value(created_at),
-            'updated_at': format_value(updated_at),
-        }
-
-        conn.commit()
-        QMessageBox.information(None, 'Success', f'✅ {display_name} added')
-        return entity_data
-    except Exception as e:
-        conn.rollback()
-        QMessageBox.critical(None, 'DB Error', f'⚠️ Failed to add {display_name.lower()}:\n{e}')
-
-
-def remove_entity(conn, table, id_column, entity_id, name_value, display_name):
-    if not conn:
-        QMessageBox.critical(None, 'DB Error', '❌ Could not connect to database')
-        return None
+    def on_finished(result):
+        if result['row'] is not None:
+            QMessageBox.information(None, 'Success', f'✅ {display_name} added')
+        if on_done:
+            on_done(result)
 
-    try:
-        with conn.cursor() as cur:
-            cur.execute(
-                f'''
-                UPDATE {table}
-                SET deleted_at = CURRENT_TIMESTAMP
-                WHERE {id_column} = %s
-                ''',
-                (entity_id,),
-            )
-        conn.commit()
-        QMessageBox.information(None, 'Deleted', f'❌ {display_name} "{name_value}" removed')
-    except Exception as e:
-        conn.rollback()
-        QMessageBox.critical(None, 'DB Error', f'⚠️ Failed to delete {display_name.lower()}:\n{e}')
-
-
-def edit_entity(conn, table, id_column, entity_data, display_name):
+    def on_failed(error):
+        QMessageBox.critical(None, 'DB Error', f'⚠️ Failed to add {display_name.lower()}:\n{error}')
+        if on_done:
+            on_done(None)
+
+    return run_in_background(conn, insert_row, table, entity_data, id_column, name_column,
+                             on_finished=on_finished, on_failed=on_failed, writes=True)
+
+
+def remove_entities(conn, table, id_column, entity_ids, label, on_done=None):
+    """
+    Soft-delete rows in the background, one UPDATE for all of them.
+    - entity_ids: IDs of the rows to delete
+    - label: what is deleted, for the messages ('Client "Acme"' / '12 clients')
+    - on_done: optional callback receiving the IDs actually deleted
+    Rows already deleted (by another user) are not counted, the message says how many were removed.
+    """
     if not conn:
         QMessageBox.critical(None, 'DB Error', '❌ Could not connect to database')
         return None
+    entity_ids = list(entity_ids)
+
+    def on_finished(deleted_ids):
+        skipped = len(entity_ids) - len(deleted_ids)
+        if not deleted_ids:
+            QMessageBox.warning(None, 'Not Deleted', f'⚠️ Nothing removed: {label} already deleted')
+        elif skipped:
+            QMessageBox.information(None, 'Deleted',
+                                    f'❌ {len(deleted_ids)} of {label} removed, {skipped} already deleted')
+        else:
+            QMessageBox.information(None, 'Deleted', f'❌ {label} removed')
+        if on_done:
+            on_done(deleted_ids)
 
-    try:
-        entity_id = entity_data.get(id_column)
-        update_fields = [f'{col} = %s' for col in entity_data if col != id_column]
-        sql = (
-            f'UPDATE {table} '
-            f'SET {', '.join(update_fields)}, updated_at = CURRENT_TIMESTAMP '
-            f'WHERE {id_column} = %s '
-            f'RETURNING created_at, updated_at;'
-        )
+    def on_failed(error):
+        QMessageBox.critical(None, 'DB Error', f'⚠️ Failed to delete {label}:\n{error}')
 
-        values = [entity_data[col] for col in entity_data if col != id_column]
-        values.append(entity_id)
+    return run_in_background(conn, soft_delete_rows, table, id_column, entity_ids,
+                             on_finished=on_finished, on_failed=on_failed, writes=True)
 
-        with conn.cursor() as cur:
-            cur.execute(sql, tuple(values))
-            created_at, updated_at = cur.fetchone()
 
-        entity_data = {
-            **entity_data,
-            'created_at': format_value(created_at),
-            'updated_at': format_value(updated_at),
-        }
+def update_entities(conn, table, id_column, entity_ids, values, columns, label, on_done=None):
+    """
+    Set the same field values on several rows in the background, one UPDATE for all of them.
+    - values: dict of column_name: new value
+    - columns: columns of the updated rows handed to `on_done` (COLUMN_ORDER)
+    - label: what is updated, for the messages ('12 clients')
+    - on_done: optional callback receiving the updated rows as tuples
+    Rows already deleted (by another user) are left alone, the message says how many were edited.
+    """
+    if not conn:
+        QMessageBox.critical(None, 'DB Error', '❌ Could not connect to database')
+        return None
+    entity_ids = list(entity_ids)
+
+    def on_finished(rows):
+        skipped = len(entity_ids) - len(rows)
+        if not rows:
+            QMessageBox.warning(None, 'Not Edited', f'⚠️ Nothing edited: {label} already deleted')
+        elif skipped:
+            QMessageBox.information(None, 'Edited', f'🔄 {len(rows)} of {label} edited, {skipped} already deleted')
+        else:
+            QMessageBox.information(None, 'Edited', f'🔄 {label} edited')
+        if on_done:
+            on_done(rows)
 
-        conn.commit()
+    def on_failed(error):
+        QMessageBox.critical(None, 'DB Error', f'⚠️ Failed to edit {label}:\n{error}')
 
-        QMessageBox.information(None, 'Edited', f'🔄 {display_name} edited')
-        return entity_data
-    except Exception as e:
-        conn.rollback()
-        QMessageBox.critical(None, 'DB Error', f'⚠️ Failed to edit {display_name.lower()}:\n{e}')
+    return run_in_background(conn, update_rows, table, id_column, entity_ids, values, columns,
+                             on_finished=on_finished, on_failed=on_failed, writes=True)
 
 
-def entity_name_exists(
-        conn, table, name_column, name_value, id_column=None, exclude_id=None):
+def edit_entity(conn, table, id_column, entity_data, display_name, name_column, on_done=None):
+    """Generic update function, like `insert_entity` the UPDATE runs in the background."""
     if not conn:
         QMessageBox.critical(None, 'DB Error', '❌ Could not connect to database')
         return None
 
-    with conn.cursor() as cur:
-        if exclude_id:
-            cur.execute(
-                f'''
-                SELECT 1 FROM {table}
-                WHERE {name_column} = %s
-                  AND {id_column} <> %s
-                  AND deleted_at IS NULL
-                ''',
-                (name_value, exclude_id),
-            )
+    def on_finished(result):
+        if result['row'] is not None:
+            QMessageBox.information(None, 'Edited', f'🔄 {display_name} edited')
+        elif result['missing']:
+            QMessageBox.warning(None, 'Not Found', f'⚠️ This {display_name.lower()} no longer exists')
+        if on_done:
+            on_done(result)
+
+    def on_failed(error):
+        QMessageBox.critical(None, 'DB Error', f'⚠️ Failed to edit {display_name.lower()}:\n{error}')
+        if on_done:
+            on_done(None)
+
+    return run_in_background(conn, update_row, table, id_column, entity_data, name_column,
+                             on_finished=on_finished, on_failed=on_failed, writes=True)
+
+
+# --- Blocking queries, run on a worker thread with a checked-out connection ---
+
+_NUMBER_TYPES = {*extensions.INTEGER.values, *extensions.LONGINTEGER.values,
+                 *extensions.FLOAT.values, *extensions.DECIMAL.values}
+_DATE_TYPES = set(extensions.DATE.values)
+_DATETIME_TYPES = {*extensions.PYDATETIME.values, *extensions.PYDATETIMETZ.values}
+
+
+def column_kinds(description) -> tuple:
+    """Sort kind of each result column ('number', 'date', 'datetime' or 'text') from `cursor.description`."""
+    kinds = []
+    for column in description:
+        if column.type_code in _NUMBER_TYPES:
+            kinds.append('number')
+        elif column.type_code in _DATE_TYPES:
+            kinds.append('date')
+        elif column.type_code in _DATETIME_TYPES:
+            kinds.append('datetime')
         else:
-            cur.execute(
-                f'''
-                SELECT 1 FROM {table}
-                WHERE {name_column} = %s
-                  AND deleted_at IS NULL
-                ''',
-                (name_value,),
-            )
-        return cur.fetchone() is not None
+            kinds.append('text')
+    return tuple(kinds)
+
+
+def fetch_rows(db, query, params=None, describe=False):
+    """Fetch the whole result, as (column_kinds, rows) with `describe`."""
+    with db.cursor() as cur:
+        cur.execute(query, params)
+        rows = cur.fetchall()
+        return (column_kinds(cur.description), rows) if describe else rows
+
+
+def fetch_rows_and_count(db, query, params, count_query):
+    """`fetch_rows`, plus the number `count_query` returns (e.g. the active rows a table should hold)."""
+    with db.cursor() as cur:
+        cur.execute(query, params)
+        rows = cur.fetchall()
+        cur.execute(count_query)
+        return rows, cur.fetchone()[0]
+
+
+def stream_rows(db, query, params=None, batch_size=500, describe=False):
+    """
+    Yield the result in lists of `batch_size` rows from a server-side (named) cursor,
+    so only one batch is held client-side at a time. Returns the total row count.
+    With `describe`, the `column_kinds` of the result are yielded before the first batch.
+    """
+    total = 0
+    with db.cursor(name=f'stream_{uuid.uuid4().hex}') as cur:
+        cur.itersize = batch_size
+        cur.execute(query, params)
+        rows = cur.fetchmany(batch_size)
+        if describe:  # a named cursor only describes the result once it fetched
+            yield column_kinds(cur.description)
+        while rows:
+            total += len(rows)
+            yield rows
+            rows = cur.fetchmany(batch_size)
+    return total
+
+
+class _ChunkedFileWriter:
+    """File-like sink for COPY TO STDOUT, collects the raw bytes and writes them out chunk by chunk."""
+    def __init__(self, file, chunk_size, progress=None):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.buffer = bytearray()
+        self.written = 0
+
+    def write(self, data):
+        self.buffer += data
+        if len(self.buffer) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            self.file.write(self.buffer)
+            self.written += len(self.buffer)
+            self.buffer.clear()
+            if self.progress:
+                self.progress(self.written)
+
+
+def copy_to_file(db, query, params, path, chunk_size=1 << 20, progress=None):
+    """
+    Stream the result of `query` into a CSV file (with a header row) via COPY ... TO STDOUT.
+
+    The server already produces CSV, so rows never become Python objects: the bytes
+    go to the file in `chunk_size` pieces and `progress` receives the bytes written
+    after each one. The file is written under a temporary name and only replaces
+    `path` once the COPY has finished. Returns the number of rows exported.
+    """
+    partial = f'{path}.part'
+    with db.cursor() as cur:
+        sql = cur.mogrify(query, params).decode()
+        try:
+            with open(partial, 'wb') as file:
+                sink = _ChunkedFileWriter(file, chunk_size, progress)
+                cur.copy_expert(f'COPY ({sql}) TO STDOUT WITH (FORMAT csv, HEADER)', sink)
+                sink.flush()
+            os.replace(partial, path)
+        except BaseException:
+            if os.path.exists(partial):
+                os.remove(partial)
+            raise
+        return cur.rowcount
+
+
+def save_result(row=None, duplicate=None, missing=False) -> dict:
+    """
+    Outcome of `insert_row` / `update_row`.
+
+    Args:
+        row: The stored row as a dict, None when nothing was written.
+        duplicate: (column, value) of the name already used by another active row.
+        missing: True when the updated row no longer exists (deleted in the meantime).
+    """
+    return {'row': row, 'duplicate': duplicate, 'missing': missing}
+
+
+def active_name_index(table) -> str:
+    """Partial unique index on the name of the active rows (database/migrations/004_unique_active_names.sql)."""
+    return f'{table}_name_active_key'
+
+
+def insert_row(db, table, entity_data, id_column, name_column):
+    """
+    Insert a row unless an active row already uses its name, in one statement:
+    the partial unique index turns the name check into ON CONFLICT DO NOTHING.
+    """
+    with db.cursor() as cur:
+        columns = ', '.join(entity_data.keys())
+        placeholders = ', '.join(['%s'] * len(entity_data))
+        sql = (
+            f'INSERT INTO {table} ({columns}) '
+            f'VALUES ({placeholders}) '
+            f'ON CONFLICT ({name_column}) WHERE deleted_at IS NULL DO NOTHING '
+            f'RETURNING {id_column}, created_at, updated_at;'
+        )
+        cur.execute(sql, tuple(entity_data.values()))
+        stored = cur.fetchone()
+    db.commit()
+
+    if stored is None:
+        return save_result(duplicate=(name_column, entity_data[name_column]))
+    new_id, created_at, updated_at = stored
+    return save_result({
+        id_column: new_id,
+        **entity_data,
+        'created_at': created_at,
+        'updated_at': updated_at,
+    })
+
+
+def soft_delete_rows(db, table, id_column, entity_ids):
+    """Soft-delete the active rows among `entity_ids` in one statement, returns the IDs deleted."""
+    with db.cursor() as cur:
+        cur.execute(
+            f'''
+            UPDATE {table}
+            SET deleted_at = CURRENT_TIMESTAMP
+            WHERE {id_column} = ANY(%s)
+              AND deleted_at IS NULL
+            RETURNING {id_column}
+            ''',
+            (entity_ids,),
+        )
+        deleted_ids = [row[0] for row in cur.fetchall()]
+    db.commit()
+    return deleted_ids
+
+
+def update_rows(db, table, id_column, entity_ids, values, columns):
+    """Set `values` on the active rows among `entity_ids` in one statement, returns them as `columns` tuples."""
+    assignments = ', '.join(f'{column} = %s' for column in values)
+    with db.cursor() as cur:
+        cur.execute(
+            f'''
+            UPDATE {table}
+            SET {assignments}, updated_at = CURRENT_TIMESTAMP
+            WHERE {id_column} = ANY(%s)
+              AND deleted_at IS NULL
+            RETURNING {', '.join(columns)}
+            ''',
+            (*values.values(), entity_ids),
+        )
+        rows = cur.fetchall()
+    db.commit()
+    return rows
+
+
+def update_row(db, table, id_column, entity_data, name_column):
+    """
+    Update an active row, a name already used by another active row is rejected by the partial unique index.
+    A row deleted in the meantime is left alone and reported as missing.
+    """
+    entity_id = entity_data.get(id_column)
+    update_fields = ', '.join(f'{col} = %s' for col in entity_data if col != id_column)
+    sql = (
+        f'UPDATE {table} '
+        f'SET {update_fields}, updated_at = CURRENT_TIMESTAMP '
+        f'WHERE {id_column} = %s AND deleted_at IS NULL '
+        f'RETURNING created_at, updated_at;'
+    )
+
+    values = [entity_data[col] for col in entity_data if col != id_column]
+    values.append(entity_id)
+
+    try:
+        with db.cursor() as cur:
+            cur.execute(sql, tuple(values))
+            stored = cur.fetchone()
+    except errors.UniqueViolation as error:
+        db.rollback()
+        if error.diag.constraint_name != active_name_index(table):
+            raise
+        return save_result(duplicate=(name_column, entity_data[name_column]))
+    db.commit()
+    if stored is None:
+        return save_result(missing=True)
+
+    created_at, updated_at = stored
+    return save_result({
+        **entity_data,
+        'created_at': created_at,
+        'updated_at': updated_at,
+    })
@@ -0,0 +1,164 @@
+# 1. Standard Library
+import inspect
+import threading
+from contextlib import contextmanager, nullcontext
+
+# 2. Third Party Library
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+# 3. Internal Library
+
+# Tasks are kept alive here until their completion signal reached the GUI thread
+_active_tasks = set()
+_thread_pool = None
+
+
+@contextmanager
+def checkout(conn):
+    """
+    Yield a usable psycopg2 connection and roll it back if the block raises.
+
+    `conn` may be a plain connection or a ConnectionPool; pooled connections
+    are handed back to the pool when the block exits.
+    """
+    with conn.connection() if hasattr(conn, 'getconn') else nullcontext(conn) as db:
+        try:
+            yield db
+        except Exception:
+            if not db.closed:
+                db.rollback()
+            raise
+
+
+def db_thread_pool() -> QThreadPool:
+    """Thread pool reserved for database work (kept apart from Qt's global pool)."""
+    global _thread_pool
+    if _thread_pool is None:
+        _thread_pool = QThreadPool()
+        _thread_pool.setMaxThreadCount(4)
+    return _thread_pool
+
+
+class QuerySignals(QObject):
+    progress = Signal(object)  # Each item yielded by a generator task function
+    finished = Signal(object)  # Return value of the task function
+    failed = Signal(str)  # Error message
+    cancelled = Signal()
+
+
+class QueryTask(QRunnable):
+    """
+    Run `fn(db, *args, **kwargs)` on a worker thread with a checked-out connection.
+
+    Results come back through `signals`, which live in the GUI thread, so the
+    connected slots can safely touch widgets. If `fn` is a generator, every
+    yielded item is emitted as `progress` while the connection is still checked
+    out, and its return value is emitted as `finished`.
+
+    A cancelled task emits `cancelled` instead of its result. With `writes`,
+    `fn` commits a change: once it has returned, the change is stored, so its
+    result is still emitted as `finished` if the cancel came too late.
+    """
+    def __init__(self, conn, fn, *args, writes=False, **kwargs):
+        super().__init__()
+        self.conn = conn
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.writes = writes
+        self.signals = QuerySignals()
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+        self._db = None
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        """Stop the task; a query already running on the server is cancelled too."""
+        self._cancelled.set()
+        with self._lock:
+            db = self._db
+        if db is not None and not db.closed:
+            try:
+                db.cancel()
+            except Exception:
+                pass
+
+    def run(self):
+        if self.is_cancelled():
+            self.signals.cancelled.emit()
+            return
+
+        done = False  # `fn` ran to the end
+        try:
+            with checkout(self.conn) as db:
+                with self._lock:
+                    self._db = db
+                try:
+                    result = self.fn(db, *self.args, **self.kwargs)
+                    done = True
+                    if inspect.isgenerator(result):
+                        done, result = self._drain(result)
+                finally:
+                    with self._lock:
+                        self._db = None
+        except Exception as e:
+            if self.is_cancelled():
+                self.signals.cancelled.emit()
+            else:
+                self.signals.failed.emit(str(e))
+            return
+
+        if self.is_cancelled() and not (self.writes and done):
+            self.signals.cancelled.emit()
+        else:
+            self.signals.finished.emit(result)
+
+    def _drain(self, generator):
+        """Emit each yielded item, stopping early when the task gets cancelled; returns (ran to the end, value)."""
+        while True:
+            try:
+                item = next(generator)
+            except StopIteration as stop:
+                return True, stop.value
+            if self.is_cancelled():
+                generator.close()
+                return False, None
+            self.signals.progress.emit(item)
+
+
+def run_in_background(conn, fn, *args, on_finished=None, on_failed=None, on_cancelled=None, on_progress=None,
+                      writes=False, **kwargs) -> QueryTask:
+    """
+    Queue `fn(db, *args, **kwargs)` on the database thread pool.
+
+    Args:
+        conn: psycopg2 connection or ConnectionPool.
+        fn: Function doing the DB work, it receives the checked-out connection first.
+        on_finished: Called in the GUI thread with the return value of `fn`.
+        on_failed: Called in the GUI thread with the error message.
+        on_cancelled: Called in the GUI thread if the task was cancelled.
+        on_progress: Called in the GUI thread with each item a generator `fn` yields.
+        writes: `fn` commits a change, its result is delivered even if the task is cancelled after it returned.
+
+    Returns:
+        The queued QueryTask, keep it to cancel the work.
+    """
+    task = QueryTask(conn, fn, *args, writes=writes, **kwargs)
+    if on_finished:
+        task.signals.finished.connect(on_finished)
+    if on_failed:
+        task.signals.failed.connect(on_failed)
+    if on_cancelled:
+        task.signals.cancelled.connect(on_cancelled)
+    if on_progress:
+        task.signals.progress.connect(on_progress)
+
+    _active_tasks.add(task)
+    for signal in (task.signals.finished, task.signals.failed, task.signals.cancelled):
+        signal.connect(lambda *_: _active_tasks.discard(task))
+
+    task.setAutoDelete(False)
+    db_thread_pool().start(task)
+    return task
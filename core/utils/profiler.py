@@ -0,0 +1,105 @@
+# 1. Standard Library
+import atexit
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+# 2. Third Party Library
+# 3. Internal Library
+from core.utils.query_stats import TimingStats
+
+_OFF = {'', '0', 'false', 'no', 'off'}
+_ON = {'1', 'true', 'yes', 'on'}
+
+
+def parse_setting(value) -> tuple:
+    """
+    (enabled, report file) from a CRM_PROFILE value: '', '0', 'false', 'no' or 'off' disable
+    profiling, '1', 'true', 'yes' or 'on' enable it, anything else also names the report file.
+    """
+    value = (value or '').strip()
+    if value.lower() in _OFF:
+        return False, None
+    return True, None if value.lower() in _ON else value
+
+
+class Profiler:
+    """
+    Opt-in timing of named UI spans (table population, filtering, sorting, dialog
+    opening, startup), aggregated in memory.
+
+    Enabled by the CRM_PROFILE environment variable (see `parse_setting`); the
+    summary is printed on exit, and also written to the file CRM_PROFILE names
+    when it is a path rather than a switch. Spans are aggregated like query
+    statements (`TimingStats`). When disabled `span` returns a shared no-op
+    context and `record` returns right away, so the hooks cost next to nothing.
+
+    Args:
+        enabled: Collect timings (defaults to what CRM_PROFILE says).
+        window: Durations kept per span for the percentiles.
+    """
+    def __init__(self, enabled: bool = None, window: int = 1000):
+        setting, self.path = parse_setting(os.getenv('CRM_PROFILE'))
+        self.enabled = setting if enabled is None else enabled
+        self.window = window
+        self._lock = threading.Lock()
+        self._spans = {}  # Name -> TimingStats
+        self._noop = nullcontext()
+
+    def span(self, name: str):
+        """Context manager timing its block under `name`."""
+        return self._timed(name) if self.enabled else self._noop
+
+    @contextmanager
+    def _timed(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def record(self, name: str, seconds: float):
+        """Add a duration measured elsewhere (e.g. across an asynchronous load)."""
+        if not self.enabled:
+            return
+        with self._lock:
+            stats = self._spans.get(name)
+            if stats is None:
+                stats = self._spans[name] = TimingStats(self.window)
+            stats.add(seconds)
+
+    def snapshot(self) -> list:
+        """Per-span summary dicts (durations in ms), largest total first."""
+        with self._lock:
+            summary = [{'span': name, **stats.summary()} for name, stats in self._spans.items()]
+        for item in summary:
+            item['avg_ms'] = item['total_ms'] / item['calls']
+        return sorted(summary, key=lambda item: item['total_ms'], reverse=True)
+
+    def report(self) -> str:
+        lines = [f'{"span":<28}{"count":>8}{"total ms":>11}{"avg ms":>9}{"p50 ms":>9}{"p95 ms":>9}{"max ms":>9}']
+        for item in self.snapshot():
+            lines.append(f'{item["span"]:<28}{item["calls"]:>8}{item["total_ms"]:>11.1f}{item["avg_ms"]:>9.1f}'
+                         f'{item["p50_ms"]:>9.1f}{item["p95_ms"]:>9.1f}{item["max_ms"]:>9.1f}')
+        return '\n'.join(lines)
+
+    def dump(self):
+        """Print the summary (and write it to the CRM_PROFILE file), called on exit when enabled."""
+        if not self._spans:
+            return
+        report = self.report()
+        print(report, file=sys.stderr)
+        if self.path:
+            try:
+                with open(self.path, 'a', encoding='utf-8') as file:
+                    file.write(f'{time.strftime("%Y-%m-%d %H:%M:%S")}\n{report}\n\n')
+            except OSError as e:
+                print('Profile not written:', e, file=sys.stderr)
+
+
+# Shared by the whole app
+profiler = Profiler()
+if profiler.enabled:
+    atexit.register(profiler.dump)
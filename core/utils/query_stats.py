@@ -0,0 +1,277 @@
+# 1. Standard Library
+import io
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+
+# 2. Third Party Library
+from psycopg2 import extensions
+
+# 3. Internal Library
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_LISTS = re.compile(r'\((?:\s*\?\s*,)+\s*\?\s*\)')
+_SPACES = re.compile(r'\s+')
+
+
+def fingerprint(sql) -> str:
+    """Statement shape shared by its executions: literals and numbers become ?, whitespace is collapsed."""
+    if isinstance(sql, bytes):
+        sql = sql.decode(errors='replace')
+    sql = _LITERALS.sub('?', sql.replace('%s', '?').replace('%%', '%'))
+    return _SPACES.sub(' ', _LISTS.sub('(?)', sql)).strip()
+
+
+def _estimate_bytes(result) -> int:
+    """Rough text size of a fetch result: the first row's text length times the row count."""
+    rows = result if isinstance(result, list) else [] if result is None else [result]
+    if not rows:
+        return 0
+    return len(rows) * sum(len(str(value)) for value in rows[0] if value is not None)
+
+
+class TimingStats:
+    """
+    Call count, total and max duration, rows and bytes of one statement (or profiler span),
+    plus the latest `window` durations for the rolling percentiles.
+    """
+    def __init__(self, window):
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.rows = 0
+        self.bytes = 0
+        self.durations = deque(maxlen=window)  # Latest durations (seconds), the percentiles roll with them
+
+    def add(self, duration, rows=0, size=0):
+        self.calls += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+        self.rows += rows
+        self.bytes += size
+        self.durations.append(duration)
+
+    def summary(self) -> dict:
+        """The counters as a dict, durations in ms."""
+        durations = sorted(self.durations)
+        return {
+            'calls': self.calls,
+            'total_ms': self.total * 1000,
+            'max_ms': self.max * 1000,
+            'p50_ms': percentile(durations, 0.50) * 1000,
+            'p95_ms': percentile(durations, 0.95) * 1000,
+            'p99_ms': percentile(durations, 0.99) * 1000,
+            'rows': self.rows,
+            'bytes': self.bytes,
+        }
+
+
+def percentile(durations, fraction) -> float:
+    """Value below which `fraction` of the sorted `durations` fall, 0 when there are none."""
+    if not durations:
+        return 0.0
+    return durations[min(len(durations) - 1, int(fraction * len(durations)))]
+
+
+class QueryStats:
+    """
+    Thread-safe per-statement query statistics, fed by InstrumentedCursor.
+
+    Statements are grouped by `fingerprint`. Each keeps its call count, total
+    and max duration, rows and bytes (query sent plus an estimate of the
+    result, or the data copied by COPY), plus the latest `window`
+    durations for rolling p50/p95/p99. Statements slower than the threshold
+    (SLOW_QUERY_MS, default 200) are also appended to a rotating JSONL file
+    (QUERY_LOG_PATH, default logs/slow_queries.jsonl) and kept in `slow`.
+
+    Args:
+        window: Durations kept per statement for the percentiles.
+        slow_keep: Slow queries kept in memory for the Logs page.
+    """
+    LOG_MAX_BYTES = 5 * 1024 * 1024  # Rotated at this size, keeping LOG_BACKUPS older files
+    LOG_BACKUPS = 3
+
+    def __init__(self, window: int = 1000, slow_keep: int = 200):
+        self.window = window
+        self.slow = deque(maxlen=slow_keep)  # Latest slow queries as dicts, newest last
+        self._lock = threading.Lock()
+        self._statements = {}
+        self._logger = None
+        self._threshold = None
+
+    @property
+    def slow_threshold(self) -> float:
+        """Seconds above which a query is logged as slow."""
+        if self._threshold is None:
+            self._threshold = float(os.getenv('SLOW_QUERY_MS', '200')) / 1000
+        return self._threshold
+
+    def record(self, sql, duration: float, rows: int = 0, size: int = 0):
+        statement = fingerprint(sql)
+        with self._lock:
+            stats = self._statements.get(statement)
+            if stats is None:
+                stats = self._statements[statement] = TimingStats(self.window)
+            stats.add(duration, rows, size)
+        if duration >= self.slow_threshold:
+            self._log_slow(statement, duration, rows, size)
+
+    def snapshot(self) -> list:
+        """Per-statement summary dicts (durations in ms), slowest total first."""
+        with self._lock:
+            summary = [{'statement': statement, **stats.summary()} for statement, stats in self._statements.items()]
+        return sorted(summary, key=lambda item: item['total_ms'], reverse=True)
+
+    def reset(self):
+        with self._lock:
+            self._statements = {}
+            self.slow.clear()
+
+    def _log_slow(self, statement, duration, rows, size):
+        entry = {
+            'time': datetime.now().isoformat(timespec='milliseconds'),
+            'statement': statement,
+            'duration_ms': round(duration * 1000, 3),
+            'rows': rows,
+            'bytes': size,
+            'thread': threading.current_thread().name,
+        }
+        self.slow.append(entry)
+        logger = self._slow_logger()
+        if logger:
+            logger.info(json.dumps(entry))
+
+    def _slow_logger(self):
+        with self._lock:
+            if self._logger is None:
+                path = os.getenv('QUERY_LOG_PATH', os.path.join('logs', 'slow_queries.jsonl'))
+                self._logger = logging.getLogger('crm.slow_queries')
+                self._logger.propagate = False
+                self._logger.setLevel(logging.INFO)
+                try:
+                    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+                    handler = RotatingFileHandler(path, maxBytes=self.LOG_MAX_BYTES,
+                                                  backupCount=self.LOG_BACKUPS, encoding='utf-8')
+                except OSError as e:
+                    print('Slow query log unavailable:', e)
+                else:
+                    handler.setFormatter(logging.Formatter('%(message)s'))
+                    self._logger.addHandler(handler)
+            return self._logger
+
+
+# Shared by every connection of the app
+query_stats = QueryStats()
+
+
+class _CountingFile:
+    """File wrapper counting the bytes a COPY reads or writes."""
+    def __init__(self, file):
+        self.file = file
+        self.bytes = 0
+
+    def read(self, size=-1):
+        data = self.file.read(size)
+        self.bytes += self._size(data)
+        return data
+
+    def readline(self, size=-1):
+        data = self.file.readline(size)
+        self.bytes += self._size(data)
+        return data
+
+    def write(self, data):
+        self.bytes += self._size(data)
+        return self.file.write(data)
+
+    @staticmethod
+    def _size(data) -> int:
+        return len(data)
+
+
+class _CountingTextFile(_CountingFile, io.TextIOBase):
+    """Text file wrapper, psycopg2 hands a text file str instead of bytes, counted in the client encoding."""
+    def __init__(self, file, codec='utf-8'):
+        super().__init__(file)
+        self.codec = codec
+
+    def _size(self, data) -> int:
+        return len(data.encode(self.codec, 'replace'))  # bytes on the wire, not characters
+
+
+class InstrumentedCursor(extensions.cursor):
+    """
+    psycopg2 cursor recording every statement in `query_stats`.
+
+    A statement is timed from `execute` through the fetches that follow it
+    (a server-side cursor transfers its rows while fetching) and recorded with
+    its row count and estimated result size on the next `execute` or `close`.
+    Use it as `cursor_factory` of a connection.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pending = None  # [sql, seconds, rows, bytes] of the statement not recorded yet
+
+    def execute(self, query, vars=None):
+        self._flush()
+        started = time.perf_counter()
+        try:
+            return super().execute(query, vars)
+        finally:
+            self._pending = [query, time.perf_counter() - started, max(self.rowcount, 0), len(self.query or b'')]
+            if self.name:  # rows only arrive with the fetches
+                self._pending[2] = 0
+
+    def executemany(self, query, vars_list):
+        self._flush()
+        started = time.perf_counter()
+        try:
+            return super().executemany(query, vars_list)
+        finally:
+            query_stats.record(query, time.perf_counter() - started, max(self.rowcount, 0))
+
+    def copy_expert(self, sql, file, size=8192):
+        self._flush()
+        if isinstance(file, io.TextIOBase):
+            counted = _CountingTextFile(file, extensions.encodings.get(self.connection.encoding, 'utf-8'))
+        else:
+            counted = _CountingFile(file)
+        started = time.perf_counter()
+        try:
+            return super().copy_expert(sql, counted, size)
+        finally:
+            query_stats.record(sql, time.perf_counter() - started, max(self.rowcount, 0), counted.bytes)
+
+    def fetchone(self):
+        return self._timed_fetch(super().fetchone)
+
+    def fetchmany(self, size=None):
+        return self._timed_fetch(super().fetchmany, self.arraysize if size is None else size)
+
+    def fetchall(self):
+        return self._timed_fetch(super().fetchall)
+
+    def close(self):
+        self._flush()
+        super().close()
+
+    def _timed_fetch(self, fetch, *args):
+        started = time.perf_counter()
+        result = fetch(*args)
+        if self._pending is not None:
+            self._pending[1] += time.perf_counter() - started
+            if self.name and result:
+                self._pending[2] += len(result) if isinstance(result, list) else 1
+            self._pending[3] += _estimate_bytes(result)
+        return result
+
+    def _flush(self):
+        if self._pending is not None:
+            query_stats.record(*self._pending)
+            self._pending = None
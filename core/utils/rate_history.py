@@ -0,0 +1,178 @@
+# 1. Standard Library
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timezone
+from itertools import groupby
+from operator import itemgetter
+
+# 2. Third Party Library
+
+# 3. Internal Library
+
+
+class RateHistory:
+    """
+    In-memory exchange rate history for bulk lookups without a query per lookup.
+
+    Each currency keeps its rate dates as proleptic ordinals in one sorted
+    array('i') and the rates alongside in an array('d'), so "rate at date D"
+    is one bisect and "series between D1 and D2" two. Load it once with
+    `load_rate_history`, then convert any number of invoices locally.
+
+    Args:
+        base: Currency the rates are quoted against (1 base = rate currency).
+        rows: Optional (currency, rate_date, rate) rows, in any order.
+    """
+    def __init__(self, base: str = 'USD', rows=()):
+        self.base = base
+        self._days = {}  # Currency -> sorted date ordinals
+        self._rates = {}  # Currency -> rate of each date in `_days`
+        by_currency = {}
+        for currency, day, rate in rows:
+            by_currency.setdefault(currency.strip(), []).append((day.toordinal(), rate))
+        for currency, points in by_currency.items():
+            points.sort()
+            self._days[currency] = array('i', (ordinal for ordinal, _ in points))
+            self._rates[currency] = array('d', (rate for _, rate in points))
+
+    @classmethod
+    def from_ordinals(cls, base: str, rows) -> 'RateHistory':
+        """Build from (currency, date ordinal, rate) rows already sorted by currency and date (no per-row date)."""
+        history = cls(base)
+        for currency, points in groupby(rows, itemgetter(0)):
+            points = list(points)
+            history._days[currency.strip()] = array('i', map(itemgetter(1), points))
+            history._rates[currency.strip()] = array('d', map(itemgetter(2), points))
+        return history
+
+    def __len__(self):
+        return sum(len(days) for days in self._days.values())
+
+    def currencies(self) -> list:
+        return sorted(self._days)
+
+    def add(self, currency: str, day: date, rate: float):
+        """Record (or replace) the rate of `currency` on `day`."""
+        days = self._days.setdefault(currency, array('i'))
+        rates = self._rates.setdefault(currency, array('d'))
+        ordinal = day.toordinal()
+        position = bisect_left(days, ordinal)
+        if position < len(days) and days[position] == ordinal:
+            rates[position] = rate
+        else:
+            days.insert(position, ordinal)
+            rates.insert(position, rate)
+
+    def add_snapshot(self, rates: dict, day: date):
+        """Record every rate of one provider update (currency -> rate) on `day`."""
+        for currency, rate in rates.items():
+            self.add(currency, day, float(rate))
+
+    def rate_at(self, currency: str, day: date):
+        """The rate that applied on `day`: the latest one on or before it, None if there is none yet."""
+        if currency == self.base:
+            return 1.0
+        days = self._days.get(currency)
+        if not days:
+            return None
+        position = bisect_right(days, day.toordinal()) - 1
+        return self._rates[currency][position] if position >= 0 else None
+
+    def rates_at(self, currency: str, days) -> list:
+        """`rate_at` for many dates of one currency (e.g. the invoice dates of a report)."""
+        if currency == self.base:
+            return [1.0] * len(days)
+        ordinals = self._days.get(currency) or array('i')
+        rates = self._rates.get(currency)
+        result = []
+        for day in days:
+            position = bisect_right(ordinals, day.toordinal()) - 1
+            result.append(rates[position] if position >= 0 else None)
+        return result
+
+    def series(self, currency: str, start: date, end: date) -> list:
+        """(date, rate) of every recorded date between `start` and `end`, both included, oldest first."""
+        days = self._days.get(currency)
+        if not days:
+            return []
+        first, last = bisect_left(days, start.toordinal()), bisect_right(days, end.toordinal())
+        rates = self._rates[currency]
+        return [(date.fromordinal(days[i]), rates[i]) for i in range(first, last)]
+
+
+def rate_date(updated_unix) -> date:
+    """Date (UTC) a provider update applies to, from its `time_last_update_unix`."""
+    return datetime.fromtimestamp(updated_unix, timezone.utc).date()
+
+
+# --- Blocking queries, run on a worker thread with a checked-out connection ---
+
+def store_rates(db, table, base, rates: dict, updated_unix) -> int:
+    """
+    Keep one provider update in the history table (database/migrations/005_currency_rate_history.sql),
+    in one statement. A later update of the same day replaces its rates, an older one is ignored.
+    Returns the rows written.
+    """
+    currencies = list(rates)
+    with db.cursor() as cur:
+        cur.execute(
+            f'''
+            INSERT INTO {table} AS t (base, currency, rate_date, rate, updated_at)
+            SELECT %s, currency, %s, rate, %s
+            FROM unnest(%s::text[], %s::float8[]) AS r (currency, rate)
+            ON CONFLICT (base, currency, rate_date) DO UPDATE
+            SET rate = excluded.rate, updated_at = excluded.updated_at
+            WHERE excluded.updated_at > t.updated_at
+            ''',
+            (base, rate_date(updated_unix), datetime.fromtimestamp(updated_unix, timezone.utc),
+             currencies, [float(rates[currency]) for currency in currencies]),
+        )
+        written = cur.rowcount
+    db.commit()
+    return written
+
+
+def load_rate_history(db, table, base='USD', currencies=None, start: date = None, end: date = None) -> RateHistory:
+    """
+    Read the history (optionally only some currencies or dates) into a RateHistory, in one query.
+    Load from some days before the first date needed, `rate_at` looks back to the latest earlier rate.
+    """
+    conditions, params = ['base = %s'], [base]
+    if currencies:
+        conditions.append('currency = ANY(%s)')
+        params.append(list(currencies))
+    if start:
+        conditions.append('rate_date >= %s')
+        params.append(start)
+    if end:
+        conditions.append('rate_date <= %s')
+        params.append(end)
+    with db.cursor() as cur:
+        # Dates come as proleptic ordinals and in index order, nothing to parse or sort per row
+        cur.execute(
+            f'''
+            SELECT currency, rate_date - DATE '0001-01-01' + 1, rate
+            FROM {table}
+            WHERE {' AND '.join(conditions)}
+            ORDER BY currency, rate_date
+            ''',
+            params,
+        )
+        return RateHistory.from_ordinals(base, cur.fetchall())
+
+
+def fetch_rate_at(db, table, currency, day: date, base='USD'):
+    """Single `rate_at` straight from the table (latest rate on or before `day`), an index probe."""
+    with db.cursor() as cur:
+        cur.execute(
+            f'''
+            SELECT rate
+            FROM {table}
+            WHERE base = %s AND currency = %s AND rate_date <= %s
+            ORDER BY rate_date DESC
+            LIMIT 1
+            ''',
+            (base, currency, day),
+        )
+        row = cur.fetchone()
+    return row[0] if row else None
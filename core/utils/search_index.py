@@ -0,0 +1,251 @@
+# 1. Standard Library
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date
+
+# 2. Third Party Library
+# 3. Internal Library
+from core.utils.db_utils import format_value
+
+
+def trigrams(text: str) -> set:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class _ColumnIndex:
+    """
+    Lowercased cell texts of one column plus a trigram -> storage indices posting list.
+
+    Posting lists cover `texts[:indexed]` and are filled in slices (`index_more`),
+    the rows past `indexed` are scanned until they are indexed.
+    """
+    def __init__(self, texts):
+        self.texts = texts
+        self.postings = {}
+        self.indexed = 0
+
+    def set_text(self, index, text):
+        if index < self.indexed:
+            self._unpost(index)
+        while len(self.texts) <= index:
+            self.texts.append('')
+        self.texts[index] = text
+        if index < self.indexed:
+            self._post(index, text)
+        elif index == self.indexed == len(self.texts) - 1:  # fully indexed so far, keep it that way
+            self._post(index, text)
+            self.indexed += 1
+
+    def index_more(self, count: int) -> bool:
+        """Index the next `count` rows, returns whether rows are left."""
+        end = min(len(self.texts), self.indexed + count)
+        for index in range(self.indexed, end):
+            self._post(index, self.texts[index])
+        self.indexed = end
+        return end < len(self.texts)
+
+    def _post(self, index, text):
+        postings = self.postings
+        for gram in trigrams(text):
+            posting = postings.get(gram)
+            if posting is None:
+                posting = postings[gram] = array('i')
+            posting.append(index)
+
+    def _unpost(self, index):
+        for gram in trigrams(self.texts[index]):
+            posting = self.postings[gram]
+            posting.remove(index)
+            if not posting:
+                del self.postings[gram]
+
+    def search(self, text) -> set:
+        texts = self.texts
+        if len(text) < 3 or not self.indexed:  # no trigram to look up, scan the lowercased texts
+            return {index for index, value in enumerate(texts) if text in value}
+        found = {index for index in range(self.indexed, len(texts)) if text in texts[index]}
+
+        postings = []
+        for gram in trigrams(text):
+            posting = self.postings.get(gram)
+            if posting is None:
+                return found
+            postings.append(posting)
+        postings.sort(key=len)
+
+        # Intersect the shortest posting lists, once the candidates are fewer than the next list
+        # it is cheaper to check them directly (a trigram hit does not guarantee a substring match)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            if len(candidates) < len(posting):
+                break
+            candidates.intersection_update(posting)
+        found.update(index for index in candidates if text in texts[index])
+        return found
+
+
+class SearchIndex:
+    """
+    Case-insensitive substring search over the formatted cells of a ColumnStore.
+
+    A column is tracked from its first search (or `track`): its lowercased texts
+    are kept up to date through `add`, `update` and `remove`, and trigram posting
+    lists are built in slices by `index_more`, so a keystroke becomes a set
+    intersection instead of a pass over every row. Results are storage indices.
+
+    Args:
+        store: ColumnStore holding the rows.
+    """
+    INDEX_SLICE = 2000  # Rows indexed per `index_more` call
+
+    def __init__(self, store):
+        self.store = store
+        self._columns = {}  # Column index -> _ColumnIndex
+
+    def reset(self, store):
+        """Drop every column index, the rows now live in `store`."""
+        self.store = store
+        self._columns = {}
+
+    def track(self, column: int) -> _ColumnIndex:
+        """Start indexing a column, its texts are ready right away and its posting lists follow."""
+        index = self._columns.get(column)
+        if index is None:
+            texts = [format_value(value).lower() for value in self.store.column_values(column)]
+            index = self._columns[column] = _ColumnIndex(texts)
+        return index
+
+    def build(self, column: int) -> _ColumnIndex:
+        """Track and fully index a column right away."""
+        index = self.track(column)
+        while index.index_more(len(index.texts)):
+            pass
+        return index
+
+    def pending(self) -> bool:
+        return any(index.indexed < len(index.texts) for index in self._columns.values())
+
+    def index_more(self) -> bool:
+        """Index the next slice of rows of the tracked columns, returns whether rows are left."""
+        left = False
+        for index in self._columns.values():
+            left = index.index_more(self.INDEX_SLICE) or left
+        return left
+
+    def add(self, storage_index: int):
+        for column, index in self._columns.items():
+            index.set_text(storage_index, format_value(self.store.value(storage_index, column)).lower())
+
+    update = add
+
+    def remove(self, storage_index: int):
+        for index in self._columns.values():
+            index.set_text(storage_index, '')
+
+    def search(self, column: int, text: str) -> set:
+        """Storage indices of the rows whose `column` contains `text` (already lowercased)."""
+        return self.track(column).search(text)
+
+    def matches(self, column: int, storage_index: int, text: str) -> bool:
+        texts = self.track(column).texts
+        return storage_index < len(texts) and text in texts[storage_index]
+
+
+class DateRangeIndex:
+    """
+    Sorted date keys of the date/timestamp columns of a ColumnStore, for range filters.
+
+    Each tracked column keeps its non-NULL values as proleptic ordinals in one
+    sorted array('i') with the matching storage indices alongside, so the rows
+    between two dates are found with two bisects in O(log n + k). Timestamps are
+    keyed by their date. Columns are sorted once on first use and then kept up to
+    date through `build` for loaded batches, `add`, `update` and `remove`.
+
+    Args:
+        store: ColumnStore holding the rows.
+    """
+    def __init__(self, store):
+        self.store = store
+        self._columns = {}  # Column index -> (sorted ordinals, storage indices, ordinal by storage index)
+
+    def reset(self, store):
+        self.store = store
+        self._columns = {}
+
+    def _ordinal(self, storage_index, column) -> int:
+        value = self.store.value(storage_index, column)
+        return value.toordinal() if isinstance(value, date) else 0  # 0 = NULL, real ordinals start at 1
+
+    def track(self, column: int):
+        entry = self._columns.get(column)
+        if entry is None:
+            ordinals = array('i', (self._ordinal(index, column) for index in range(len(self.store))))
+            pairs = sorted((ordinal, index) for index, ordinal in enumerate(ordinals) if ordinal)
+            keys = array('i', (ordinal for ordinal, _ in pairs))
+            rows = array('i', (index for _, index in pairs))
+            entry = self._columns[column] = (keys, rows, ordinals)
+        return entry
+
+    def add(self, storage_index: int):
+        for column, (keys, rows, ordinals) in self._columns.items():
+            while len(ordinals) <= storage_index:
+                ordinals.append(0)
+            ordinal = ordinals[storage_index] = self._ordinal(storage_index, column)
+            if ordinal:
+                position = bisect_right(keys, ordinal)
+                keys.insert(position, ordinal)
+                rows.insert(position, storage_index)
+
+    def build(self, storage_indices):
+        """
+        Add a batch of new rows (a load or a streamed batch): their keys are sorted
+        once and merged into each column in one pass, instead of an O(n) array insert per row.
+        """
+        storage_indices = list(storage_indices)
+        if not storage_indices:
+            return
+        for column, (keys, rows, ordinals) in self._columns.items():
+            ordinals.extend([0] * (max(storage_indices) + 1 - len(ordinals)))
+            added = []
+            for index in storage_indices:
+                ordinal = ordinals[index] = self._ordinal(index, column)
+                if ordinal:
+                    added.append((ordinal, index))
+            if not added:
+                continue
+            added.sort()
+            merged_keys, merged_rows = array('i'), array('i')
+            start = 0
+            for ordinal, index in added:  # copy the runs of old keys between the new ones
+                position = bisect_right(keys, ordinal, start)
+                merged_keys += keys[start:position]
+                merged_rows += rows[start:position]
+                merged_keys.append(ordinal)
+                merged_rows.append(index)
+                start = position
+            merged_keys += keys[start:]
+            merged_rows += rows[start:]
+            self._columns[column] = (merged_keys, merged_rows, ordinals)
+
+    def remove(self, storage_index: int):
+        for keys, rows, ordinals in self._columns.values():
+            ordinal = ordinals[storage_index] if storage_index < len(ordinals) else 0
+            if ordinal:
+                position = rows.index(storage_index, bisect_left(keys, ordinal), bisect_right(keys, ordinal))
+                del keys[position]
+                del rows[position]
+                ordinals[storage_index] = 0
+
+    def update(self, storage_index: int):
+        self.remove(storage_index)
+        self.add(storage_index)
+
+    def between(self, column: int, start: date, end: date) -> set:
+        """Storage indices of the rows whose `column` falls between `start` and `end`, both included."""
+        keys, rows, _ = self.track(column)
+        return set(rows[bisect_left(keys, start.toordinal()):bisect_right(keys, end.toordinal())])
+
+    def in_range(self, column: int, storage_index: int, start: date, end: date) -> bool:
+        _, _, ordinals = self.track(column)
+        ordinal = ordinals[storage_index] if storage_index < len(ordinals) else 0
+        return bool(ordinal) and start.toordinal() <= ordinal <= end.toordinal()
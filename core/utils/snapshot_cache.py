@@ -0,0 +1,126 @@
+# 1. Standard Library
+import hashlib
+import json
+import os
+import struct
+import sys
+from datetime import datetime
+
+# 2. Third Party Library
+# 3. Internal Library
+from core.models.row_store import ColumnStore
+
+SNAPSHOT_VERSION = 2  # 2: no order blob, the rows are stored in display order
+_MAGIC = b'CRMSNAP\0'
+_HEADER_SIZE = struct.Struct('<I')
+
+
+def snapshot_dir() -> str:
+    """Directory of the snapshot files: CRM_SNAPSHOT_DIR, else crmmaster/snapshots in the user cache directory."""
+    cache_home = os.getenv('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.getenv('CRM_SNAPSHOT_DIR') or os.path.join(cache_home, 'crmmaster', 'snapshots')
+
+
+def snapshot_path(table: str) -> str:
+    """Snapshot file of `table`, one per database so switching servers never shows rows of another one."""
+    from database.database_functions import get_connection_settings
+    settings = get_connection_settings()
+    database = f'{settings["user"]}@{settings["host"]}:{settings["port"]}/{settings["dbname"]}'
+    return os.path.join(snapshot_dir(), f'{table}-{hashlib.sha1(database.encode()).hexdigest()[:12]}.snapshot')
+
+
+def save_snapshot(path, store: ColumnStore, order, watermark: datetime, kinds=()) -> bool:
+    """
+    Write the rows of a ColumnStore as a snapshot file, replacing the previous one atomically.
+
+    The file is a JSON header (columns, column types, watermark) followed by
+    the raw column buffers, so reading it back copies bytes instead of decoding
+    every value. Only the rows in `order` are written, in that order and
+    renumbered from 0 with their text buffers rebuilt, so removed rows and
+    replaced text never carry over to the next session.
+
+    Args:
+        path: Snapshot file.
+        store: Rows to save.
+        order: Storage indices of the rows to show, in display order (removed rows left out).
+        watermark: Latest updated_at/deleted_at of the rows, changes after it are fetched on restore.
+        kinds: Sort kinds of the columns (see `column_kinds`).
+
+    Returns:
+        False if a column has no compact encoding, nothing is written then.
+    """
+    if watermark is None:
+        return False
+    store = store.take(order)
+    exported = store.export()
+    if exported is None:
+        return False
+    specs, blobs = exported
+    header = json.dumps({
+        'version': SNAPSHOT_VERSION,
+        'byteorder': sys.byteorder,
+        'columns': store.columns,
+        'size': len(store),
+        'specs': specs,
+        'blob_sizes': [len(blob) for blob in blobs],
+        'watermark': watermark.isoformat(),
+        'kinds': list(kinds or ()),
+        'saved_at': datetime.now().isoformat(timespec='seconds'),
+    }).encode()
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    partial = f'{path}.part'
+    with open(partial, 'wb') as file:
+        file.write(_MAGIC + _HEADER_SIZE.pack(len(header)) + header)
+        for blob in blobs:
+            file.write(blob)
+    os.replace(partial, path)
+    return True
+
+
+def load_snapshot(path, columns, categorical=()):
+    """
+    Read a snapshot written by `save_snapshot`.
+
+    Args:
+        path: Snapshot file.
+        columns: Expected column names (COLUMN_ORDER), a snapshot of other columns is ignored.
+        categorical: Dictionary-encoded columns of the rebuilt store.
+
+    Returns:
+        dict with the rebuilt `store` (rows in display order), the `watermark` and the column `kinds`,
+        or None if there is no usable snapshot (missing, from another version or columns, damaged).
+    """
+    try:
+        with open(path, 'rb') as file:
+            data = file.read()
+    except OSError:
+        return None
+    try:
+        if not data.startswith(_MAGIC):
+            return None
+        offset = len(_MAGIC) + _HEADER_SIZE.size
+        (header_size,) = _HEADER_SIZE.unpack_from(data, len(_MAGIC))
+        header = json.loads(data[offset:offset + header_size])
+        if (header['version'] != SNAPSHOT_VERSION or header['byteorder'] != sys.byteorder
+                or header['columns'] != list(columns)):
+            return None
+
+        offset += header_size
+        view = memoryview(data)
+        blobs = []
+        for size in header['blob_sizes']:
+            blobs.append(view[offset:offset + size])
+            offset += size
+        if offset != len(data):
+            return None
+        store = ColumnStore.from_export(columns, categorical, header['size'], header['specs'], blobs,
+                                        header['kinds'])
+        return {
+            'store': store,
+            'watermark': datetime.fromisoformat(header['watermark']),
+            'kinds': tuple(header['kinds']),
+        }
+    except (ValueError, KeyError, TypeError, StopIteration, struct.error) as e:
+        print(f'Ignoring snapshot {path}:', e)
+        return None
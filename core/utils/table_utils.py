@@ -1,24 +1,24 @@
 # 1. Standard Library
+from datetime import date
 
 # 2. Third Party Library
 from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QAbstractItemView, QHeaderView, QTableWidget, QTableWidgetItem
+from PySide6.QtWidgets import QAbstractItemView, QHeaderView, QTableView
 
 # 3. Internal Library
+from core.models.row_store import parse_date
+from core.utils.profiler import profiler
 
 
-def setup_table_headers(table: QTableWidget, headers: list, stretch_column: str = None):
+def setup_table_headers(table: QTableView, headers: list, stretch_column: str = None):
     """
-    Setup QTableWidget headers and resize behavior.
+    Setup QTableView headers and resize behavior.
 
     Args:
-        table: The QTableWidget to configure.
+        table: The QTableView to configure (its model provides the header labels).
         headers: List of column header labels.
         stretch_column: Optional column name to stretch (e.g., 'Description').
     """
-    table.setColumnCount(len(headers))
-    table.setHorizontalHeaderLabels(headers)
-
     header = table.horizontalHeader()
 
     # ✅ Allow resizing
@@ -41,14 +41,14 @@ def setup_table_headers(table: QTableWidget, headers: list, stretch_column: str
             table.setColumnWidth(col, 80)
 
 
-def setup_table_ui(table: QTableWidget, edit_callback):
-    # Table columns movable, hides the ID, can't select more than one to edit
+def setup_table_ui(table: QTableView, edit_callback):
+    # Table columns movable, hides the ID, whole rows are selected (Ctrl/Shift+click for bulk actions)
     table.horizontalHeader().setSectionsMovable(True)
     table.setColumnHidden(0, True)
-    table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-    table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-    table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
-    table.cellDoubleClicked.connect(edit_callback)
+    table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+    table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+    table.setSelectionMode(QTableView.SelectionMode.ExtendedSelection)
+    table.doubleClicked.connect(lambda index: edit_callback(index.row()))
 
     # Enable sorting on the table
     table.setSortingEnabled(True)
@@ -59,66 +59,113 @@ def setup_table_ui(table: QTableWidget, edit_callback):
 
 
 def filter_table(widget, text):
+    """
+    Show only the rows whose filter column contains `text` (case-insensitive).
+
+    The matches come from the model's trigram search index and the view is
+    updated in one model reset; rows added later are checked as they arrive.
+
+    Args:
+        widget: Page with `table_model` (EntityTableModel) and `filter_box`.
+        text: Search text, empty shows every row.
+    """
     text = text.strip().lower()
-    filter_col = widget.filter_box.currentIndex() + 1
+    model = widget.table_model
+    if not text:
+        if model.is_filtered():
+            model.set_filter(None)
+        return
 
-    for row in range(widget.table.rowCount()):
-        item = widget.table.item(row, filter_col)
-        if item and text in item.text().lower():
-            widget.table.setRowHidden(row, False)
-        else:
-            widget.table.setRowHidden(row, True if text else False)
+    column = widget.filter_box.currentIndex() + 1
+    index = model.search_index
+    with profiler.span('table.filter'):
+        model.set_filter(lambda row: index.matches(column, row, text), matches=index.search(column, text))
 
 
-def update_table_row(table: QTableWidget, row: int, data: list):
+def filter_table_by_dates(widget, start: date, end: date):
     """
-    Update a row in a QTableWidget with given data.
+    Show only the rows whose (date) filter column falls between `start` and `end`, both included.
+
+    The matches come from two bisects over the model's sorted date keys, rows
+    without a date never match.
 
     Args:
-        table: The QTableWidget to update.
-        row: The row index to update.
+        widget: Page with `table_model` (EntityTableModel) and `filter_box`.
+        start: First day of the range.
+        end: Last day of the range.
+    """
+    column = widget.filter_box.currentIndex() + 1
+    index = widget.table_model.date_index
+    with profiler.span('table.filter_dates'):
+        widget.table_model.set_filter(
+            lambda row: index.in_range(column, row, start, end), matches=index.between(column, start, end))
+
+
+def update_table_row(model, row_id, data: list):
+    """
+    Update a row of an EntityTableModel with given data.
+
+    The row is found by its ID, so it does not matter if the table was sorted,
+    filtered or reloaded in the meantime. Rows no longer loaded are ignored.
+
+    Args:
+        model: The EntityTableModel to update.
+        row_id: ID (first column) of the row to update.
         data: List in order.
     """
-    # Update table items
-    for col_idx, value in enumerate(data):
-        table.setItem(row, col_idx, QTableWidgetItem(str(value)))
+    model.update_by_id(row_id, typed_values(model, data))
 
 
-def add_table_row(table: QTableWidget, data: list):
+def typed_values(model, values) -> list:
     """
-    Add a new row at the bottom of a QTableWidget.
+    Row values as the database returns them: the form dialogs emit dates as 'yyyy-MM-dd'
+    text, which becomes a date in the date columns (by the model's column kinds).
+    """
+    kinds = model.sort_kinds()
+    return [parse_date(value) if isinstance(value, str) and col_idx < len(kinds) and kinds[col_idx] == 'date'
+            else value for col_idx, value in enumerate(values)]
+
+
+def add_table_row(model, data: list):
+    """
+    Add a new row at the top of an EntityTableModel.
+
+    If a row with the same ID is already loaded (the change listener can push
+    it in first), that row is updated instead.
 
     Args:
-        table: The QTableWidget to update.
+        model: The EntityTableModel to update.
         data: Either a list/tuple of values or a dict (values will be used in order).
     """
-    # Insert a new row at the bottom
-    # new_row_index = table.rowCount()
-    new_row_index = 0  # Shift add row to the top
-    table.insertRow(new_row_index)
-
-    # Fill the row
-    for col_idx, value in enumerate(data):
-        table.setItem(new_row_index, col_idx, QTableWidgetItem(str(value)))
+    values = typed_values(model, data.values() if isinstance(data, dict) else data)
+    if not model.update_by_id(values[0], values):
+        model.insert_row(0, values)  # Shift add row to the top
 
 
-def reset_table_order(table: QTableWidget):
+def reset_table_order(table: QTableView):
     """
-    Resets the QTableWidget to the original order.
+    Resets the QTableView to the original order (newest ID first).
 
     Args:
-        table (QTableWidget): The table to reset.
+        table (QTableView): The table to reset.
     """
-    # TODO: The sorting right now is not quite right, it sorts based on first digit
     table.setSortingEnabled(True)  # make sure sorting is allowed
-    table.sortItems(0, Qt.SortOrder.DescendingOrder)  # sort by first column (ID)
+    table.sortByColumn(0, Qt.SortOrder.DescendingOrder)  # sort by first column (ID)
 
 
-def row_to_dict(table, row, columns):
+def row_to_dict(model, row, columns):
     """
-    Convert a QTableWidget row into a dict using COLUMN_ORDER.
+    Convert a model row into a dict using COLUMN_ORDER.
+    IDs stay integers, dates become 'yyyy-mm-dd' and everything else text for the form dialogs.
     """
-    return {
-        col: (table.item(row, idx).text() if table.item(row, idx) else None)
-        for idx, col in enumerate(columns)
-    }
+    return {col: _form_value(value) for col, value in zip(columns, model.row_values(row))}
+
+
+def _form_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, int):
+        return value
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
@@ -7,15 +7,47 @@ from PySide6.QtWidgets import QMessageBox, QWidget
 # 3. Internal Library
 
 
+# --- Pure checks, return the error message or None (shared by the form dialogs and the CSV import) ---
+
+def check_required(value: str, field_name: str) -> str | None:
+    if not value.strip():
+        return f'{field_name} cannot be empty.'
+    return None
+
+
+def check_max_length(value: str, max_length: int, field_name: str) -> str | None:
+    if len(value.strip()) > max_length:
+        return f'{field_name} exceeds maximum length of {max_length}.'
+    return None
+
+
+def check_characters(value: str, allowed_regex: str, field_name: str) -> str | None:
+    if not re.fullmatch(allowed_regex, value.strip()):
+        return f'{field_name} contains invalid characters.'
+    return None
+
+
+def check_selection(value: str, allowed_options: list, field_name: str) -> str | None:
+    if value not in allowed_options:
+        return f'{field_name} selection is invalid.'
+    return None
+
+
+# --- Interactive validators, warn the user with a message box ---
+
+def _report(error: str | None, parent: QWidget = None) -> bool:
+    if error:
+        QMessageBox.warning(parent, 'Validation Error', error)
+        return False
+    return True
+
+
 def validate_required(
         value: str,
         field_name: str,
         parent: QWidget = None) -> bool:
     """Ensure the field is not empty."""
-    if not value.strip():
-        QMessageBox.warning(parent, 'Validation Error', f'{field_name} cannot be empty.')
-        return False
-    return True
+    return _report(check_required(value, field_name), parent)
 
 
 def validate_max_length(
@@ -24,11 +56,7 @@ def validate_max_length(
         field_name: str,
         parent: QWidget = None) -> bool:
     """Ensure the field does not exceed max length."""
-    if len(value.strip()) > max_length:
-        QMessageBox.warning(parent, 'Validation Error',
-                            f'{field_name} exceeds maximum length of {max_length}.')
-        return False
-    return True
+    return _report(check_max_length(value, max_length, field_name), parent)
 
 
 def validate_characters(
@@ -37,10 +65,7 @@ def validate_characters(
         field_name: str,
         parent: QWidget = None) -> bool:
     """Validate allowed characters using a regex."""
-    if not re.fullmatch(allowed_regex, value.strip()):
-        QMessageBox.warning(parent, 'Validation Error', f'{field_name} contains invalid characters.')
-        return False
-    return True
+    return _report(check_characters(value, allowed_regex, field_name), parent)
 
 
 def validate_selection(
@@ -49,7 +74,4 @@ def validate_selection(
         field_name: str,
         parent: QWidget = None) -> bool:
     """Validate that a dropdown selection is in allowed options."""
-    if value not in allowed_options:
-        QMessageBox.warning(parent, 'Validation Error', f'{field_name} selection is invalid.')
-        return False
-    return True
+    return _report(check_selection(value, allowed_options, field_name), parent)
@@ -1,25 +1,37 @@
 # 1. Standard Library
+import time
+from datetime import timedelta
 
 # 2. Third Party Library
-from PySide6.QtCore import QDate, Signal
+from PySide6.QtCore import QDate, Qt, QTimer, Signal
 from PySide6.QtWidgets import (
+    QApplication,
     QComboBox,
     QDateEdit,
+    QFileDialog,
     QHBoxLayout,
     QLabel,
     QLineEdit,
+    QMenu,
     QMessageBox,
+    QProgressDialog,
     QPushButton,
-    QTableWidget,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
 # 3. Internal Library
-from core import load_data_from_db, remove_entity
+from core import load_data_from_db, remove_entities, run_in_background, update_entities, update_refresh_btn
+from core.models.entity_table_model import EntityTableModel
+from core.utils.csv_import import import_csv
+from core.utils.db_utils import copy_to_file, date_range_condition, fetch_rows, fetch_rows_and_count, search_condition
+from core.utils.profiler import profiler
+from core.utils.snapshot_cache import load_snapshot, save_snapshot, snapshot_path
 from core.utils.table_utils import (
     add_table_row,
     filter_table,
+    filter_table_by_dates,
     reset_table_order,
     row_to_dict,
     setup_table_headers,
@@ -31,12 +43,30 @@ from core.utils.table_utils import (
 class BasePageWidget(QWidget):
     data_added = Signal(dict)
     data_edited = Signal(dict)
+    export_progress = Signal(object)  # Bytes written so far, emitted from the export worker thread
 
     DATE_HEADERS = {'Contract Start', 'Contract End', 'Created At', 'Updated At'}
 
+    # Rows per server-side cursor batch, the table fills batch by batch (None = fetch all at once)
+    STREAM_BATCH_SIZE = 500
+
+    # Refresh only fetches rows changed since the watermark; rows changed this long before it are
+    # read again, so a transaction that committed late with an older timestamp is not missed
+    DELTA_OVERLAP = timedelta(seconds=60)
+
+    # Search the whole table on the server (ILIKE, trigram indexed) instead of filtering the loaded rows
+    SERVER_SEARCH = False
+    SEARCH_DELAY_MS = 300  # Debounce, the query runs once typing pauses this long
+
+    # Keep the loaded rows in an on-disk snapshot (core/utils/snapshot_cache.py): the next start shows them
+    # right away and only fetches what changed since
+    SNAPSHOT = True
+    SNAPSHOT_DELAY_MS = 2000  # Debounce, the snapshot is written once the rows stop changing for this long
+    REFRESH_TOOLTIP = 'Load changes since the last refresh (Shift+click reloads everything)'
+
     def __init__(self, parent=None, dev_mode: bool = False, conn=None,
                  table_name: str = None, column_order=None,
-                 headers=None, dialog_class=None, data_name=None):
+                 headers=None, dialog_class=None, data_name=None, category_columns=(), bulk_fields=None):
         super().__init__(parent)
 
         # Configurable attributes
@@ -45,18 +75,39 @@ class BasePageWidget(QWidget):
         self.HEADERS = headers
         self.DialogClass = dialog_class
         self.data_name = data_name
+        self.bulk_fields = dict(bulk_fields or {})  # Column -> allowed values, settable on many rows at once
 
         # UI elements
         self.refresh_btn = QPushButton('🔄 Refresh')
-        self.table = QTableWidget()
+        self.table = QTableView()
+        self.table_model = EntityTableModel(self.HEADERS, self, columns=self.COLUMN_ORDER,
+                                            categorical=category_columns)
         self.search_bar = QLineEdit()
-        self.date_search = QDateEdit()
+        self.date_search = QDateEdit()  # First day of the date range
+        self.date_search_to = QDateEdit()  # Last day of the date range
+        self.date_range_label = QLabel('→')
         self.filter_box = QComboBox()
-        self.data = {}
         self.conn = conn
+        self.load_task = None  # Running background load, None when idle
+        self.watermark = None  # Latest updated_at/deleted_at seen, None until a full load finished
+        self.notify_task = None  # Running fetch of rows pushed by the change listener
+        self.notified_ids = set()  # IDs notified while that fetch was running
+        self.changes_pending = False  # Changes were notified mid-load, a delta refresh follows it
+        self.export_dialog = None  # Progress dialog of the running export
+        self.load_started = 0.0  # perf_counter() when the running load started, for the profiler
+        self.holds_table = False  # Every active row is loaded (full load, no server search), can be snapshotted
+        self.snapshot_timer = QTimer(self)
+        self.server_search_btn = QPushButton('🌐')
+        self.search_timer = QTimer(self)
 
         self.setup_ui()
-        self.load_data()
+        if not self.restore_snapshot():
+            self.load_data()
+
+    @property
+    def data(self):
+        """Loaded rows as a compact ColumnStore (storage order, see `table_model` for display order)."""
+        return self.table_model.store
 
     def setup_ui(self):
         layout = QVBoxLayout(self)
@@ -64,7 +115,8 @@ class BasePageWidget(QWidget):
         header_layout.addWidget(QLabel(f'📦{self.data_name} List'))
 
         # Refresh button
-        self.refresh_btn.clicked.connect(self.load_data)
+        self.refresh_btn.clicked.connect(self.on_refresh_clicked)
+        self.refresh_btn.setToolTip(self.REFRESH_TOOLTIP)
         header_layout.addWidget(self.refresh_btn)
 
         # Reset button
@@ -84,19 +136,62 @@ class BasePageWidget(QWidget):
         remove_btn.clicked.connect(self.remove_data)
         header_layout.addWidget(remove_btn)
 
+        # Bulk edit button
+        if self.bulk_fields:
+            bulk_btn = QPushButton('✏️')
+            bulk_btn.setToolTip(f'Set a field on the selected {self.data_name.lower()}s')
+            bulk_menu = QMenu(bulk_btn)
+            for column, options in self.bulk_fields.items():
+                field_menu = bulk_menu.addMenu(self.HEADERS[self.COLUMN_ORDER.index(column)])
+                for option in options:
+                    field_menu.addAction(option).triggered.connect(
+                        lambda _=False, column=column, option=option: self.update_selected(column, option))
+            bulk_btn.setMenu(bulk_menu)
+            header_layout.addWidget(bulk_btn)
+
+        # Import button
+        import_btn = QPushButton('📥')
+        import_btn.setToolTip(f'Import {self.data_name.lower()}s from CSV')
+        import_btn.clicked.connect(self.import_data)
+        header_layout.addWidget(import_btn)
+
+        # Export button
+        export_btn = QPushButton('📤')
+        export_btn.setToolTip(f'Export the {self.data_name.lower()}s matching the search to CSV')
+        export_btn.clicked.connect(self.export_data)
+        self.export_progress.connect(self.on_export_progress)
+        header_layout.addWidget(export_btn)
+
+        # Server search toggle
+        self.server_search_btn.setCheckable(True)
+        self.server_search_btn.setChecked(self.SERVER_SEARCH)
+        self.server_search_btn.setToolTip(f'Search all {self.data_name.lower()}s in the database, '
+                                          f'not only the loaded rows')
+        self.server_search_btn.toggled.connect(self.on_server_search_toggled)
+        header_layout.addWidget(self.server_search_btn)
+
         # Search bar
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.SEARCH_DELAY_MS)
+        self.search_timer.timeout.connect(self.load_data)
+        self.snapshot_timer.setSingleShot(True)
+        self.snapshot_timer.setInterval(self.SNAPSHOT_DELAY_MS)
+        self.snapshot_timer.timeout.connect(self.write_snapshot)
         self.search_bar.setPlaceholderText(f'Search {self.data_name.lower()}...')
-        self.search_bar.textChanged.connect(lambda text: filter_table(self, text))
+        self.search_bar.textChanged.connect(self.apply_search)
         header_layout.addWidget(self.search_bar)
 
-        # Date edit for filtering
-        self.date_search.dateChanged.connect(
-            lambda date: filter_table(self, date.toString('dd-MM-yyyy'))
-        )
-        self.date_search.setCalendarPopup(True)
-        self.date_search.setDisplayFormat('dd-MM-yyyy')
-        self.date_search.hide()  # default hidden
+        # Date range edits for filtering
+        for date_edit in (self.date_search, self.date_search_to):
+            date_edit.setCalendarPopup(True)
+            date_edit.setDisplayFormat('dd-MM-yyyy')
+            date_edit.dateChanged.connect(self.apply_date_filter)
+        self.date_search.setToolTip('From (included)')
+        self.date_search_to.setToolTip('To (included)')
         header_layout.addWidget(self.date_search)
+        header_layout.addWidget(self.date_range_label)
+        header_layout.addWidget(self.date_search_to)
+        self.set_date_search_visible(False)  # default hidden
 
         # Filter box
         self.filter_box.addItems(self.HEADERS[1:])  # exclude ID
@@ -107,6 +202,7 @@ class BasePageWidget(QWidget):
         layout.addLayout(header_layout)
 
         # Table
+        self.table.setModel(self.table_model)
         setup_table_headers(self.table, self.HEADERS, stretch_column='Description')
         setup_table_ui(self.table, self.edit_data)
         layout.addWidget(self.table)
@@ -116,58 +212,467 @@ class BasePageWidget(QWidget):
         selected_header = self.HEADERS[index + 1]  # offset (exclude ID)
         if selected_header in self.DATE_HEADERS:
             self.search_bar.hide()
-            self.date_search.setDate(QDate.currentDate())
-            self.date_search.show()
-            filter_table(self, self.date_search.date().toString('dd-MM-yyyy'))
+            for date_edit in (self.date_search, self.date_search_to):
+                date_edit.blockSignals(True)
+                date_edit.setDate(QDate.currentDate())
+                date_edit.blockSignals(False)
+            self.set_date_search_visible(True)
+            self.apply_date_filter()
         else:
-            self.date_search.hide()
+            self.set_date_search_visible(False)
             self.search_bar.show()
             self.search_bar.clear()  # reset text filter
-            filter_table(self, '')
+            self.apply_search('')
+
+    def set_date_search_visible(self, visible: bool):
+        for widget in (self.date_search, self.date_range_label, self.date_search_to):
+            widget.setVisible(visible)
+
+    def date_search_active(self) -> bool:
+        return not self.date_search.isHidden()
+
+    def date_range(self):
+        """The searched (from, to) days as dates, both included, swapped if entered backwards."""
+        start = self.date_search.date().toPython()
+        end = self.date_search_to.date().toPython()
+        return (start, end) if start <= end else (end, start)
+
+    def server_search(self) -> bool:
+        return self.server_search_btn.isChecked()
+
+    def apply_search(self, text: str):
+        """Filter the loaded rows, in server search mode also reload the matching rows once typing pauses."""
+        filter_table(self, text)
+        if self.server_search():
+            self.search_timer.start()
+
+    def apply_date_filter(self):
+        """Filter the loaded rows on the date range, in server search mode also reload the matching rows."""
+        filter_table_by_dates(self, *self.date_range())
+        if self.server_search():
+            self.search_timer.start()
+
+    def on_server_search_toggled(self, checked: bool):
+        if self.date_search_active() or self.search_bar.text().strip():
+            self.load_data()
+
+    def on_refresh_clicked(self):
+        """Refresh the changed rows (everything with Shift held), or cancel the load already running."""
+        if self.load_task:
+            self.cancel_load()
+        elif self.watermark is None or QApplication.keyboardModifiers() & Qt.KeyboardModifier.ShiftModifier:
+            self.load_data()
+        else:
+            self.refresh_changes()
+
+    def set_loading(self, loading: bool):
+        """Toggle the loading state while a query for this page is in flight."""
+        if loading:
+            self.refresh_btn.setText('⏹ Cancel')
+            self.refresh_btn.setToolTip('Cancel loading')
+            self.table.setCursor(Qt.CursorShape.BusyCursor)
+        else:
+            self.refresh_btn.setToolTip(self.REFRESH_TOOLTIP)
+            self.table.unsetCursor()
+
+    def filter_clause(self):
+        """The active search as (' AND <condition>', params) for SQL queries, ('', ()) when nothing is searched."""
+        column = self.COLUMN_ORDER[self.filter_box.currentIndex() + 1]  # offset (exclude ID)
+        if self.date_search_active():
+            condition, params = date_range_condition(column, *self.date_range())
+        elif self.search_bar.text().strip():
+            condition, params = search_condition(column, self.search_bar.text().strip())
+        else:
+            return '', ()
+        return f' AND {condition}', params
+
+    def search_filter(self):
+        """`filter_clause` when the search runs on the server, ('', ()) when it filters the loaded rows."""
+        return self.filter_clause() if self.server_search() else ('', ())
 
     def load_data(self):
+        """(Re)load the table, only the rows matching the search in server search mode."""
+        self.search_timer.stop()
+        if self.load_task:
+            self.load_task.cancel()
+
+        self.watermark = None
+        self.holds_table = False
+        self.set_loading(True)
+        self.load_started = time.perf_counter()
+        condition, params = self.search_filter()
         query = f'''
             SELECT {', '.join(self.COLUMN_ORDER)}
             FROM {self.table_name}
-            WHERE deleted_at IS NULL
+            WHERE deleted_at IS NULL{condition}
+            ORDER BY {self.COLUMN_ORDER[0]} DESC
+        '''
+        task = load_data_from_db(self.table, self.conn, query, self.HEADERS, self.refresh_btn,
+                                 on_loaded=lambda data, ok: self.on_data_loaded(task, data, not condition, ok),
+                                 batch_size=self.STREAM_BATCH_SIZE, params=params)
+        self.load_task = task
+        if task:
+            task.signals.cancelled.connect(lambda: self.on_load_cancelled(task))
+        else:  # no connection, already reported
+            self.on_load_cancelled(None)
+
+    def on_data_loaded(self, task, data, whole_table=False, ok=True):
+        """
+        Finish a load. A failed one (`ok` False) may have left part of the rows, it gets no watermark
+        and no snapshot, so the next Refresh loads everything again instead of patching it.
+        """
+        if task is not self.load_task:  # superseded by a newer load
+            return
+        self.load_task = None
+        self.set_loading(False)
+        if not ok:
+            self.watermark = None
+            self.holds_table = False
+            self.snapshot_timer.stop()
+            return
+        profiler.record(f'{self.data_name.lower()}.load', time.perf_counter() - self.load_started)
+        self.table_model.prepare_search(self.filter_box.currentIndex() + 1)  # ready for the first keystroke
+        updated_col = self.COLUMN_ORDER.index('updated_at')
+        self.watermark = max((value for value in self.data.column_values(updated_col) if value is not None),
+                             default=None)
+        self.holds_table = whole_table
+        self.schedule_snapshot()
+        self.run_pending_refresh()
+
+    def restore_snapshot(self) -> bool:
+        """
+        Show the rows saved by the last session right away, then reconcile them in the background:
+        a delta refresh from the snapshot's watermark, plus a full reload if the active row count
+        still differs (rows deleted for real cannot be seen by the delta).
+
+        Returns:
+            False if there is no usable snapshot, the page has to load normally then.
+        """
+        if not self.SNAPSHOT:
+            return False
+        started = time.perf_counter()
+        snapshot = load_snapshot(snapshot_path(self.table_name), self.COLUMN_ORDER, self.table_model.categorical)
+        if snapshot is None:
+            return False
+
+        self.table_model.set_headers(self.HEADERS)
+        self.table_model.set_sort_kinds(snapshot['kinds'])
+        self.table_model.restore_rows(snapshot['store'])
+        self.watermark = snapshot['watermark']
+        self.holds_table = True
+        profiler.record(f'{self.data_name.lower()}.snapshot_restore', time.perf_counter() - started)
+
+        # Ready for the first keystroke, once the rows are painted
+        QTimer.singleShot(0, self, lambda: self.table_model.prepare_search(self.filter_box.currentIndex() + 1))
+        self.refresh_changes(verify_count=True)
+        return True
+
+    def schedule_snapshot(self):
+        """Save the rows once they stop changing for SNAPSHOT_DELAY_MS."""
+        if self.SNAPSHOT and self.holds_table:
+            self.snapshot_timer.start()
+
+    def write_snapshot(self):
+        """Save the loaded rows and their watermark for the next start (see `restore_snapshot`)."""
+        if not self.holds_table or self.watermark is None or self.load_task:
+            return
+        started = time.perf_counter()
+        model = self.table_model
+        try:
+            save_snapshot(snapshot_path(self.table_name), model.store, model.load_order(), self.watermark,
+                          model.sort_kinds())
+        except OSError as e:
+            print(f'{self.data_name} snapshot not saved:', e)
+        profiler.record(f'{self.data_name.lower()}.snapshot_save', time.perf_counter() - started)
+
+    def flush_snapshot(self):
+        """Write a snapshot still waiting for its debounce now, e.g. when the app closes."""
+        if self.snapshot_timer.isActive():
+            self.snapshot_timer.stop()
+            self.write_snapshot()
+
+    def refresh_changes(self, verify_count=False):
+        """
+        Fetch only the rows inserted, edited or soft-deleted since the watermark and patch them in.
+
+        Args:
+            verify_count: Also count the active rows and reload everything if the table then holds
+                a different number of rows (after restoring a snapshot).
+        """
+        if not self.conn:
+            self.load_data()  # reports the missing connection
+            return
+
+        query = f'''
+            SELECT {', '.join(self.COLUMN_ORDER)}, deleted_at
+            FROM {self.table_name}
+            WHERE updated_at >= %(since)s OR deleted_at >= %(since)s
             ORDER BY {self.COLUMN_ORDER[0]}
         '''
-        self.data = load_data_from_db(self.table, self.conn, query, self.HEADERS, self.refresh_btn)
+        params = {'since': self.watermark - self.DELTA_OVERLAP}
+
+        self.set_loading(True)
+        if verify_count:
+            count_query = f'SELECT count(*) FROM {self.table_name} WHERE deleted_at IS NULL'
+            task = run_in_background(self.conn, fetch_rows_and_count, query, params, count_query,
+                                     on_finished=lambda result: self.on_changes_loaded(task, *result),
+                                     on_failed=lambda error: self.on_changes_failed(task, error),
+                                     on_cancelled=lambda: self.on_load_cancelled(task))
+        else:
+            task = run_in_background(self.conn, fetch_rows, query, params,
+                                     on_finished=lambda rows: self.on_changes_loaded(task, rows),
+                                     on_failed=lambda error: self.on_changes_failed(task, error),
+                                     on_cancelled=lambda: self.on_load_cancelled(task))
+        self.load_task = task
+
+    def on_changes_loaded(self, task, rows, active_count=None):
+        if task is not self.load_task:
+            return
+        self.load_task = None
+        self.apply_change_rows(rows)
+        if active_count is not None and active_count != self.table_model.loaded_row_count():
+            self.load_data()  # rows were deleted for real since the watermark, the delta cannot tell which
+            return
+        update_refresh_btn(self.refresh_btn, True)
+        self.set_loading(False)
+        self.run_pending_refresh()
+
+    def apply_change_rows(self, rows, removed_ids=()):
+        """Patch rows of (*COLUMN_ORDER, deleted_at) into the table and advance the watermark."""
+        changed = [row[:-1] for row in rows if row[-1] is None]
+        removed = [row[0] for row in rows if row[-1] is not None]
+        self.table_model.apply_changes(changed, removed + list(removed_ids))
+
+        updated_col = self.COLUMN_ORDER.index('updated_at')
+        for row in rows:
+            for value in (row[updated_col], row[-1]):
+                if value is not None and value > self.watermark:
+                    self.watermark = value
+        if rows or removed_ids:
+            self.schedule_snapshot()
+
+    def apply_notified_changes(self, ids):
+        """Fetch and patch in the rows another session changed (IDs pushed by the ChangeListener)."""
+        if self.watermark is None or self.load_task:
+            self.changes_pending = True
+            return
+        self.notified_ids.update(ids)
+        if not self.notify_task:
+            self.fetch_notified_rows()
+
+    def fetch_notified_rows(self):
+        ids, self.notified_ids = list(self.notified_ids), set()
+        query = f'''
+            SELECT {', '.join(self.COLUMN_ORDER)}, deleted_at
+            FROM {self.table_name}
+            WHERE {self.COLUMN_ORDER[0]} = ANY(%s)
+        '''
+
+        def on_finished(rows):
+            self.notify_task = None
+            if self.load_task or self.watermark is None:  # a reload started meanwhile
+                self.changes_pending = True
+                return
+            # IDs that came back empty were deleted for real
+            found = {row[0] for row in rows}
+            self.apply_change_rows(rows, removed_ids=[row_id for row_id in ids if row_id not in found])
+            if self.notified_ids:
+                self.fetch_notified_rows()
+
+        def on_failed(error):
+            self.notify_task = None
+            print(f'Failed to fetch changed {self.data_name.lower()} rows:', error)
+
+        self.notify_task = run_in_background(self.conn, fetch_rows, query, (ids,),
+                                             on_finished=on_finished, on_failed=on_failed)
+
+    def catch_up_changes(self):
+        """Delta refresh after live updates were interrupted (the notifications in between are lost)."""
+        if self.watermark is None or self.load_task:
+            self.changes_pending = True
+        else:
+            self.refresh_changes()
+
+    def run_pending_refresh(self):
+        if self.changes_pending and self.watermark is not None and not self.load_task:
+            self.changes_pending = False
+            self.refresh_changes()
+
+    def on_changes_failed(self, task, error):
+        if task is not self.load_task:
+            return
+        self.load_task = None
+        update_refresh_btn(self.refresh_btn, False)
+        self.set_loading(False)
+        QMessageBox.critical(self, 'DB Error', f'⚠️ Failed to fetch changes:\n{error}')
+
+    def on_load_cancelled(self, task):
+        if task is not self.load_task:
+            return
+        self.load_task = None
+        self.set_loading(False)
+        self.refresh_btn.setText('🔄 Refresh')
+
+    def cancel_load(self):
+        if self.load_task:
+            self.load_task.cancel()
 
     def add_data(self):
+        opened = time.perf_counter()
         dialog = self.DialogClass(self, 'add', self.table_name, conn=self.conn)
+        self.profile_dialog_open(dialog, opened)
         dialog.data_added.connect(
-            lambda data: add_table_row(self.table, [data[key] for key in self.COLUMN_ORDER])
+            lambda data: add_table_row(self.table_model, [data[key] for key in self.COLUMN_ORDER])
         )
         dialog.exec()
 
     def edit_data(self, row):
-        data_dict = row_to_dict(self.table, row, self.COLUMN_ORDER)
+        data_dict = row_to_dict(self.table_model, row, self.COLUMN_ORDER)
+        data_id = self.table_model.row_values(row)[0]  # the row may move while the dialog is open
+        opened = time.perf_counter()
         dialog = self.DialogClass(
             parent=self, mode='edit', table_name=self.table_name,
             data_dict=data_dict, conn=self.conn
         )
+        self.profile_dialog_open(dialog, opened)
         dialog.data_edited.connect(
-            lambda data: update_table_row(self.table, row, [data[key] for key in self.COLUMN_ORDER])
+            lambda data: update_table_row(self.table_model, data_id, [data[key] for key in self.COLUMN_ORDER])
         )
         dialog.exec()
 
+    def profile_dialog_open(self, dialog, opened: float):
+        """Record the time from the click until `dialog` is shown and idle (its exec loop runs)."""
+        if profiler.enabled:
+            QTimer.singleShot(0, dialog, lambda: profiler.record(f'{type(dialog).__name__}.open',
+                                                                 time.perf_counter() - opened))
+
+    def selected_rows(self) -> list:
+        """Display rows of the selected table rows, top to bottom."""
+        return sorted(index.row() for index in self.table.selectionModel().selectedRows())
+
+    def selection_label(self, rows) -> str:
+        """'Client "Acme"' for one row, '12 clients' for several."""
+        if len(rows) == 1:
+            return f'{self.data_name} "{self.table_model.display_text(rows[0], 1)}"'
+        return f'{len(rows)} {self.data_name.lower()}s'
+
     def remove_data(self):
-        row = self.table.currentRow()
-        if row < 0:
+        """Soft-delete the selected rows with one UPDATE, the view drops them in one pass."""
+        rows = self.selected_rows()
+        if not rows:
             QMessageBox.warning(self, f'Remove {self.data_name}',
                                 f'⚠️ Please select a {self.data_name.lower()} to remove')
             return
 
-        data_id = self.table.item(row, 0).text()
-        data_name_val = self.table.item(row, 1).text()
+        data_ids = [self.table_model.row_values(row)[0] for row in rows]
+        label = self.selection_label(rows)
 
         confirm = QMessageBox.question(
             self, 'Confirm Delete',
-            f'Are you sure you want to delete {self.data_name.lower()}: {data_name_val}?',
+            f'Are you sure you want to delete {label}?',
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
 
         if confirm == QMessageBox.StandardButton.Yes:
-            remove_entity(self.conn, self.table_name, self.COLUMN_ORDER[0], data_id, data_name_val, self.data_name)
-            self.table.removeRow(row)
+            remove_entities(self.conn, self.table_name, self.COLUMN_ORDER[0], data_ids, label,
+                            on_done=self.table_model.remove_ids)
+
+    def update_selected(self, column: str, value):
+        """Set `column` to `value` on the selected rows with one UPDATE, the view is patched in one pass."""
+        rows = self.selected_rows()
+        if not rows:
+            QMessageBox.warning(self, f'Edit {self.data_name}',
+                                f'⚠️ Please select the {self.data_name.lower()}s to edit')
+            return
+
+        data_ids = [self.table_model.row_values(row)[0] for row in rows]
+        label = self.selection_label(rows)
+        header = self.HEADERS[self.COLUMN_ORDER.index(column)]
+
+        confirm = QMessageBox.question(
+            self, 'Confirm Edit',
+            f'Set {header} to "{value}" for {label}?',
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+
+        if confirm == QMessageBox.StandardButton.Yes:
+            update_entities(self.conn, self.table_name, self.COLUMN_ORDER[0], data_ids, {column: value},
+                            self.COLUMN_ORDER, label, on_done=self.table_model.apply_changes)
+
+    def import_data(self):
+        """Import new rows from a CSV file in the background and report the rows that were rejected."""
+        path, _ = QFileDialog.getOpenFileName(self, f'Import {self.data_name}s', '', 'CSV files (*.csv)')
+        if not path:
+            return
+
+        columns = [column for column in self.COLUMN_ORDER[1:] if column not in ('created_at', 'updated_at')]
+        headers = [header for column, header in zip(self.COLUMN_ORDER, self.HEADERS) if column in columns]
+
+        def on_failed(error):
+            self.table.unsetCursor()
+            QMessageBox.critical(self, 'Import Error', f'⚠️ Failed to import {self.data_name.lower()}s:\n{error}')
+
+        self.table.setCursor(Qt.CursorShape.BusyCursor)
+        run_in_background(self.conn, import_csv, path, self.table_name, columns, headers, self.COLUMN_ORDER[1],
+                          self.DialogClass.record_errors, on_finished=self.on_import_finished, on_failed=on_failed)
+
+    def on_import_finished(self, result):
+        self.table.unsetCursor()
+        if result['inserted']:
+            self.catch_up_changes()
+
+        errors = result['errors']
+        report = QMessageBox(self)
+        report.setWindowTitle('Import')
+        report.setIcon(QMessageBox.Icon.Warning if errors else QMessageBox.Icon.Information)
+        report.setText(f'📥 {result["inserted"]} of {result["total"]} {self.data_name.lower()}s imported'
+                       + (f', {len({line for line, _ in errors})} rows rejected' if errors else '')
+                       + (f' ({result["duplicates"]} duplicate names skipped)' if result['duplicates'] else ''))
+        if errors:
+            report.setDetailedText('\n'.join(f'Line {line}: {message}' for line, message in errors))
+        report.exec()
+
+    def export_data(self):
+        """Stream every row matching the current search to a CSV file, straight from the server."""
+        path, _ = QFileDialog.getSaveFileName(self, f'Export {self.data_name}s', f'{self.table_name}.csv',
+                                              'CSV files (*.csv)')
+        if not path:
+            return
+
+        condition, params = self.filter_clause()
+        columns = ', '.join(f'{column} AS "{header}"' for column, header in zip(self.COLUMN_ORDER, self.HEADERS))
+        query = f'''
+            SELECT {columns}
+            FROM {self.table_name}
+            WHERE deleted_at IS NULL{condition}
+            ORDER BY {self.COLUMN_ORDER[0]} DESC
+        '''
+
+        self.export_dialog = QProgressDialog(f'Exporting {self.data_name.lower()}s...', 'Cancel', 0, 0, self)
+        self.export_dialog.setWindowTitle('Export')
+        self.export_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        self.export_dialog.setMinimumDuration(500)
+
+        def close_dialog():
+            if self.export_dialog:
+                self.export_dialog.reset()
+                self.export_dialog.deleteLater()
+                self.export_dialog = None
+
+        def on_finished(rows):
+            close_dialog()
+            QMessageBox.information(self, 'Export', f'📤 {rows} {self.data_name.lower()}s exported to:\n{path}')
+
+        def on_failed(error):
+            close_dialog()
+            QMessageBox.critical(self, 'Export Error', f'⚠️ Failed to export {self.data_name.lower()}s:\n{error}')
+
+        task = run_in_background(self.conn, copy_to_file, query, params, path, progress=self.export_progress.emit,
+                                 on_finished=on_finished, on_failed=on_failed, on_cancelled=close_dialog)
+        self.export_dialog.canceled.connect(task.cancel)
+
+    def on_export_progress(self, written):
+        if self.export_dialog:
+            self.export_dialog.setLabelText(
+                f'Exporting {self.data_name.lower()}s... {written / 1048576:.1f} MB written'
+            )
@@ -0,0 +1,125 @@
+# 1. Standard Library
+
+# 2. Third Party Library
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtWidgets import (
+    QHBoxLayout,
+    QLabel,
+    QPushButton,
+    QSplitter,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+# 3. Internal Library
+from core.utils.query_stats import query_stats
+
+STATEMENT_HEADERS = ['Statement', 'Calls', 'Total ms', 'p50 ms', 'p95 ms', 'p99 ms', 'Max ms', 'Rows', 'Bytes']
+SLOW_HEADERS = ['Time', 'Duration ms', 'Rows', 'Bytes', 'Statement']
+
+
+class _NumberItem(QTableWidgetItem):
+    """Right-aligned number that sorts numerically."""
+    def __init__(self, value, decimals=0):
+        super().__init__(f'{value:,.{decimals}f}')
+        self.value = value
+        self.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+
+    def __lt__(self, other):
+        return self.value < getattr(other, 'value', 0)
+
+
+class QueryLogWidget(QWidget):
+    """
+    Logs page: per-statement query timings and the latest slow queries.
+
+    Shows the `query_stats` of every pooled connection (calls, total time,
+    rolling p50/p95/p99, rows, bytes) and the slow queries also written to the
+    rotating JSONL log, refreshed every REFRESH_MS while the page is visible.
+    """
+    REFRESH_MS = 2000
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.statements = QTableWidget(0, len(STATEMENT_HEADERS))
+        self.slow = QTableWidget(0, len(SLOW_HEADERS))
+        self.summary = QLabel()
+        self.timer = QTimer(self)
+        self.setup_ui()
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+        header_layout = QHBoxLayout()
+        header_layout.addWidget(QLabel('📜 Query Log'))
+
+        refresh_btn = QPushButton('🔄 Refresh')
+        refresh_btn.clicked.connect(self.refresh)
+        header_layout.addWidget(refresh_btn)
+
+        reset_btn = QPushButton('🗑 Reset')
+        reset_btn.setToolTip('Clear the statistics collected so far (the log file is kept)')
+        reset_btn.clicked.connect(self.reset_stats)
+        header_layout.addWidget(reset_btn)
+
+        header_layout.addWidget(self.summary)
+        header_layout.addStretch()
+        layout.addLayout(header_layout)
+
+        splitter = QSplitter(Qt.Orientation.Vertical)
+        for table, headers in ((self.statements, STATEMENT_HEADERS), (self.slow, SLOW_HEADERS)):
+            table.setHorizontalHeaderLabels(headers)
+            table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+            table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+            table.horizontalHeader().setStretchLastSection(True)
+            table.verticalHeader().setVisible(False)
+            splitter.addWidget(table)
+        self.statements.setColumnWidth(0, 500)
+        layout.addWidget(splitter)
+
+        self.timer.setInterval(self.REFRESH_MS)
+        self.timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+        self.timer.start()
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def reset_stats(self):
+        query_stats.reset()
+        self.refresh()
+
+    def refresh(self):
+        stats = query_stats.snapshot()
+        self.statements.setSortingEnabled(False)
+        self.statements.setRowCount(len(stats))
+        for row, item in enumerate(stats):
+            statement = QTableWidgetItem(item['statement'])
+            statement.setToolTip(item['statement'])
+            self.statements.setItem(row, 0, statement)
+            values = (item['calls'], item['total_ms'], item['p50_ms'], item['p95_ms'], item['p99_ms'], item['max_ms'],
+                      item['rows'], item['bytes'])
+            for col, value in enumerate(values, start=1):
+                self.statements.setItem(row, col, _NumberItem(value, 0 if isinstance(value, int) else 1))
+        self.statements.setSortingEnabled(True)
+
+        slow = list(reversed(query_stats.slow))  # newest first
+        self.slow.setRowCount(len(slow))
+        for row, entry in enumerate(slow):
+            self.slow.setItem(row, 0, QTableWidgetItem(entry['time']))
+            self.slow.setItem(row, 1, _NumberItem(entry['duration_ms'], 1))
+            self.slow.setItem(row, 2, _NumberItem(entry['rows']))
+            self.slow.setItem(row, 3, _NumberItem(entry['bytes']))
+            statement = QTableWidgetItem(entry['statement'])
+            statement.setToolTip(entry['statement'])
+            self.slow.setItem(row, 4, statement)
+
+        calls = sum(item['calls'] for item in stats)
+        total_ms = sum(item['total_ms'] for item in stats)
+        self.summary.setText(f'{calls:,} queries, {total_ms / 1000:,.2f} s in total, {len(slow)} slow '
+                             f'(≥ {query_stats.slow_threshold * 1000:.0f} ms)')
@@ -0,0 +1,161 @@
+# 1. Standard Library
+import json
+
+# 2. Third Party Library
+import psycopg2
+from PySide6.QtCore import QObject, QRunnable, QSocketNotifier, QTimer
+
+# 3. Internal Library
+from core.utils.db_worker import QuerySignals, db_thread_pool
+from database.database_functions import get_connection_settings
+
+CHANNEL = 'crm_changes'
+
+
+class _ListenTask(QRunnable):
+    """Open the listening connection on a worker thread, emits it as `finished` or the error as `failed`."""
+    def __init__(self, connect, attempt):
+        super().__init__()
+        self.connect = connect
+        self.attempt = attempt  # ChangeListener._attempt when started, a newer start or stop makes it stale
+        self.signals = QuerySignals()
+
+    def run(self):
+        db = None
+        try:
+            db = self.connect()
+            db.autocommit = True
+            with db.cursor() as cur:
+                cur.execute(f'LISTEN {CHANNEL};')
+        except psycopg2.Error as e:
+            if db is not None:  # connected, but LISTEN failed
+                db.close()
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(db)
+
+
+class ChangeListener(QObject):
+    """
+    Push row changes made by other sessions into the open pages.
+
+    The triggers from database/migrations/002_change_notify_triggers.sql NOTIFY the
+    table and primary key of every changed row. The listener keeps one dedicated
+    autocommit connection LISTENing and is woken up by a QSocketNotifier on its
+    socket, so nothing polls. The connection is opened on the database thread
+    pool, so an unreachable server never blocks the GUI. Notifications are collected for `batch_delay` ms,
+    then each registered page fetches only the affected rows.
+
+    If the connection drops it reconnects with backoff and asks every page for a
+    delta refresh, which covers the notifications sent while it was offline.
+
+    Args:
+        parent: Owning QObject (the main window).
+        connect: Optional factory returning a new connection (defaults to the .env settings).
+        batch_delay: Milliseconds to collect notifications before the rows are fetched.
+    """
+    RECONNECT_DELAYS = (1, 2, 5, 10, 30)  # Seconds, the last one repeats
+
+    def __init__(self, parent=None, connect=None, batch_delay: int = 50):
+        super().__init__(parent)
+        self._connect = connect or (lambda: psycopg2.connect(**get_connection_settings(), connect_timeout=5))
+        self.pages = {}  # Table name -> page showing it
+        self.db = None
+        self.notifier = None
+        self._pending = {}  # Table name -> IDs notified since the last flush
+        self._failures = 0
+        self._attempt = 0  # Counts starts and stops, tells a connect still running for an old start apart
+        self._listen_tasks = set()  # Connects running on the thread pool, kept alive until they report back
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(batch_delay)
+        self._flush_timer.timeout.connect(self._flush)
+
+        self._reconnect_timer = QTimer(self)
+        self._reconnect_timer.setSingleShot(True)
+        self._reconnect_timer.timeout.connect(self.start)
+
+    def register(self, page):
+        """Deliver changes of `page.table_name` to the page."""
+        self.pages[page.table_name] = page
+
+    def start(self):
+        """Open the listening connection in the background, retried later if the server is unreachable."""
+        self.stop()
+        self._attempt += 1
+        task = _ListenTask(self._connect, self._attempt)
+        task.signals.finished.connect(lambda db: self._on_connected(task, db))
+        task.signals.failed.connect(lambda error: self._on_connect_failed(task, error))
+        task.setAutoDelete(False)
+        self._listen_tasks.add(task)
+        db_thread_pool().start(task)
+
+    def stop(self):
+        self._reconnect_timer.stop()
+        self._attempt += 1  # a connect still running is closed when it finishes
+        if self.notifier is not None:
+            self.notifier.setEnabled(False)
+            self.notifier.deleteLater()
+            self.notifier = None
+        if self.db is not None:
+            if not self.db.closed:
+                self.db.close()
+            self.db = None
+
+    def is_listening(self) -> bool:
+        return self.db is not None
+
+    def _on_connected(self, task, db):
+        self._listen_tasks.discard(task)
+        if task.attempt != self._attempt:  # stopped or restarted meanwhile
+            db.close()
+            return
+        self.db = db
+        self.notifier = QSocketNotifier(db.fileno(), QSocketNotifier.Type.Read, self)
+        self.notifier.activated.connect(self._on_readable)
+
+        if self._failures:  # Notifications sent while disconnected are lost, catch up instead
+            for page in self.pages.values():
+                page.catch_up_changes()
+        self._failures = 0
+
+    def _on_connect_failed(self, task, error):
+        self._listen_tasks.discard(task)
+        if task.attempt != self._attempt:
+            return
+        print('Change listener could not connect:', error)
+        self._schedule_reconnect()
+
+    def _schedule_reconnect(self):
+        delay = self.RECONNECT_DELAYS[min(self._failures, len(self.RECONNECT_DELAYS) - 1)]
+        self._failures += 1
+        self._reconnect_timer.start(delay * 1000)
+
+    def _on_readable(self):
+        try:
+            self.db.poll()
+        except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+            print('Change listener lost its connection:', e)
+            self.stop()
+            self._schedule_reconnect()
+            return
+
+        while self.db.notifies:
+            self._queue(self.db.notifies.pop(0).payload)
+        if self._pending and not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _queue(self, payload: str):
+        try:
+            change = json.loads(payload)
+            table, row_id = change['table'], change['id']
+        except (ValueError, KeyError, TypeError):
+            return
+        if table in self.pages and row_id is not None:
+            self._pending.setdefault(table, set()).add(row_id)
+
+    def _flush(self):
+        pending, self._pending = self._pending, {}
+        for table, ids in pending.items():
+            self.pages[table].apply_notified_changes(ids)
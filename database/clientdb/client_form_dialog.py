@@ -5,17 +5,7 @@ from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import QApplication, QComboBox, QHBoxLayout, QLabel, QLineEdit, QTextEdit, QVBoxLayout
 
 # 3. Internal Library
-from core import (
-    FormDialog,
-    edit_entity,
-    entity_name_exists,
-    insert_entity,
-    update_counter,
-    validate_characters,
-    validate_max_length,
-    validate_required,
-    validate_selection,
-)
+from core import FormDialog, check_characters, check_max_length, check_required, check_selection, update_counter
 
 client_types = ['VIP', 'Client']
 client_status = ['Active', 'Inactive']
@@ -121,95 +111,74 @@ class ClientFormDialog(FormDialog):
     def add_client(self):
         if not self.validate_inputs():
             return
-
-        name = self.input_name.text()
-        contact = self.input_contact.text()
-        client_type = self.input_type.currentText()
-        status = self.input_status.currentText()
-        description = self.input_desc.toPlainText()
-
-        # 🔎 Check uniqueness
-        name_exist = entity_name_exists(self.conn, self.table_name, 'client_name', name)
-        if not self.handle_duplicate_name(self.input_name, 'Client', name, name_exist):
-            return
-
-        data = {
-            'client_name': name,
-            'client_contact': contact,
-            'client_type': client_type,
-            'status': status,
-            'description': description,
-        }
-        client_data = insert_entity(self.conn, self.table_name, data, 'client_id', 'Client')
-        self.data_added.emit(client_data)
-        self.accept()
+        self.save_entity('Client', 'client_name', 'client_id', self.form_record(), self.data_added)
 
     def manage_client(self):
         if not self.validate_inputs():
             return
 
-        new_name = self.input_name.text()
-        client_id = self.client_data.get('client_id')
-
-        # 🔎 Check uniqueness
-        name_exist = entity_name_exists(self.conn, self.table_name, 'client_name',
-                                        new_name, 'client_id', exclude_id=client_id)
-        if not self.handle_duplicate_name(self.input_name, 'Client', new_name, name_exist):
-            return
-
         client_data = {
             'client_id': self.client_data.get('client_id'),
+            **self.form_record(),
+        }
+        self.save_entity('Client', 'client_name', 'client_id', client_data, self.data_edited)
+
+    def form_record(self) -> dict:
+        """Current input values by column name."""
+        return {
             'client_name': self.input_name.text(),
             'client_contact': self.input_contact.text(),
             'client_type': self.input_type.currentText(),
             'status': self.input_status.currentText(),
-            'description': self.input_desc.toPlainText()
+            'description': self.input_desc.toPlainText(),
         }
 
-        client_data = edit_entity(self.conn, self.table_name, 'client_id',
-                                  client_data, 'Client')
-        self.data_edited.emit(client_data)
-        self.accept()
-
     def reset_name_highlight(self):
         self.input_name.setPalette(QApplication.palette())
 
-    def validate_inputs(self) -> bool:
-        """Validate all client fields."""
-        name = self.input_name.text()
-        contact = self.input_contact.text()
-        client_type = self.input_type.currentText()
-        status = self.input_status.currentText()
-        description = self.input_desc.toPlainText()
+    @staticmethod
+    def record_errors(record: dict) -> list:
+        """Validate a client record (form input or imported CSV row), returns (column, message) pairs."""
+        errors = []
+        name = record.get('client_name') or ''
+        contact = record.get('client_contact') or ''
+        description = record.get('description') or ''
 
         # Validate name
-        if not (validate_required(name, 'Client Name', self) and
-                validate_max_length(name, 100, 'Client Name', self) and
-                validate_characters(name, r'[A-Za-z0-9\s]+', 'Client Name', self)):
-            self.input_name.setFocus()
-            return False
+        error = (check_required(name, 'Client Name') or
+                 check_max_length(name, 100, 'Client Name') or
+                 check_characters(name, r'[A-Za-z0-9\s]+', 'Client Name'))
+        if error:
+            errors.append(('client_name', error))
 
         # Validate contact (optional)
         if contact:
-            if not (validate_max_length(contact, 50, 'Client Contact', self) and
-                    validate_characters(contact, r'[A-Za-z0-9\s\+\-\(\)]*',
-                                        'Client Contact', self)):
-                self.input_contact.setFocus()
-                return False
+            error = (check_max_length(contact, 50, 'Client Contact') or
+                     check_characters(contact, r'[A-Za-z0-9\s\+\-\(\)]*', 'Client Contact'))
+            if error:
+                errors.append(('client_contact', error))
 
         # Validate type and status
-        if not validate_selection(client_type, client_types, 'Client Type', self):
-            self.input_type.setFocus()
-            return False
-
-        if not validate_selection(status, client_status, 'Status', self):
-            self.input_status.setFocus()
-            return False
+        error = check_selection(record.get('client_type') or '', client_types, 'Client Type')
+        if error:
+            errors.append(('client_type', error))
+        error = check_selection(record.get('status') or '', client_status, 'Status')
+        if error:
+            errors.append(('status', error))
 
         # Validate description (optional)
-        if (description and
-                not validate_max_length(description, 500, 'Description', self)):
-            self.input_desc.setFocus()
-            return False
+        error = check_max_length(description, 500, 'Description') if description else None
+        if error:
+            errors.append(('description', error))
+
+        return errors
 
-        return True
+    def validate_inputs(self) -> bool:
+        """Validate all client fields."""
+        return self.check_record(self.form_record(), {
+            'client_name': self.input_name,
+            'client_contact': self.input_contact,
+            'client_type': self.input_type,
+            'status': self.input_status,
+            'description': self.input_desc,
+        })
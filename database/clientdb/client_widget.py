@@ -5,6 +5,7 @@
 # 3. Internal Library
 from core import BasePageWidget
 from database.clientdb import ClientFormDialog
+from database.clientdb.client_form_dialog import client_status, client_types
 
 # Define the column order matching your QTableWidget
 COLUMN_ORDER = [
@@ -29,6 +30,18 @@ HEADERS = [
     'Updated At'
 ]
 
+# Low-cardinality columns, stored dictionary-encoded
+CATEGORY_COLUMNS = [
+    'client_type',
+    'status',
+]
+
+# Fields that can be set on several selected rows at once, with their allowed values
+BULK_FIELDS = {
+    'client_type': client_types,
+    'status': client_status,
+}
+
 
 class ClientPage(BasePageWidget):
     def __init__(self, parent=None, dev_mode=False, conn=None):
@@ -40,5 +53,7 @@ class ClientPage(BasePageWidget):
             column_order=COLUMN_ORDER,
             headers=HEADERS,
             dialog_class=ClientFormDialog,
+            category_columns=CATEGORY_COLUMNS,
+            bulk_fields=BULK_FIELDS,
             data_name='Client'
         )
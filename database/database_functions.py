@@ -1,27 +1,256 @@
 # 1. Standard Library
 import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
 
 # 2. Third Party Library
 from dotenv import load_dotenv
 import psycopg2  # noqa: I001
+from psycopg2 import extensions
+from psycopg2.pool import PoolError
 
 # 3. Internal Library
+from core.utils.query_stats import InstrumentedCursor
+
+
+@lru_cache(maxsize=1)
+def get_connection_settings() -> dict:
+    """Read the connection settings from the environment (.env is loaded only once)."""
+    # TODO: Set up login for database protection
+    load_dotenv()
+    # DATABASE_URL = os.getenv('DATABASE_URL')
+    return {
+        'host': os.getenv('DB_HOST'),
+        'port': os.getenv('DB_PORT'),
+        'dbname': os.getenv('DB_NAME'),
+        'user': os.getenv('DB_USER'),
+        'password': os.getenv('DB_PASS'),
+    }
 
 
 def get_connection():
     try:
-        # TODO: Set up login for database protection
-        load_dotenv()
-        # DATABASE_URL = os.getenv('DATABASE_URL')
-        # conn = psycopg2.connect(DATABASE_URL)
-        conn = psycopg2.connect(
-            host=os.getenv('DB_HOST'),
-            port=os.getenv('DB_PORT'),
-            dbname=os.getenv('DB_NAME'),
-            user=os.getenv('DB_USER'),
-            password=os.getenv('DB_PASS'),
-        )
+        conn = psycopg2.connect(**get_connection_settings(), cursor_factory=InstrumentedCursor)
         return conn
     except Exception as e:
         print('Database connection failed:', e)
         return None
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of psycopg2 connections.
+
+    Connections are validated on checkout and silently replaced when the server
+    dropped them, so a network blip only costs a reconnect instead of a restart.
+    Nothing is opened by the constructor: connections open on checkout, or up
+    front with `prefill` on a worker thread, so an unreachable server never
+    blocks the thread that builds the pool.
+
+    Args:
+        min_size: Connections `prefill` opens up front (best effort, failures are retried on checkout).
+        max_size: Hard limit of open connections; extra callers wait for a free one.
+        timeout: Seconds a caller waits for a free connection before PoolError is raised.
+        validate_idle: Connections idle longer than this (seconds) are pinged before reuse.
+        retries: Connection attempts before giving up on a checkout.
+        backoff: Initial delay (seconds) between attempts, doubled after every failure.
+        connect_timeout: Seconds a connection attempt may take (libpq connect_timeout).
+        connect: Optional factory returning a new connection (defaults to the .env settings,
+            with every statement timed by InstrumentedCursor).
+    """
+    def __init__(self, min_size: int = 1, max_size: int = 5, timeout: float = 10.0,
+                 validate_idle: float = 5.0, retries: int = 3, backoff: float = 0.5, connect_timeout: int = 5,
+                 connect=None):
+        self.min_size = min_size
+        self.max_size = max(max_size, min_size, 1)
+        self.timeout = timeout
+        self.validate_idle = validate_idle
+        self.retries = retries
+        self.backoff = backoff
+        self.connect_timeout = connect_timeout
+        self._connect = connect or (
+            lambda: psycopg2.connect(**get_connection_settings(), connect_timeout=self.connect_timeout,
+                                     cursor_factory=InstrumentedCursor))
+
+        self._cond = threading.Condition()
+        self._idle = deque()  # (conn, last_used) pairs, most recently used on the right
+        self._checked_out = {}  # id(conn) -> checkout time
+        self._size = 0
+        self._closed = False
+        self._stats = {
+            'checkouts': 0,
+            'wait_total': 0.0,
+            'wait_max': 0.0,
+            'hold_total': 0.0,
+            'hold_max': 0.0,
+            'connects': 0,
+            'reconnects': 0,
+            'failed_connects': 0,
+            'timeouts': 0,
+        }
+
+    def prefill(self):
+        """
+        Open connections up to `min_size` (best effort, the first failure stops it).
+        Connecting can take `retries` x `connect_timeout`, run it on a worker thread.
+        """
+        while True:
+            with self._cond:
+                if self._closed or self._size >= self.min_size:
+                    return
+                self._size += 1  # reserve the slot before connecting outside the lock
+            try:
+                conn = self._open()
+            except psycopg2.Error as e:
+                with self._cond:
+                    self._size -= 1
+                    self._cond.notify()
+                print('Database connection failed:', e)
+                return
+            with self._cond:
+                if self._closed:
+                    self._close_quietly(conn)
+                    self._size -= 1
+                    return
+                self._idle.append((conn, time.monotonic()))
+                self._cond.notify()
+
+    @contextmanager
+    def connection(self):
+        """Check out a connection for the duration of the `with` block."""
+        conn = self.getconn()
+        try:
+            yield conn
+        finally:
+            self.putconn(conn)
+
+    def getconn(self):
+        """Return a validated connection, opening or reconnecting one if needed."""
+        started = time.perf_counter()
+        deadline = time.monotonic() + self.timeout
+
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise PoolError('connection pool is closed')
+                if self._idle:
+                    conn, last_used = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    self._size += 1  # reserve the slot before connecting outside the lock
+                    conn, last_used = None, None
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stats['timeouts'] += 1
+                    raise PoolError(f'no free connection after {self.timeout:.0f}s')
+                self._cond.wait(remaining)
+
+        try:
+            if conn is None:
+                conn = self._open()
+            elif not self._is_alive(conn, last_used):
+                self._close_quietly(conn)
+                conn = self._open()
+                with self._cond:
+                    self._stats['reconnects'] += 1
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+
+        waited = time.perf_counter() - started
+        with self._cond:
+            self._checked_out[id(conn)] = time.perf_counter()
+            self._stats['checkouts'] += 1
+            self._stats['wait_total'] += waited
+            self._stats['wait_max'] = max(self._stats['wait_max'], waited)
+        return conn
+
+    def putconn(self, conn, discard: bool = False):
+        """Give a connection back; broken or discarded connections are closed instead."""
+        with self._cond:
+            checked_out_at = self._checked_out.pop(id(conn), None)
+            if checked_out_at is not None:
+                held = time.perf_counter() - checked_out_at
+                self._stats['hold_total'] += held
+                self._stats['hold_max'] = max(self._stats['hold_max'], held)
+
+        if not discard and not conn.closed:
+            try:
+                # Never hand out a connection stuck in an open or aborted transaction
+                if conn.info.transaction_status != extensions.TRANSACTION_STATUS_IDLE:
+                    conn.rollback()
+            except psycopg2.Error:
+                discard = True
+
+        with self._cond:
+            if discard or conn.closed or self._closed:
+                self._close_quietly(conn)
+                self._size -= 1
+            else:
+                self._idle.append((conn, time.monotonic()))
+            self._cond.notify()
+
+    def closeall(self):
+        """Close every idle connection and refuse further checkouts."""
+        with self._cond:
+            self._closed = True
+            while self._idle:
+                conn, _ = self._idle.pop()
+                self._close_quietly(conn)
+                self._size -= 1
+            self._cond.notify_all()
+
+    def stats(self) -> dict:
+        """Snapshot of pool sizing and per-checkout timings (seconds)."""
+        with self._cond:
+            stats = dict(self._stats)
+            stats['size'] = self._size
+            stats['idle'] = len(self._idle)
+            stats['in_use'] = len(self._checked_out)
+        checkouts = stats['checkouts'] or 1
+        stats['wait_avg'] = stats['wait_total'] / checkouts
+        stats['hold_avg'] = stats['hold_total'] / checkouts
+        return stats
+
+    def _open(self):
+        """Open a new connection, retrying with exponential backoff."""
+        delay = self.backoff
+        for attempt in range(1, self.retries + 1):
+            try:
+                conn = self._connect()
+                with self._cond:
+                    self._stats['connects'] += 1
+                return conn
+            except psycopg2.OperationalError:
+                with self._cond:
+                    self._stats['failed_connects'] += 1
+                if attempt == self.retries:
+                    raise
+                time.sleep(delay)
+                delay *= 2
+
+    def _is_alive(self, conn, last_used: float) -> bool:
+        if conn.closed:
+            return False
+        if time.monotonic() - last_used < self.validate_idle:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute('SELECT 1')
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    @staticmethod
+    def _close_quietly(conn):
+        try:
+            conn.close()
+        except psycopg2.Error:
+            pass
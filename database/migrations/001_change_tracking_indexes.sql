@@ -0,0 +1,15 @@
+-- Indexes for the incremental refresh (BasePageWidget.refresh_changes), which asks for
+-- `updated_at >= since OR deleted_at >= since`; Postgres answers it with a BitmapOr over both.
+-- Applies to the production tables and their _dev copies, whichever exist.
+DO $$
+DECLARE
+    tbl text;
+BEGIN
+    FOREACH tbl IN ARRAY ARRAY['client', 'supplier', 'partner', 'client_dev', 'supplier_dev', 'partner_dev'] LOOP
+        IF to_regclass(tbl) IS NOT NULL THEN
+            EXECUTE format('CREATE INDEX IF NOT EXISTS %I ON %I (updated_at)', tbl || '_updated_at_idx', tbl);
+            EXECUTE format('CREATE INDEX IF NOT EXISTS %I ON %I (deleted_at) WHERE deleted_at IS NOT NULL',
+                           tbl || '_deleted_at_idx', tbl);
+        END IF;
+    END LOOP;
+END $$;
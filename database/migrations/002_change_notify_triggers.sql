@@ -0,0 +1,39 @@
+-- Live change feed for ChangeListener (database/change_listener.py).
+-- Every insert, update (soft deletes included) or delete on an entity table sends
+-- NOTIFY crm_changes '{"table": ..., "id": ..., "op": ...}'. Postgres delivers it on
+-- commit and drops duplicates within one transaction, so bulk statements stay cheap.
+CREATE OR REPLACE FUNCTION crm_notify_change() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    changed jsonb;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        changed := to_jsonb(OLD);
+    ELSE
+        changed := to_jsonb(NEW);
+    END IF;
+
+    PERFORM pg_notify('crm_changes', json_build_object(
+        'table', TG_TABLE_NAME,
+        'id', (changed ->> TG_ARGV[0])::bigint,
+        'op', TG_OP
+    )::text);
+    RETURN NULL;
+END $$;
+
+-- The primary key column is passed to the trigger function (client_dev -> client_id)
+DO $$
+DECLARE
+    tbl text;
+BEGIN
+    FOREACH tbl IN ARRAY ARRAY['client', 'supplier', 'partner', 'client_dev', 'supplier_dev', 'partner_dev'] LOOP
+        IF to_regclass(tbl) IS NOT NULL THEN
+            EXECUTE format('DROP TRIGGER IF EXISTS %I ON %I', tbl || '_notify_change', tbl);
+            EXECUTE format(
+                'CREATE TRIGGER %I AFTER INSERT OR UPDATE OR DELETE ON %I '
+                'FOR EACH ROW EXECUTE FUNCTION crm_notify_change(%L)',
+                tbl || '_notify_change', tbl, split_part(tbl, '_', 1) || '_id'
+            );
+        END IF;
+    END LOOP;
+END $$;
@@ -0,0 +1,21 @@
+-- Trigram indexes for the server-side search (BasePageWidget.filter_clause), which runs
+-- `<column> ILIKE '%text%'`; a B-tree cannot serve a leading wildcard, a pg_trgm GIN index can.
+-- Needs the pg_trgm extension (contrib), creating it requires the CREATE privilege on the database.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+DO $$
+DECLARE
+    tbl text;
+    entity text;
+    col text;
+BEGIN
+    FOREACH tbl IN ARRAY ARRAY['client', 'supplier', 'partner', 'client_dev', 'supplier_dev', 'partner_dev'] LOOP
+        IF to_regclass(tbl) IS NOT NULL THEN
+            entity := split_part(tbl, '_', 1);
+            FOREACH col IN ARRAY ARRAY[entity || '_name', entity || '_contact', 'description'] LOOP
+                EXECUTE format('CREATE INDEX IF NOT EXISTS %I ON %I USING gin (%I gin_trgm_ops)',
+                               tbl || '_' || col || '_trgm_idx', tbl, col);
+            END LOOP;
+        END IF;
+    END LOOP;
+END $$;
@@ -0,0 +1,16 @@
+-- Partial unique indexes on the entity names of active rows, so FormDialog.save_entity can insert with
+-- `ON CONFLICT (<entity>_name) WHERE deleted_at IS NULL DO NOTHING` (and update relying on the index)
+-- instead of a separate SELECT before the write. Soft-deleted rows keep their names without blocking reuse.
+-- Fails if active rows already share a name, list them first with:
+--   SELECT <entity>_name, count(*) FROM <table> WHERE deleted_at IS NULL GROUP BY 1 HAVING count(*) > 1;
+DO $$
+DECLARE
+    tbl text;
+BEGIN
+    FOREACH tbl IN ARRAY ARRAY['client', 'supplier', 'partner', 'client_dev', 'supplier_dev', 'partner_dev'] LOOP
+        IF to_regclass(tbl) IS NOT NULL THEN
+            EXECUTE format('CREATE UNIQUE INDEX IF NOT EXISTS %I ON %I (%I) WHERE deleted_at IS NULL',
+                           tbl || '_name_active_key', tbl, split_part(tbl, '_', 1) || '_name');
+        END IF;
+    END LOOP;
+END $$;
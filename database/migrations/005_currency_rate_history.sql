@@ -0,0 +1,20 @@
+-- Daily exchange rate history kept by the currency rate service (core/utils/rate_history.py), one row per
+-- provider update and currency, for converting invoices at the rate of their date.
+-- The primary key (base, currency, rate_date) answers both "rate at date D" (the latest row on or before D)
+-- and "series between D1 and D2" with an index range scan.
+DO $$
+DECLARE
+    tbl text;
+BEGIN
+    FOREACH tbl IN ARRAY ARRAY['currency_rate', 'currency_rate_dev'] LOOP
+        EXECUTE format('
+            CREATE TABLE IF NOT EXISTS %I (
+                base char(3) NOT NULL,
+                currency char(3) NOT NULL,
+                rate_date date NOT NULL,
+                rate double precision NOT NULL,
+                updated_at timestamptz NOT NULL,
+                PRIMARY KEY (base, currency, rate_date)
+            )', tbl);
+    END LOOP;
+END $$;
@@ -5,16 +5,7 @@ from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import QApplication, QHBoxLayout, QLabel, QLineEdit, QTextEdit, QVBoxLayout
 
 # 3. Internal Library
-from core import (
-    FormDialog,
-    edit_entity,
-    entity_name_exists,
-    insert_entity,
-    update_counter,
-    validate_characters,
-    validate_max_length,
-    validate_required,
-)
+from core import FormDialog, check_characters, check_max_length, check_required, update_counter
 
 
 class PartnerFormDialog(FormDialog):
@@ -100,78 +91,62 @@ class PartnerFormDialog(FormDialog):
     def add_partner(self):
         if not self.validate_inputs():
             return
-
-        name = self.input_name.text()
-        contact = self.input_contact.text()
-        description = self.input_desc.toPlainText()
-
-        # 🔎 Check uniqueness
-        name_exist = entity_name_exists(self.conn, self.table_name, 'partner_name', name)
-        if not self.handle_duplicate_name(self.input_name, 'Partner', name, name_exist):
-            return
-
-        data = {
-            'partner_name': name,
-            'partner_contact': contact,
-            'description': description,
-        }
-        partner_data = insert_entity(self.conn, self.table_name, data, 'partner_id', 'Partner')
-        self.data_added.emit(partner_data)
-        self.accept()
+        self.save_entity('Partner', 'partner_name', 'partner_id', self.form_record(), self.data_added)
 
     def manage_partner(self):
         if not self.validate_inputs():
             return
 
-        new_name = self.input_name.text()
-        partner_id = self.partner_data.get('partner_id')
-
-        # 🔎 Check uniqueness
-        name_exist = entity_name_exists(self.conn, self.table_name, 'partner_name',
-                                        new_name, 'partner_id', exclude_id=partner_id)
-        if not self.handle_duplicate_name(self.input_name, 'Partner', new_name, name_exist):
-            return
-
         partner_data = {
             'partner_id': self.partner_data.get('partner_id'),
+            **self.form_record(),
+        }
+        self.save_entity('Partner', 'partner_name', 'partner_id', partner_data, self.data_edited)
+
+    def form_record(self) -> dict:
+        """Current input values by column name."""
+        return {
             'partner_name': self.input_name.text(),
             'partner_contact': self.input_contact.text(),
-            'description': self.input_desc.toPlainText()
+            'description': self.input_desc.toPlainText(),
         }
 
-        partner_data = edit_entity(self.conn, self.table_name, 'partner_id',
-                                   partner_data, 'Partner')
-        self.data_edited.emit(partner_data)
-        self.accept()
-
     def reset_name_highlight(self):
         self.input_name.setPalette(QApplication.palette())
 
-    def validate_inputs(self) -> bool:
-        """Validate all client fields."""
-        name = self.input_name.text()
-        contact = self.input_contact.text()
-        description = self.input_desc.toPlainText()
+    @staticmethod
+    def record_errors(record: dict) -> list:
+        """Validate a partner record (form input or imported CSV row), returns (column, message) pairs."""
+        errors = []
+        name = record.get('partner_name') or ''
+        contact = record.get('partner_contact') or ''
+        description = record.get('description') or ''
 
         # Validate name
-        if not (validate_required(name, 'Partner Name', self) and
-                validate_max_length(name, 100, 'Partner Name', self) and
-                validate_characters(name, r'[A-Za-z0-9\s]+', 'Partner Name', self)):
-            self.input_name.setFocus()
-            return False
+        error = (check_required(name, 'Partner Name') or
+                 check_max_length(name, 100, 'Partner Name') or
+                 check_characters(name, r'[A-Za-z0-9\s]+', 'Partner Name'))
+        if error:
+            errors.append(('partner_name', error))
 
         # Validate contact (optional)
         if contact:
-            if not (validate_max_length(contact, 50, 'Partner Contact', self) and
-                    validate_characters(contact, r'[A-Za-z0-9\s\+\-\(\)]*',
-                                        'Partner Contact', self)):
-                self.input_contact.setFocus()
-                return False
+            error = (check_max_length(contact, 50, 'Partner Contact') or
+                     check_characters(contact, r'[A-Za-z0-9\s\+\-\(\)]*', 'Partner Contact'))
+            if error:
+                errors.append(('partner_contact', error))
 
         # Validate description (optional)
-        if (description and
-                not validate_max_length(description, 500, 'Description', self)):
-            self.input_desc.setFocus()
-            return False
+        error = check_max_length(description, 500, 'Description') if description else None
+        if error:
+            errors.append(('description', error))
+
+        return errors
 
-        return True
+    def validate_inputs(self) -> bool:
+        """Validate all partner fields."""
+        return self.check_record(self.form_record(), {
+            'partner_name': self.input_name,
+            'partner_contact': self.input_contact,
+            'description': self.input_desc,
+        })
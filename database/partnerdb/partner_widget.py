@@ -25,6 +25,9 @@ HEADERS = [
     'Updated At'
 ]
 
+# Low-cardinality columns, stored dictionary-encoded
+CATEGORY_COLUMNS = []
+
 
 class PartnerPage(BasePageWidget):
     def __init__(self, parent=None, dev_mode=False, conn=None):
@@ -36,5 +39,6 @@ class PartnerPage(BasePageWidget):
             column_order=COLUMN_ORDER,
             headers=HEADERS,
             dialog_class=PartnerFormDialog,
+            category_columns=CATEGORY_COLUMNS,
             data_name='Partner'
         )
@@ -1,4 +1,5 @@
 # 1. Standard Library
+from datetime import date
 
 # 2. Third Party Library
 from PySide6.QtCore import QDate, Qt, Signal
@@ -10,23 +11,12 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QLineEdit,
-    QMessageBox,
     QTextEdit,
     QVBoxLayout,
 )
 
 # 3. Internal Library
-from core import (
-    FormDialog,
-    edit_entity,
-    entity_name_exists,
-    insert_entity,
-    update_counter,
-    validate_characters,
-    validate_max_length,
-    validate_required,
-    validate_selection,
-)
+from core import FormDialog, check_characters, check_max_length, check_required, check_selection, update_counter
 
 supplier_types = ['Direct', 'Aggregator', 'White Label', 'Payment Gateway', 'Other']
 supplier_status = ['Active', 'Inactive']
@@ -194,63 +184,31 @@ class SupplierFormDialog(FormDialog):
     def add_supplier(self):
         if not self.validate_inputs():
             return
-
-        name = self.input_name.text()
-        contact = self.input_contact.text()
-        supplier_type = self.input_type.currentText()
-        status = self.input_status.currentText()
-        description = self.input_desc.toPlainText()
-
-        # 🔎 Check uniqueness
-        name_exist = entity_name_exists(self.conn, self.table_name, 'supplier_name', name)
-
-        if not self.handle_duplicate_name(self.input_name, 'Supplier', name, name_exist):
-            return
-
-        # Handle dates (optional)
-        contract_start = (
-            self.input_start_date.date().toString('yyyy-MM-dd')
-            if self.start_checkbox.isChecked()
-            else None
-        )
-        contract_end = (
-            self.input_end_date.date().toString('yyyy-MM-dd')
-            if self.end_checkbox.isChecked()
-            else None
-        )
-
-        data = {
-            'supplier_name': name,
-            'supplier_contact': contact,
-            'supplier_type': supplier_type,
-            'supplier_status': status,
-            'description': description,
-            'contract_start': contract_start,
-            'contract_end': contract_end,
-        }
-        supplier_data = insert_entity(self.conn, self.table_name, data, 'supplier_id', 'Supplier')
-        self.data_added.emit(supplier_data)
-        self.accept()
+        self.save_entity('Supplier', 'supplier_name', 'supplier_id', self.form_record(), self.data_added)
 
     def manage_supplier(self):
         if not self.validate_inputs():
             return
 
-        new_name = self.input_name.text()
-        supplier_id = self.supplier_data.get('supplier_id')
-
-        # 🔎 Check uniqueness
-        name_exist = entity_name_exists(self.conn, self.table_name, 'supplier_name',
-                                        new_name, 'supplier_id', exclude_id=supplier_id)
-        if not self.handle_duplicate_name(self.input_name, 'Supplier', new_name, name_exist):
-            return
-        elif name_exist is None:
-            self.accept()
+        supplier_data = {
+            'supplier_id': self.supplier_data.get('supplier_id'),
+            **self.form_record(),
+        }
+        self.save_entity('Supplier', 'supplier_name', 'supplier_id', supplier_data, self.data_edited)
 
-        # ✅ If OK, reset palette back to normal
-        self.input_name.setPalette(QApplication.palette())
+    def form_record(self) -> dict:
+        """Current input values by column name."""
+        return {
+            'supplier_name': self.input_name.text(),
+            'supplier_contact': self.input_contact.text(),
+            'supplier_type': self.input_type.currentText(),
+            'supplier_status': self.input_status.currentText(),
+            'description': self.input_desc.toPlainText(),
+            **self.contract_dates(),
+        }
 
-        # Handle dates (optional)
+    def contract_dates(self) -> dict:
+        """Contract dates as 'yyyy-MM-dd' strings, None when the checkbox is off."""
         contract_start = (
             self.input_start_date.date().toString('yyyy-MM-dd')
             if self.start_checkbox.isChecked()
@@ -261,84 +219,71 @@ class SupplierFormDialog(FormDialog):
             if self.end_checkbox.isChecked()
             else None
         )
-
-        supplier_data = {
-            'supplier_id': supplier_id,
-            'supplier_name': self.input_name.text(),
-            'supplier_contact': self.input_contact.text(),
-            'supplier_type': self.input_type.currentText(),
-            'supplier_status': self.input_status.currentText(),
-            'description': self.input_desc.toPlainText(),
-            'contract_start': contract_start,
-            'contract_end': contract_end,
-        }
-
-        supplier_data = edit_entity(self.conn, self.table_name,
-                                    'supplier_id', supplier_data, 'Supplier')
-        self.data_edited.emit(supplier_data)
-        self.accept()
+        return {'contract_start': contract_start, 'contract_end': contract_end}
 
     def reset_name_highlight(self):
         self.input_name.setPalette(QApplication.palette())
 
-    def validate_inputs(self) -> bool:
-        """Validate all client fields."""
-        name = self.input_name.text()
-        contact = self.input_contact.text()
-        supplier_type = self.input_type.currentText()
-        status = self.input_status.currentText()
-        description = self.input_desc.toPlainText()
+    @staticmethod
+    def record_errors(record: dict) -> list:
+        """Validate a supplier record (form input or imported CSV row), returns (column, message) pairs."""
+        errors = []
+        name = record.get('supplier_name') or ''
+        contact = record.get('supplier_contact') or ''
+        description = record.get('description') or ''
 
         # Validate name
-        if not (validate_required(name, 'Supplier Name', self) and
-                validate_max_length(name, 100, 'Supplier Name', self) and
-                validate_characters(name, r'[A-Za-z0-9\s]+', 'Supplier Name', self)):
-            self.input_name.setFocus()
-            return False
+        error = (check_required(name, 'Supplier Name') or
+                 check_max_length(name, 100, 'Supplier Name') or
+                 check_characters(name, r'[A-Za-z0-9\s]+', 'Supplier Name'))
+        if error:
+            errors.append(('supplier_name', error))
 
         # Validate contact (optional)
         if contact:
-            if not (validate_max_length(contact, 50, 'Supplier Contact', self) and
-                    validate_characters(contact, r'[A-Za-z0-9\s\+\-\(\)]*',
-                                        'Supplier Contact', self)):
-                self.input_contact.setFocus()
-                return False
+            error = (check_max_length(contact, 50, 'Supplier Contact') or
+                     check_characters(contact, r'[A-Za-z0-9\s\+\-\(\)]*', 'Supplier Contact'))
+            if error:
+                errors.append(('supplier_contact', error))
 
         # Validate type and status
-        if not validate_selection(supplier_type, supplier_types, 'Supplier Type', self):
-            self.input_type.setFocus()
-            return False
-
-        if not validate_selection(status, supplier_status, 'Status', self):
-            self.input_status.setFocus()
-            return False
+        error = check_selection(record.get('supplier_type') or '', supplier_types, 'Supplier Type')
+        if error:
+            errors.append(('supplier_type', error))
+        error = check_selection(record.get('supplier_status') or '', supplier_status, 'Status')
+        if error:
+            errors.append(('supplier_status', error))
 
         # Validate description (optional)
-        if (description and
-                not validate_max_length(description, 500, 'Description', self)):
-            self.input_desc.setFocus()
-            return False
+        error = check_max_length(description, 500, 'Description') if description else None
+        if error:
+            errors.append(('description', error))
 
         # --- Validate contract dates (optional) ---
-        # Start date
-        if self.start_checkbox.isChecked():
-            if not self.input_start_date.date().isValid():
-                self.input_start_date.setFocus()
-                QMessageBox.warning(self, 'Invalid Date', 'Please enter a valid Start Date.')
-                return False
-
-        # End date
-        if self.end_checkbox.isChecked():
-            if not self.input_end_date.date().isValid():
-                self.input_end_date.setFocus()
-                QMessageBox.warning(self, 'Invalid Date', 'Please enter a valid End Date.')
-                return False
+        start = end = None
+        try:
+            start = date.fromisoformat(record['contract_start']) if record.get('contract_start') else None
+        except ValueError:
+            errors.append(('contract_start', 'Please enter a valid Start Date.'))
+        try:
+            end = date.fromisoformat(record['contract_end']) if record.get('contract_end') else None
+        except ValueError:
+            errors.append(('contract_end', 'Please enter a valid End Date.'))
 
         # Optional: ensure start <= end
-        if self.start_checkbox.isChecked() and self.end_checkbox.isChecked():
-            if self.input_start_date.date() > self.input_end_date.date():
-                self.input_start_date.setFocus()
-                QMessageBox.warning(self, 'Invalid Dates', 'Start Date cannot be after End Date.')
-                return False
+        if start and end and start > end:
+            errors.append(('contract_start', 'Start Date cannot be after End Date.'))
 
-        return True
+        return errors
+
+    def validate_inputs(self) -> bool:
+        """Validate all supplier fields."""
+        return self.check_record(self.form_record(), {
+            'supplier_name': self.input_name,
+            'supplier_contact': self.input_contact,
+            'supplier_type': self.input_type,
+            'supplier_status': self.input_status,
+            'description': self.input_desc,
+            'contract_start': self.input_start_date,
+            'contract_end': self.input_end_date,
+        })
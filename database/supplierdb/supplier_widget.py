@@ -5,6 +5,7 @@
 # 3. Internal Library
 from core import BasePageWidget
 from database.supplierdb import SupplierFormDialog
+from database.supplierdb.supplier_form_dialog import supplier_status, supplier_types
 
 # Define the column order matching your QTableWidget
 COLUMN_ORDER = [
@@ -33,6 +34,18 @@ HEADERS = [
     'Updated At'
 ]
 
+# Low-cardinality columns, stored dictionary-encoded
+CATEGORY_COLUMNS = [
+    'supplier_type',
+    'supplier_status',
+]
+
+# Fields that can be set on several selected rows at once, with their allowed values
+BULK_FIELDS = {
+    'supplier_type': supplier_types,
+    'supplier_status': supplier_status,
+}
+
 
 class SupplierPage(BasePageWidget):
     def __init__(self, parent=None, dev_mode=False, conn=None):
@@ -44,5 +57,7 @@ class SupplierPage(BasePageWidget):
             column_order=COLUMN_ORDER,
             headers=HEADERS,
             dialog_class=SupplierFormDialog,
+            category_columns=CATEGORY_COLUMNS,
+            bulk_fields=BULK_FIELDS,
             data_name='Supplier'
         )
@@ -0,0 +1,42 @@
+# 1. Standard Library
+import os
+
+# 2. Third Party Library
+import pytest
+
+# 3. Internal Library
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+
+@pytest.fixture(scope='session')
+def qapp():
+    """The QApplication the models, timers and signals of a test need (offscreen, no display)."""
+    from PySide6.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def db():
+    """
+    Connection to the database of the .env settings with an empty temporary `item` table
+    (item_id, item_name unique among active rows, timestamps), skipped when no database is reachable.
+    """
+    from database.database_functions import get_connection
+    conn = get_connection()
+    if conn is None:
+        pytest.skip('no database')
+    with conn.cursor() as cur:
+        cur.execute('''
+            CREATE TEMPORARY TABLE item (
+                item_id serial PRIMARY KEY,
+                item_name text NOT NULL,
+                created_at timestamptz NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                updated_at timestamptz NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                deleted_at timestamptz
+            );
+            CREATE UNIQUE INDEX item_name_active_key ON item (item_name) WHERE deleted_at IS NULL;
+        ''')
+    conn.commit()
+    yield conn
+    conn.close()
@@ -0,0 +1,65 @@
+# 1. Standard Library
+
+# 2. Third Party Library
+import psycopg2
+import pytest
+
+# 3. Internal Library
+from database.change_listener import _ListenTask
+
+
+class FakeCursor:
+    def __init__(self, error):
+        self.error = error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def execute(self, sql):
+        if self.error:
+            raise self.error
+
+
+class FakeConnection:
+    """Stand-in for the listening connection, `error` is raised by LISTEN."""
+    def __init__(self, error=None):
+        self.error = error
+        self.autocommit = False
+        self.closed = 0
+
+    def cursor(self):
+        return FakeCursor(self.error)
+
+    def close(self):
+        self.closed = 1
+
+
+def run(task) -> list:
+    emitted = []
+    task.signals.finished.connect(lambda db: emitted.append(('finished', db)))
+    task.signals.failed.connect(lambda error: emitted.append(('failed', error)))
+    task.run()
+    return emitted
+
+
+def test_listen_hands_over_the_connection(qapp):
+    db = FakeConnection()
+    assert run(_ListenTask(lambda: db, 1)) == [('finished', db)]
+    assert db.autocommit and not db.closed
+
+
+@pytest.mark.parametrize('connected', [True, False])
+def test_a_failed_listen_closes_the_connection(qapp, connected):
+    db = FakeConnection(psycopg2.ProgrammingError('permission denied'))
+
+    def connect():
+        if not connected:
+            raise psycopg2.OperationalError('connection refused')
+        return db
+
+    emitted = run(_ListenTask(connect, 1))
+    assert emitted == [('failed', 'permission denied' if connected else 'connection refused')]
+    assert db.closed == int(connected)
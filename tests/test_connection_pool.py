@@ -0,0 +1,135 @@
+# 1. Standard Library
+import threading
+import time
+from types import SimpleNamespace
+
+# 2. Third Party Library
+import psycopg2
+import pytest
+from psycopg2 import extensions
+from psycopg2.pool import PoolError
+
+# 3. Internal Library
+from database.database_functions import ConnectionPool
+
+
+class FakeConnection:
+    """Stand-in for a psycopg2 connection, only what the pool touches."""
+    def __init__(self, number):
+        self.number = number
+        self.closed = 0
+        self.info = SimpleNamespace(transaction_status=extensions.TRANSACTION_STATUS_IDLE)
+        self.rollbacks = 0
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.info.transaction_status = extensions.TRANSACTION_STATUS_IDLE
+
+    def close(self):
+        self.closed = 1
+
+
+class Server:
+    """Connection factory counting the connections it opened, `down` makes it refuse them."""
+    def __init__(self):
+        self.opened = []
+        self.down = False
+
+    def connect(self):
+        if self.down:
+            raise psycopg2.OperationalError('connection refused')
+        self.opened.append(FakeConnection(len(self.opened) + 1))
+        return self.opened[-1]
+
+
+@pytest.fixture
+def server():
+    return Server()
+
+
+def make_pool(server, **options):
+    options = {'min_size': 1, 'max_size': 2, 'timeout': 0.2, 'retries': 2, 'backoff': 0.01, **options}
+    return ConnectionPool(connect=server.connect, **options)
+
+
+def test_nothing_opens_before_the_first_checkout_or_prefill(server):
+    pool = make_pool(server, min_size=2)
+    assert server.opened == [] and pool.stats()['size'] == 0
+    pool.prefill()
+    assert len(server.opened) == 2 and pool.stats()['idle'] == 2
+    pool.prefill()  # already at min_size
+    assert len(server.opened) == 2
+
+
+def test_prefill_with_the_server_down_gives_up_quietly(server):
+    server.down = True
+    pool = make_pool(server)
+    pool.prefill()
+    assert pool.stats()['size'] == 0 and pool.stats()['failed_connects'] == 2
+    server.down = False
+    with pool.connection() as conn:  # the checkout connects
+        assert conn is server.opened[0]
+
+
+def test_checkout_and_return_reuse_the_connection(server):
+    pool = make_pool(server)
+    with pool.connection() as first:
+        assert pool.stats()['in_use'] == 1
+    with pool.connection() as second:
+        assert second is first
+    stats = pool.stats()
+    assert stats['checkouts'] == 2 and stats['connects'] == 1 and stats['in_use'] == 0 and stats['idle'] == 1
+
+
+def test_a_connection_left_in_a_transaction_is_rolled_back(server):
+    pool = make_pool(server)
+    conn = pool.getconn()
+    conn.info.transaction_status = extensions.TRANSACTION_STATUS_INTRANS
+    pool.putconn(conn)
+    assert conn.rollbacks == 1 and not conn.closed and pool.stats()['idle'] == 1
+
+
+def test_discarded_and_closed_connections_are_replaced(server):
+    pool = make_pool(server)
+    conn = pool.getconn()
+    pool.putconn(conn, discard=True)
+    assert conn.closed and pool.stats()['size'] == 0
+
+    conn = pool.getconn()
+    pool.putconn(conn)
+    conn.closed = 1  # dropped by the server while idle
+    replacement = pool.getconn()
+    assert replacement is not conn and pool.stats()['reconnects'] == 1
+
+
+def test_overflow_waits_for_a_free_connection_then_times_out(server):
+    pool = make_pool(server, max_size=2)
+    held = [pool.getconn(), pool.getconn()]
+    started = time.monotonic()
+    with pytest.raises(PoolError):
+        pool.getconn()
+    assert time.monotonic() - started >= 0.2 and pool.stats()['timeouts'] == 1
+
+    threading.Timer(0.05, pool.putconn, (held[0],)).start()
+    assert pool.getconn() is held[0]  # handed over once returned, no third connection
+    assert len(server.opened) == 2
+
+
+def test_a_failed_connect_frees_its_slot(server):
+    pool = make_pool(server, max_size=1)
+    server.down = True
+    with pytest.raises(psycopg2.OperationalError):
+        pool.getconn()
+    server.down = False
+    assert pool.getconn() is server.opened[0]
+
+
+def test_closeall_refuses_checkouts(server):
+    pool = make_pool(server)
+    pool.prefill()
+    pool.closeall()
+    assert server.opened[0].closed
+    with pytest.raises(PoolError):
+        pool.getconn()
+    pool.prefill()  # no new connection for a closed pool
+    assert len(server.opened) == 1
@@ -0,0 +1,82 @@
+# 1. Standard Library
+from array import array
+from decimal import ROUND_DOWN, ROUND_HALF_EVEN, ROUND_HALF_UP, Decimal
+
+# 2. Third Party Library
+import pytest
+
+# 3. Internal Library
+from core.utils.currency_convert import CrossRateMatrix, from_minor, minor_units, to_minor
+
+RATES = {'USD': 1, 'EUR': 0.92, 'JPY': 150, 'KWD': 0.307, 'MYR': 4.5, 'SGD': 1.3542}
+
+
+@pytest.fixture
+def matrix():
+    return CrossRateMatrix(RATES)
+
+
+def test_preferred_currencies_come_first(matrix):
+    assert matrix.currencies == ['MYR', 'SGD', 'USD', 'EUR', 'JPY', 'KWD']
+    assert 'JPY' in matrix and 'GBP' not in matrix
+
+
+def test_minor_units():
+    assert [minor_units(code) for code in ('MYR', 'JPY', 'KWD')] == [2, 0, 3]
+    assert to_minor('12.345', 'KWD') == 12345 and to_minor(0.1, 'MYR') == 10 and to_minor('2.5', 'JPY') == 3
+    assert from_minor(12345, 'KWD') == Decimal('12.345') and from_minor(-250, 'MYR') == Decimal('-2.50')
+
+
+def test_factors_are_exact_fractions_of_the_published_rates(matrix):
+    assert matrix.factor('USD', 'SGD') == (6771, 5000)  # 1.3542, not the float's binary value
+    assert matrix.factor('USD', 'JPY') == (3, 2)  # 150 yen per 100 cents
+    assert matrix.rate('EUR', 'MYR') == Decimal('4.891304')
+    assert matrix.rate('JPY', 'KWD', places=8) == Decimal('0.00204667')
+
+
+def test_convert_between_currencies_with_different_decimals(matrix):
+    assert matrix.convert(10000, 'USD', 'MYR') == 45000
+    assert matrix.convert(10000, 'USD', 'JPY') == 15000
+    assert matrix.convert(15000, 'JPY', 'KWD') == 30700
+    assert matrix.convert(30700, 'KWD', 'JPY') == 15000
+
+
+@pytest.mark.parametrize('rounding', [ROUND_HALF_UP, ROUND_HALF_EVEN])
+@pytest.mark.parametrize('pair', [('EUR', 'MYR'), ('MYR', 'JPY'), ('JPY', 'KWD'), ('SGD', 'USD'), ('USD', 'USD')])
+def test_convert_column_rounds_like_decimal(matrix, rounding, pair):
+    from_currency, to_currency = pair
+    amounts = array('q', range(-2000, 2001, 7))
+    numerator, denominator = matrix.factor(from_currency, to_currency)
+    expected = [int((Decimal(amount) * numerator / denominator).quantize(Decimal(1), rounding=rounding))
+                for amount in amounts]
+    converted = matrix.convert_column(amounts, from_currency, to_currency, rounding)
+    assert converted.typecode == 'q' and list(converted) == expected
+
+
+@pytest.mark.parametrize('rounding, expected', [
+    (ROUND_HALF_UP, [1, 2, -1, -2, 1]),
+    (ROUND_HALF_EVEN, [0, 2, 0, -2, 1]),
+])
+def test_halves(rounding, expected):
+    matrix = CrossRateMatrix({'AAA': 1, 'BBB': 0.5})
+    assert list(matrix.convert_column([1, 3, -1, -3, 2], 'AAA', 'BBB', rounding)) == expected
+
+
+def test_convert_ledger_matches_a_conversion_per_line(matrix):
+    amounts = [10000, 15000, 30700, -999, 1]
+    currencies = ['USD', 'JPY', 'KWD', 'EUR', 'MYR']
+    expected = [matrix.convert(amount, currency, 'MYR') for amount, currency in zip(amounts, currencies)]
+    assert list(matrix.convert_ledger(amounts, currencies, 'MYR')) == expected
+    indexes = array('H', (matrix.index[currency] for currency in currencies))  # a dictionary-encoded column
+    assert list(matrix.convert_ledger(amounts, indexes, 'MYR')) == expected
+
+
+def test_invalid_input(matrix):
+    with pytest.raises(ValueError):
+        CrossRateMatrix({'USD': 1, 'MYR': 0})
+    with pytest.raises(ValueError):
+        matrix.convert_ledger([1, 2], ['USD'], 'MYR')
+    with pytest.raises(ValueError):
+        matrix.convert_column([1], 'EUR', 'MYR', ROUND_DOWN)
+    with pytest.raises(KeyError):
+        matrix.convert(1, 'GBP', 'MYR')
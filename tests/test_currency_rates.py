@@ -0,0 +1,140 @@
+# 1. Standard Library
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 2. Third Party Library
+import pytest
+
+# 3. Internal Library
+from core.utils.currency_rates import CurrencyRateService
+
+
+class RatesServer:
+    """Stand-in for the rate provider on localhost, answers in the open.er-api.com format."""
+    def __init__(self):
+        self.requests = 0
+        self.status = 200
+        self.delay = 0.0  # Seconds before answering, to make the client time out
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests += 1
+                time.sleep(server.delay)
+                # No time_next_update_unix, so the rates expire after the service's TTL
+                body = {'result': 'success', 'base_code': 'USD', 'time_last_update_unix': int(time.time()),
+                        'rates': {'USD': 1, 'MYR': 4.0 + server.requests, 'EUR': 0.9}}
+                payload = json.dumps(body if server.status == 200 else {'result': 'error'}).encode()
+                try:
+                    self.send_response(server.status)
+                    self.send_header('Content-Type', 'application/json')
+                    self.send_header('Content-Length', str(len(payload)))
+                    self.end_headers()
+                    self.wfile.write(payload)
+                except OSError:  # the client gave up waiting
+                    pass
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self.httpd.server_port}/v6/latest/USD'
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    server = RatesServer()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def make_service(qapp, server, tmp_path):
+    """New services (like new app sessions) on the stand-in server, sharing one cache file."""
+    services = []
+
+    def make(ttl=60, timeout=2.0):
+        service = CurrencyRateService(url=server.url, cache_path=str(tmp_path / 'rates.json'), ttl=ttl,
+                                      timeout=timeout)
+        service.RETRY_DELAYS = (60,)  # no retry during a test
+        services.append(service)
+        return service
+
+    yield make
+    for service in services:
+        service.stop()
+
+
+def wait_until(qapp, predicate, timeout=5.0) -> bool:
+    end = time.time() + timeout
+    while time.time() < end:
+        qapp.processEvents()
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+def test_fresh_fetch(qapp, server, make_service):
+    service = make_service()
+    received = []
+    service.subscribe(received.append)
+    assert wait_until(qapp, lambda: received)
+    assert server.requests == 1
+    assert received[-1]['MYR'] == 5.0
+    assert service.base == 'USD' and not service.is_stale()
+
+
+def test_cache_hit_within_ttl(qapp, server, make_service):
+    first = make_service()
+    first.start()
+    assert wait_until(qapp, lambda: first.rates)
+
+    second = make_service()
+    received = []
+    second.subscribe(received.append)  # cached rates are handed over at once
+    assert received and received[0]['MYR'] == 5.0
+    assert not wait_until(qapp, lambda: server.requests > 1, timeout=0.5)
+
+
+def test_refetch_after_ttl_expires(qapp, server, make_service):
+    service = make_service(ttl=1)
+    service.MIN_REFRESH = 0
+    received = []
+    service.subscribe(received.append)
+    assert wait_until(qapp, lambda: received)
+    assert wait_until(qapp, lambda: len(received) == 2, timeout=3)  # the refresh timer fires after the TTL
+    assert server.requests == 2
+    assert received[-1]['MYR'] == 6.0
+
+    service.stop()
+    time.sleep(1.1)
+    later = make_service(ttl=1)  # a new session with an expired cache fetches again on start
+    later.start()
+    assert wait_until(qapp, lambda: server.requests == 3)
+
+
+@pytest.mark.parametrize('failure', ['error', 'timeout'])
+def test_stale_cache_kept_when_the_refresh_fails(qapp, server, make_service, failure):
+    first = make_service(ttl=0)
+    first.start()
+    assert wait_until(qapp, lambda: first.rates)
+
+    if failure == 'error':
+        server.status = 500
+    else:
+        server.delay = 1.0
+    service = make_service(ttl=0, timeout=0.3)
+    errors, received = [], []
+    service.failed.connect(errors.append)
+    service.subscribe(received.append)
+    assert wait_until(qapp, lambda: errors)
+    assert received == [{'USD': 1, 'MYR': 5.0, 'EUR': 0.9}]  # only the cached rates, still shown
+    assert service.rates['MYR'] == 5.0 and service.is_stale()
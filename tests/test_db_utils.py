@@ -0,0 +1,179 @@
+# 1. Standard Library
+import time
+from datetime import datetime, timezone
+
+# 2. Third Party Library
+import psycopg2
+import pytest
+
+# 3. Internal Library
+from core.utils import db_utils
+from core.utils.csv_import import import_csv
+from core.utils.db_utils import copy_to_file, remove_entities, update_entities, update_row
+
+
+def add_items(db, *names, deleted=()):
+    with db.cursor() as cur:
+        cur.execute(
+            'INSERT INTO item (item_name, deleted_at) '
+            'SELECT name, CASE WHEN name = ANY(%s) THEN CURRENT_TIMESTAMP END FROM unnest(%s::text[]) AS name '
+            'RETURNING item_id',
+            (list(deleted), list(names)),
+        )
+        ids = [row[0] for row in cur.fetchall()]
+    db.commit()
+    return ids
+
+
+def item_names(db) -> dict:
+    with db.cursor() as cur:
+        cur.execute('SELECT item_id, item_name FROM item')
+        return dict(cur.fetchall())
+
+
+def test_update_row(db):
+    item_id, _ = add_items(db, 'Acme', 'Globex')
+    result = update_row(db, 'item', 'item_id', {'item_id': item_id, 'item_name': 'Initech'}, 'item_name')
+    assert result['row']['item_name'] == 'Initech' and result['row']['updated_at']
+    assert not result['duplicate'] and not result['missing']
+
+    result = update_row(db, 'item', 'item_id', {'item_id': item_id, 'item_name': 'Globex'}, 'item_name')
+    assert result['row'] is None and result['duplicate'] == ('item_name', 'Globex')
+
+
+def test_update_row_of_a_deleted_row_reports_it_missing(db):
+    active_id, deleted_id = add_items(db, 'Acme', 'Globex', deleted=['Globex'])
+    result = update_row(db, 'item', 'item_id', {'item_id': deleted_id, 'item_name': 'Initech'}, 'item_name')
+    assert result['row'] is None and result['missing']
+    result = update_row(db, 'item', 'item_id', {'item_id': active_id + 100, 'item_name': 'Initech'}, 'item_name')
+    assert result['row'] is None and result['missing']
+    assert item_names(db) == {active_id: 'Acme', deleted_id: 'Globex'}
+
+
+def test_copy_to_file_writes_the_csv_in_chunks(db, tmp_path):
+    db.set_client_encoding('UTF8')
+    names = [f'Société {number:03}' for number in range(200)] + ['東京商事', 'Quote "and", comma']
+    add_items(db, *names)
+    path = tmp_path / 'items.csv'
+    progress = []
+    count = copy_to_file(db, 'SELECT item_name FROM item WHERE item_id > %s ORDER BY item_id', (0,), path,
+                         chunk_size=1024, progress=progress.append)
+    assert count == len(names)
+    expected = 'item_name\n' + ''.join(f'{name}\n' for name in names[:-1]) + '"Quote ""and"", comma"\n'
+    assert path.read_text(encoding='utf-8') == expected
+    assert len(progress) > 1 and progress == sorted(progress) and progress[-1] == path.stat().st_size
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_a_failed_copy_keeps_the_previous_file(db, tmp_path):
+    path = tmp_path / 'items.csv'
+    path.write_text('previous export\n', encoding='utf-8')
+    with pytest.raises(psycopg2.Error):
+        copy_to_file(db, 'SELECT 1 / 0 FROM item', None, path)
+    db.rollback()
+    assert path.read_text(encoding='utf-8') == 'previous export\n'
+    assert list(tmp_path.iterdir()) == [path]
+
+
+@pytest.fixture
+def messages(monkeypatch):
+    """(kind, text) of every message box db_utils shows, instead of showing it."""
+    shown = []
+
+    class MessageBox:
+        @staticmethod
+        def information(parent, title, text):
+            shown.append(('information', text))
+
+        @staticmethod
+        def warning(parent, title, text):
+            shown.append(('warning', text))
+
+        critical = warning
+
+    monkeypatch.setattr(db_utils, 'QMessageBox', MessageBox)
+    return shown
+
+
+def wait_for(qapp, done: list, timeout=5.0):
+    end = time.time() + timeout
+    while not done and time.time() < end:
+        qapp.processEvents()
+        time.sleep(0.005)
+    assert done
+
+
+@pytest.mark.parametrize('deleted, message', [
+    ((), ('information', '❌ 3 items removed')),
+    (('Acme', 'Globex'), ('information', '❌ 1 of 3 items removed, 2 already deleted')),
+    (('Acme', 'Globex', 'Initech'), ('warning', '⚠️ Nothing removed: 3 items already deleted')),
+])
+def test_remove_entities_reports_the_rows_actually_deleted(qapp, db, messages, deleted, message):
+    item_ids = add_items(db, 'Acme', 'Globex', 'Initech', deleted=deleted)
+    done = []
+    remove_entities(db, 'item', 'item_id', item_ids, '3 items', on_done=done.append)
+    wait_for(qapp, done)
+    assert sorted(done[0]) == item_ids[len(deleted):]
+    assert messages == [message]
+
+
+@pytest.mark.parametrize('deleted, message', [
+    ((), ('information', '🔄 3 items edited')),
+    (('Acme', 'Globex'), ('information', '🔄 1 of 3 items edited, 2 already deleted')),
+    (('Acme', 'Globex', 'Initech'), ('warning', '⚠️ Nothing edited: 3 items already deleted')),
+])
+def test_update_entities_reports_the_rows_actually_edited(qapp, db, messages, deleted, message):
+    item_ids = add_items(db, 'Acme', 'Globex', 'Initech', deleted=deleted)
+    created = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    done = []
+    update_entities(db, 'item', 'item_id', iter(item_ids), {'created_at': created}, ['item_id', 'created_at'],
+                    '3 items', on_done=done.append)
+    wait_for(qapp, done)
+    assert sorted(done[0]) == [(item_id, created) for item_id in item_ids[len(deleted):]]
+    assert messages == [message]
+
+
+class RacingConnection:
+    """Connection on which another save takes `name` right before the import's INSERT, after its name check."""
+    def __init__(self, db, name):
+        self.db = db
+        self.name = name
+
+    def cursor(self):
+        return RacingCursor(self.db.cursor(), self.name)
+
+    def commit(self):
+        self.db.commit()
+
+
+class RacingCursor:
+    def __init__(self, cursor, name):
+        self.cursor = cursor
+        self.name = name
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cursor.close()
+
+    def __getattr__(self, name):
+        return getattr(self.cursor, name)
+
+    def execute(self, sql, params=None):
+        if 'INSERT INTO item' in sql:
+            self.cursor.execute('INSERT INTO item (item_name) VALUES (%s)', (self.name,))
+        self.cursor.execute(sql, params)
+
+
+def test_import_csv_reports_names_taken_during_the_insert(db, tmp_path):
+    add_items(db, 'Acme')
+    path = tmp_path / 'items.csv'
+    path.write_text('Item Name\nAcme\nGlobex\nInitech\n', encoding='utf-8')
+
+    result = import_csv(RacingConnection(db, 'Globex'), path, 'item', ['item_name'], ['Item Name'], 'item_name',
+                        lambda record: [])
+    assert result['inserted'] == 1 and result['duplicates'] == 2
+    assert result['errors'] == [(2, 'A row with the name "Acme" already exists.'),
+                                (3, 'A row with the name "Globex" already exists.')]
+    assert sorted(item_names(db).values()) == ['Acme', 'Globex', 'Initech']
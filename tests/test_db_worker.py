@@ -0,0 +1,127 @@
+# 1. Standard Library
+import threading
+import time
+
+# 2. Third Party Library
+import psycopg2
+import pytest
+
+# 3. Internal Library
+from core.utils.db_worker import QueryTask, run_in_background
+
+
+class FakeDb:
+    """Stand-in for a psycopg2 connection, records commits, rollbacks and server-side cancels."""
+    def __init__(self):
+        self.closed = 0
+        self.calls = []
+        self.cancelled = threading.Event()
+
+    def commit(self):
+        self.calls.append('commit')
+
+    def rollback(self):
+        self.calls.append('rollback')
+
+    def cancel(self):
+        self.calls.append('cancel')
+        self.cancelled.set()
+
+
+def run(task) -> list:
+    """Run the task on this thread, returns the signals it emitted as (name, value) pairs."""
+    emitted = []
+    task.signals.progress.connect(lambda item: emitted.append(('progress', item)))
+    task.signals.finished.connect(lambda result: emitted.append(('finished', result)))
+    task.signals.failed.connect(lambda error: emitted.append(('failed', error)))
+    task.signals.cancelled.connect(lambda: emitted.append(('cancelled', None)))
+    task.run()
+    return emitted
+
+
+@pytest.mark.parametrize('writes, expected', [(True, ('finished', 'saved')), (False, ('cancelled', None))])
+def test_cancel_after_the_commit(qapp, writes, expected):
+    """Cancel pressed while the save's commit is already done: a write still delivers its result."""
+    db = FakeDb()
+
+    def save(db):
+        db.commit()
+        task.cancel()  # arrives after the commit, before the result reached the GUI thread
+        return 'saved'
+
+    task = QueryTask(db, save, writes=writes)
+    assert run(task) == [expected]
+    assert db.calls == ['commit', 'cancel']
+
+
+def test_a_task_cancelled_before_it_starts_never_runs(qapp):
+    db = FakeDb()
+    task = QueryTask(db, lambda db: db.commit())
+    task.cancel()
+    assert run(task) == [('cancelled', None)]
+    assert db.calls == []
+
+
+def test_a_generator_stops_at_the_first_item_after_the_cancel(qapp):
+    closed = []
+
+    def stream(db):
+        try:
+            for batch in range(5):
+                if batch == 2:
+                    task.cancel()
+                yield batch
+            return 'all'
+        finally:
+            closed.append(True)
+
+    task = QueryTask(FakeDb(), stream)
+    assert run(task) == [('progress', 0), ('progress', 1), ('cancelled', None)]
+    assert closed == [True]
+
+
+def test_a_generator_runs_to_its_return_value(qapp):
+    def stream(db):
+        yield from range(3)
+        return 'all'
+
+    assert run(QueryTask(FakeDb(), stream)) == [('progress', 0), ('progress', 1), ('progress', 2), ('finished', 'all')]
+
+
+@pytest.mark.parametrize('cancelled, expected', [(True, ('cancelled', None)), (False, ('failed', 'boom'))])
+def test_an_error_is_rolled_back_and_reported_unless_cancelled(qapp, cancelled, expected):
+    db = FakeDb()
+
+    def query(db):
+        if cancelled:
+            task.cancel()
+        raise psycopg2.Error('boom')
+
+    task = QueryTask(db, query)
+    assert run(task) == [expected]
+    assert db.calls[-1] == 'rollback'
+
+
+def test_cancel_interrupts_the_running_query(qapp):
+    db = FakeDb()
+    emitted = []
+    started = threading.Event()
+
+    def query(db):
+        started.set()
+        if not db.cancelled.wait(5):
+            return 'rows'
+        raise psycopg2.extensions.QueryCanceledError('canceling statement due to user request')
+
+    task = run_in_background(db, query, on_finished=emitted.append, on_cancelled=lambda: emitted.append(None))
+    assert started.wait(5)  # the query is running on the database thread
+    task.cancel()
+    end = time.time() + 5
+    while not emitted and time.time() < end:
+        qapp.processEvents()
+        time.sleep(0.005)
+    assert emitted == [None]
+    assert db.calls == ['cancel', 'rollback']
+
+    task.cancel()  # finished, nothing left to cancel on the server
+    assert db.calls == ['cancel', 'rollback']
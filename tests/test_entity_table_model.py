@@ -0,0 +1,93 @@
+# 1. Standard Library
+from datetime import date, datetime
+
+# 2. Third Party Library
+import pytest
+from PySide6.QtCore import QModelIndex, QPersistentModelIndex
+
+# 3. Internal Library
+from core.models.entity_table_model import SORT_KEYS, EntityTableModel
+from core.utils.table_utils import add_table_row, update_table_row
+
+HEADERS = ['ID', 'Name', 'Updated']
+NAME = 1
+
+
+def row(row_id, name):
+    return row_id, name, datetime(2025, 1, row_id)
+
+
+@pytest.fixture
+def model(qapp):
+    """Five rows, filtered on names containing 'name1' (rows 1 and 3 match)."""
+    model = EntityTableModel(HEADERS)
+    model.reset_rows([row(5, 'other'), row(4, 'other'), row(3, 'name1 c'), row(2, 'other'), row(1, 'name1 a')])
+    index = model.search_index
+    model.set_filter(lambda storage: index.matches(NAME, storage, 'name1'), matches=index.search(NAME, 'name1'))
+    return model
+
+
+def shown_ids(model):
+    return [model.row_values(row)[0] for row in range(model.rowCount())]
+
+
+def test_update_by_id_hides_a_row_that_no_longer_matches(model):
+    assert shown_ids(model) == [3, 1]
+    assert model.update_by_id(3, row(3, 'zzz'))
+    assert shown_ids(model) == [1]
+
+
+def test_update_by_id_shows_a_row_that_now_matches(model):
+    assert model.update_by_id(4, row(4, 'name1 b'))
+    assert shown_ids(model) == [4, 3, 1]
+
+
+def test_apply_changes_refilters_updated_rows(model):
+    model.apply_changes([row(1, 'renamed'), row(2, 'name1 x')], removed_ids=[3])
+    assert shown_ids(model) == [2]
+    model.set_filter(None)
+    assert shown_ids(model) == [5, 4, 2, 1]
+
+
+def test_refilter_keeps_the_selection_on_its_row(model):
+    selected = QPersistentModelIndex(model.index(1, 0))  # row ID 1
+    model.update_by_id(4, row(4, 'name1 b'))
+    assert model.row_values(selected.row())[0] == 1
+
+
+CONTRACT_HEADERS = ['ID', 'Name', 'Contract Start']
+CONTRACT_KINDS = ('number', 'text', 'date')
+
+
+@pytest.mark.parametrize('loaded', [[], [(1, 'no contract', None)]])
+def test_dates_from_a_form_dialog_are_stored_as_dates(qapp, loaded):
+    """A contract date saved as 'yyyy-MM-dd' text into a table whose contract column only held NULLs."""
+    model = EntityTableModel(CONTRACT_HEADERS)
+    model.set_sort_kinds(CONTRACT_KINDS)
+    model.reset_rows(loaded)
+    model.sort(2)  # the sort keys are built before the row arrives
+    model.date_index.track(2)
+
+    add_table_row(model, [2, 'new', '2024-05-01'])
+    update_table_row(model, 1, [1, 'edited', '2024-04-01'])
+    add_table_row(model, [3, 'later', '2024-06-01'])
+    model.sort(2)
+    assert [model.row_values(row)[2] for row in range(model.rowCount())] == (
+        [date(2024, 4, 1), date(2024, 5, 1), date(2024, 6, 1)] if loaded else [date(2024, 5, 1), date(2024, 6, 1)])
+    assert len(model.date_index.between(2, date(2024, 4, 15), date(2024, 5, 15))) == 1
+
+
+@pytest.mark.parametrize('kind, text, value', [
+    ('date', '2024-05-01', date(2024, 5, 1)),
+    ('datetime', '2024-05-01', datetime(2024, 5, 1)),
+])
+def test_sort_keys_accept_dates_as_text(kind, text, value):
+    assert SORT_KEYS[kind](text) == SORT_KEYS[kind](value)
+
+
+def test_apply_changes_inserts_new_rows_newest_first(qapp):
+    model = EntityTableModel(HEADERS)
+    model.append_rows([row(5, 'e'), row(4, 'd')])
+    model.apply_changes([row(1, 'a'), row(7, 'g'), row(6, 'f')])
+    assert shown_ids(model) == [7, 6, 1, 5, 4]
+    assert not model.canFetchMore(QModelIndex())
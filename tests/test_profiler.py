@@ -0,0 +1,56 @@
+# 1. Standard Library
+
+# 2. Third Party Library
+import pytest
+
+# 3. Internal Library
+from core.utils.profiler import Profiler, parse_setting
+
+
+@pytest.mark.parametrize('value, setting', [
+    (None, (False, None)),
+    ('', (False, None)),
+    ('0', (False, None)),
+    (' Off ', (False, None)),
+    ('false', (False, None)),
+    ('1', (True, None)),
+    ('YES', (True, None)),
+    ('logs/profile.txt', (True, 'logs/profile.txt')),
+])
+def test_parse_setting(value, setting):
+    assert parse_setting(value) == setting
+
+
+@pytest.mark.parametrize('value, enabled', [('0', False), ('1', True)])
+def test_the_environment_turns_profiling_on_and_off(monkeypatch, value, enabled):
+    monkeypatch.setenv('CRM_PROFILE', value)
+    profiler = Profiler()
+    assert profiler.enabled is enabled
+    with profiler.span('table.sort'):
+        pass
+    assert len(profiler.snapshot()) == int(enabled)
+
+
+def test_spans_are_aggregated_with_percentiles():
+    profiler = Profiler(enabled=True, window=100)
+    for ms in range(1, 101):
+        profiler.record('table.filter', ms / 1000)
+    profiler.record('table.sort', 1.0)
+    summary = profiler.snapshot()
+    assert [item['span'] for item in summary] == ['table.filter', 'table.sort']
+    filtering = summary[0]
+    assert filtering['calls'] == 100
+    assert filtering['total_ms'] == pytest.approx(5050) and filtering['avg_ms'] == pytest.approx(50.5)
+    assert filtering['p50_ms'] == pytest.approx(51) and filtering['p95_ms'] == pytest.approx(96)
+    assert filtering['max_ms'] == pytest.approx(100)
+    assert 'table.filter' in profiler.report()
+
+
+def test_dump_appends_the_report_to_the_profile_file(monkeypatch, tmp_path):
+    path = tmp_path / 'profile.txt'
+    monkeypatch.setenv('CRM_PROFILE', str(path))
+    profiler = Profiler()
+    profiler.record('startup.main_window', 0.25)
+    profiler.dump()
+    profiler.dump()
+    assert path.read_text(encoding='utf-8').count('startup.main_window') == 2
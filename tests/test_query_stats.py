@@ -0,0 +1,31 @@
+# 1. Standard Library
+import io
+
+# 2. Third Party Library
+# 3. Internal Library
+from core.utils.query_stats import query_stats
+
+CSV = 'Société Générale\n東京商事\nAcme\n'
+
+
+def copied_bytes(sql) -> int:
+    return next(item['bytes'] for item in query_stats.snapshot() if item['statement'].startswith(sql))
+
+
+def test_copy_counts_bytes_of_a_text_file(db):
+    db.set_client_encoding('UTF8')
+    query_stats.reset()
+    with db.cursor() as cur:
+        cur.copy_expert('COPY item (item_name) FROM STDIN', io.StringIO(CSV))
+        sink = io.StringIO()
+        cur.copy_expert('COPY item (item_name) TO STDOUT', sink)
+    assert sink.getvalue() == CSV
+    assert copied_bytes('COPY item (item_name) FROM') == len(CSV.encode('utf-8')) > len(CSV)
+    assert copied_bytes('COPY item (item_name) TO') == len(CSV.encode('utf-8'))
+
+
+def test_copy_counts_bytes_of_a_binary_file(db):
+    query_stats.reset()
+    with db.cursor() as cur:
+        cur.copy_expert('COPY item (item_name) FROM STDIN', io.BytesIO(CSV.encode('utf-8')))
+    assert copied_bytes('COPY item (item_name) FROM') == len(CSV.encode('utf-8'))
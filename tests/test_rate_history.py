@@ -0,0 +1,95 @@
+# 1. Standard Library
+from datetime import date, datetime, timezone
+
+# 2. Third Party Library
+import pytest
+
+# 3. Internal Library
+from core.utils.rate_history import RateHistory, fetch_rate_at, load_rate_history, rate_date, store_rates
+
+ROWS = [  # (currency, rate_date, rate), not in order
+    ('MYR', date(2024, 3, 1), 4.7),
+    ('EUR', date(2024, 1, 2), 0.91),
+    ('MYR', date(2024, 1, 2), 4.6),
+    ('MYR', date(2024, 2, 1), 4.65),
+]
+
+
+@pytest.fixture
+def history():
+    return RateHistory('USD', ROWS)
+
+
+def test_rate_at_takes_the_latest_rate_on_or_before_the_date(history):
+    assert history.rate_at('MYR', date(2024, 1, 1)) is None
+    assert history.rate_at('MYR', date(2024, 1, 2)) == 4.6
+    assert history.rate_at('MYR', date(2024, 2, 29)) == 4.65
+    assert history.rate_at('MYR', date(2030, 1, 1)) == 4.7
+    assert history.rate_at('USD', date(2000, 1, 1)) == 1.0
+    assert history.rate_at('JPY', date(2024, 3, 1)) is None
+    days = [date(2023, 12, 31), date(2024, 2, 1), date(2024, 3, 5)]
+    assert history.rates_at('MYR', days) == [None, 4.65, 4.7]
+    assert history.rates_at('USD', days) == [1.0] * 3 and history.rates_at('JPY', days) == [None] * 3
+
+
+def test_series_includes_both_ends(history):
+    assert history.series('MYR', date(2024, 1, 2), date(2024, 2, 1)) == [(date(2024, 1, 2), 4.6),
+                                                                         (date(2024, 2, 1), 4.65)]
+    assert history.series('MYR', date(2024, 3, 2), date(2024, 12, 31)) == []
+    assert history.series('JPY', date(2024, 1, 1), date(2024, 12, 31)) == []
+
+
+def test_add_keeps_the_dates_sorted_and_replaces_a_day(history):
+    history.add('MYR', date(2024, 1, 15), 4.62)
+    history.add('MYR', date(2024, 2, 1), 4.66)
+    history.add_snapshot({'EUR': '0.93', 'JPY': 148}, date(2024, 1, 3))
+    assert history.series('MYR', date(2024, 1, 1), date(2024, 2, 1)) == [
+        (date(2024, 1, 2), 4.6), (date(2024, 1, 15), 4.62), (date(2024, 2, 1), 4.66)]
+    assert history.rate_at('EUR', date(2024, 1, 3)) == 0.93 and history.rate_at('JPY', date(2024, 1, 3)) == 148
+    assert history.currencies() == ['EUR', 'JPY', 'MYR'] and len(history) == 7
+
+
+def test_from_ordinals_matches_rows_with_dates(history):
+    ordinals = sorted((currency + ' ', day.toordinal(), rate) for currency, day, rate in ROWS)  # char(3) padding
+    loaded = RateHistory.from_ordinals('USD', ordinals)
+    assert loaded.currencies() == history.currencies() and len(loaded) == len(history)
+    for currency in history.currencies():
+        assert loaded.series(currency, date.min, date.max) == history.series(currency, date.min, date.max)
+
+
+def test_rate_date_is_the_utc_date():
+    assert rate_date(datetime(2024, 1, 1, 23, 30, tzinfo=timezone.utc).timestamp()) == date(2024, 1, 1)
+
+
+@pytest.fixture
+def rate_table(db):
+    with db.cursor() as cur:
+        cur.execute('''
+            CREATE TEMPORARY TABLE rate_test (
+                base char(3) NOT NULL,
+                currency char(3) NOT NULL,
+                rate_date date NOT NULL,
+                rate double precision NOT NULL,
+                updated_at timestamptz NOT NULL,
+                PRIMARY KEY (base, currency, rate_date)
+            )
+        ''')
+    db.commit()
+    return 'rate_test'
+
+
+def test_store_and_load_rates(db, rate_table):
+    morning = datetime(2024, 1, 2, 8, tzinfo=timezone.utc).timestamp()
+    assert store_rates(db, rate_table, 'USD', {'MYR': 4.6, 'EUR': 0.91}, morning) == 2
+    assert store_rates(db, rate_table, 'USD', {'MYR': 4.61}, morning + 3600) == 1  # a later update of the day
+    assert store_rates(db, rate_table, 'USD', {'MYR': 4.5}, morning - 3600) == 0  # an older one
+    store_rates(db, rate_table, 'USD', {'MYR': 4.7}, datetime(2024, 3, 1, tzinfo=timezone.utc).timestamp())
+
+    history = load_rate_history(db, rate_table)
+    assert history.currencies() == ['EUR', 'MYR']
+    assert history.series('MYR', date.min, date.max) == [(date(2024, 1, 2), 4.61), (date(2024, 3, 1), 4.7)]
+    narrowed = load_rate_history(db, rate_table, currencies=['MYR'], start=date(2024, 2, 1), end=date(2024, 12, 31))
+    assert narrowed.currencies() == ['MYR'] and len(narrowed) == 1
+
+    assert fetch_rate_at(db, rate_table, 'MYR', date(2024, 2, 15)) == 4.61
+    assert fetch_rate_at(db, rate_table, 'MYR', date(2024, 1, 1)) is None
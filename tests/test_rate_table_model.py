@@ -0,0 +1,75 @@
+# 1. Standard Library
+from datetime import date
+
+# 2. Third Party Library
+import pytest
+from PySide6.QtCore import Qt
+
+# 3. Internal Library
+from core.models.rate_table_model import RateTableModel
+
+RATES = [('MYR', 4.6), ('SGD', 1.3542), ('USD', 1.0), ('EUR', 0.91), ('MMK', 2100.5), ('JPY', 150.0)]
+
+
+@pytest.fixture
+def model(qapp):
+    model = RateTableModel(['Currency', 'Rate'])
+    model.set_rates(RATES)
+    return model
+
+
+def shown(model) -> list:
+    return [model.index(row, 0).data() for row in range(model.rowCount())]
+
+
+def test_cells_are_formatted_when_read(model):
+    assert model.rowCount() == len(RATES) and model.columnCount() == 2
+    assert model.index(1, 1).data() == '1.3542' and model.index(4, 1).data() == '2100.5000'
+    assert model.index(1, 1).data(Qt.ItemDataRole.UserRole) == 1.3542
+    assert model.headerData(0, Qt.Orientation.Horizontal) == 'Currency'
+    assert model.headerData(2, Qt.Orientation.Vertical) == '3'
+
+
+def test_dates_are_shown_and_matched_as_displayed(qapp):
+    model = RateTableModel(['Date', 'Rate'], decimals=2)
+    model.set_rates([(date(2024, 1, 2), 4.6), (date(2024, 2, 1), 4.65)])
+    assert model.index(1, 0).data() == '01-02-2024' and model.index(1, 1).data() == '4.65'
+    assert model.index(1, 0).data(Qt.ItemDataRole.UserRole) == date(2024, 2, 1)
+    model.set_filter_text('02-2024')
+    assert shown(model) == ['01-02-2024']
+
+
+def test_filter_is_case_insensitive_and_keeps_the_row_order(model):
+    model.set_filter_text(' m ')
+    assert shown(model) == ['MYR', 'MMK'] and model.is_filtered() and model.filter_text() == 'M'
+    assert model.source_row(1) == 4 and model.index(1, 1).data() == '2100.5000'
+    model.set_filter_text('')
+    assert shown(model) == [key for key, _ in RATES] and not model.is_filtered()
+
+
+def test_a_longer_text_only_searches_the_previous_matches(model, monkeypatch):
+    model.set_filter_text('M')
+    searched = []
+    match = model._match
+
+    def spy(text, candidates=None):
+        searched.append(candidates)
+        return match(text, candidates)
+
+    monkeypatch.setattr(model, '_match', spy)
+    model.set_filter_text('MY')
+    assert shown(model) == ['MYR'] and list(searched[-1]) == [0, 4]
+    model.set_filter_text('Y')  # not a longer text, every row is searched again
+    assert shown(model) == ['MYR', 'JPY'] and searched[-1] is None
+    model.set_filter_text('GBP')
+    assert shown(model) == [] and model.rowCount() == 0
+
+
+def test_new_rates_keep_the_filter(model):
+    model.set_filter_text('US')
+    resets = []
+    model.modelReset.connect(lambda: resets.append(True))
+    model.set_rates([('AUD', 1.5), ('USD', 1.0)])
+    assert shown(model) == ['USD'] and resets == [True]
+    model.set_filter_text('us')  # the same filter, no reset
+    assert resets == [True]
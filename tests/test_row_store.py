@@ -0,0 +1,105 @@
+# 1. Standard Library
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+# 2. Third Party Library
+import pytest
+
+# 3. Internal Library
+from core.models.row_store import (
+    ColumnStore,
+    _CategoryColumn,
+    _DateColumn,
+    _DateTimeColumn,
+    _IntColumn,
+    _ObjectColumn,
+    _PendingColumn,
+    _TextColumn,
+)
+
+MYT = timezone(timedelta(hours=8))
+COLUMNS = {  # column -> (values with NULLs, column type they are stored in)
+    'id': ([3, None, -(2 ** 40), 0], _IntColumn),
+    'day': ([date(2024, 2, 29), None, date(1, 1, 1), date(9999, 12, 31)], _DateColumn),
+    'naive': ([datetime(2024, 1, 1, 12, 30, 0, 5), None, datetime(1969, 12, 31, 23, 59), datetime(2038, 1, 19)],
+              _DateTimeColumn),
+    'utc': ([datetime(2024, 1, 1, tzinfo=timezone.utc), None, datetime(2000, 6, 1, 8, tzinfo=timezone.utc),
+             datetime(2024, 1, 2, tzinfo=timezone.utc)], _DateTimeColumn),
+    'local': ([datetime(2024, 1, 1, 9, tzinfo=MYT), None, datetime(2024, 7, 1, tzinfo=MYT),
+               datetime(2024, 1, 1, 1, tzinfo=MYT)], _DateTimeColumn),
+    'status': (['Active', None, 'Inactive', 'Active'], _CategoryColumn),
+    'name': (['Société Générale', None, '', '東京商事'], _TextColumn),
+    'empty': ([None, None, None, None], _PendingColumn),
+}
+NAMES = list(COLUMNS)
+
+
+def make_store() -> ColumnStore:
+    store = ColumnStore(NAMES, categorical=['status'])
+    store.append_rows(zip(*(values for values, _ in COLUMNS.values())))
+    return store
+
+
+def test_columns_are_typed_from_their_values():
+    store = make_store()
+    for col_idx, (values, column_type) in enumerate(COLUMNS.values()):
+        assert type(store._columns[col_idx]) is column_type
+        assert [store.value(index, col_idx) for index in range(len(store))] == values
+
+
+def test_export_round_trip_per_column_type():
+    store = make_store()
+    specs, blobs = store.export()
+    restored = ColumnStore.from_export(NAMES, ['status'], len(store), specs, blobs)
+    assert [restored.row(index) for index in range(len(store))] == [store.row(index) for index in range(len(store))]
+    for col_idx, (_, column_type) in enumerate(COLUMNS.values()):
+        assert type(restored._columns[col_idx]) is column_type
+    assert restored.value(0, NAMES.index('local')).utcoffset() == timedelta(hours=8)
+
+
+def test_take_keeps_only_the_given_rows():
+    store = make_store()
+    store.set_row(0, [values[2] for values, _ in COLUMNS.values()])
+    taken = store.take([3, 0])
+    assert [taken.row(index) for index in range(len(taken))] == [store.row(3), store.row(0)]
+    assert taken.nbytes() < store.nbytes()
+
+
+def test_set_row_and_clear_row():
+    store = make_store()
+    row = store.row(3)
+    store.set_row(0, row)
+    assert store.row(0) == row
+    store.clear_row(0)
+    assert store.row(0) == (None,) * len(NAMES)
+
+
+@pytest.mark.parametrize('value', [True, Decimal('1.50'), 1.5])
+def test_values_without_a_compact_encoding_fall_back_to_objects(value):
+    store = ColumnStore(['value'])
+    store.append_rows([(None,), (value,)])
+    assert type(store._columns[0]) is _ObjectColumn
+    assert store.value(1, 0) == value and store.value(0, 0) is None
+    assert store.export() is None
+
+
+def test_a_mismatching_value_turns_the_column_into_objects():
+    store = ColumnStore(['value'])
+    store.append_rows([(1,), ('one',)])
+    assert type(store._columns[0]) is _ObjectColumn
+    assert store.column_values(0) == [1, 'one']
+
+
+@pytest.mark.parametrize('kind, column_type, stored', [
+    ('date', _DateColumn, date(2024, 5, 1)),
+    ('datetime', _DateTimeColumn, datetime(2024, 5, 1)),
+    ('text', _TextColumn, '2024-05-01'),
+    (None, _TextColumn, '2024-05-01'),
+])
+def test_column_type_comes_from_the_kind_not_the_first_value(kind, column_type, stored):
+    store = ColumnStore(['id', 'contract_start'], kinds=('number', kind))
+    store.append_row((1, None))  # every value NULL so far, the column is still pending
+    store.append_row((2, '2024-05-01'))  # as a form dialog emits it
+    assert type(store._columns[1]) is column_type
+    assert store.value(1, 1) == stored
+    assert store.take([1]).kinds == store.kinds
@@ -0,0 +1,47 @@
+# 1. Standard Library
+import random
+from datetime import date, datetime, timedelta, timezone
+
+# 2. Third Party Library
+# 3. Internal Library
+from core.models.row_store import ColumnStore
+from core.utils.search_index import DateRangeIndex
+
+START = date(2024, 1, 1)
+
+
+def make_rows(first_id, count, rng):
+    rows = []
+    for row_id in range(first_id, first_id + count):
+        day = START + timedelta(days=rng.randrange(400))
+        moment = None if row_id % 7 == 0 else datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(hours=row_id)
+        rows.append((row_id, day, moment))
+    return rows
+
+
+def expected(store, column, start, end) -> set:
+    values = store.column_values(column)
+    return {index for index, value in enumerate(values)
+            if value is not None and start <= (value.date() if isinstance(value, datetime) else value) <= end}
+
+
+def test_build_keeps_the_date_index_sorted():
+    rng = random.Random(12)
+    store = ColumnStore(['id', 'day', 'moment'])
+    store.append_rows(make_rows(0, 200, rng))
+    index = DateRangeIndex(store)
+    index.track(1)
+    index.track(2)
+
+    for first_id in (200, 700):  # two pages, built in one pass each
+        new = [store.append_row(row) for row in make_rows(first_id, 500, rng)]
+        index.build(new)
+    index.add(store.append_row((1200, START, None)))  # single inserts still work
+    index.remove(5)
+    store.clear_row(5)
+
+    for column in (1, 2):
+        keys, rows, _ = index.track(column)
+        assert list(keys) == sorted(keys) and len(keys) == len(rows)
+        for start, end in ((START, START + timedelta(days=30)), (date(2024, 3, 1), date(2025, 1, 1))):
+            assert index.between(column, start, end) == expected(store, column, start, end)
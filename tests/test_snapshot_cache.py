@@ -0,0 +1,61 @@
+# 1. Standard Library
+import os
+from datetime import date, datetime, timedelta, timezone
+
+# 2. Third Party Library
+# 3. Internal Library
+from core.models.row_store import ColumnStore
+from core.utils.snapshot_cache import load_snapshot, save_snapshot
+
+COLUMNS = ['id', 'name', 'status', 'start_date', 'updated_at']
+CATEGORICAL = ['status']
+WATERMARK = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def make_row(row_id, name):
+    updated = datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(hours=row_id)
+    return row_id, name, 'Active' if row_id % 2 else 'Inactive', date(2024, 1, 1) + timedelta(days=row_id), updated
+
+
+def session(path, cycle):
+    """One app session: restore the snapshot, edit, remove and add rows, save it again."""
+    snapshot = load_snapshot(path, COLUMNS, CATEGORICAL)
+    store = snapshot['store']
+    order = list(range(len(store)))
+    for index in order[:50]:  # edits leave the old text behind in the buffer
+        row = store.row(index)
+        store.set_row(index, (row[0], f'name {row[0]} edit {cycle % 10}', *row[2:]))
+    for index in order[50:60]:  # removed rows stay in the store until it is rebuilt
+        store.clear_row(index)
+    order = order[:50] + order[60:]
+    for row_id in range(10):  # as many new rows as removed ones, of the same size
+        order.append(store.append_row(make_row(10_000 + cycle * 10 + row_id, f'name {row_id:04} edit 0')))
+    assert save_snapshot(path, store, order, WATERMARK, ('number', 'text', 'text', 'date', 'datetime'))
+    return os.path.getsize(path)
+
+
+def test_snapshot_round_trip(tmp_path):
+    path = tmp_path / 'client.snapshot'
+    store = ColumnStore(COLUMNS, CATEGORICAL)
+    rows = [make_row(row_id, f'name {row_id:04} edit 0') for row_id in range(500)]
+    store.append_rows(rows)
+    store.clear_row(3)
+    order = [index for index in range(len(store)) if index != 3][::-1]
+    assert save_snapshot(path, store, order, WATERMARK)
+
+    snapshot = load_snapshot(path, COLUMNS, CATEGORICAL)
+    assert len(snapshot['store']) == len(order)
+    assert [snapshot['store'].row(index) for index in range(len(order))] == [rows[index] for index in order]
+    assert snapshot['watermark'] == WATERMARK
+
+
+def test_snapshot_size_stays_the_same_across_edit_sessions(tmp_path):
+    path = tmp_path / 'client.snapshot'
+    store = ColumnStore(COLUMNS, CATEGORICAL)
+    store.append_rows(make_row(row_id, f'name {row_id:04} edit 0') for row_id in range(500))
+    save_snapshot(path, store, range(len(store)), WATERMARK)
+
+    sizes = [session(path, cycle) for cycle in range(1, 6)]
+    assert len(set(sizes)) == 1, sizes
+    snapshot = load_snapshot(path, COLUMNS, CATEGORICAL)
+    assert len(snapshot['store']) == 500
@@ -1,7 +1,8 @@
 # 1. Standard Library
+import time
 
 # 2. Third Party Library
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QAction, QIcon
 from PySide6.QtWidgets import (
     QDockWidget,
@@ -16,12 +17,24 @@ from PySide6.QtWidgets import (
 )
 
 # 3. Internal Library
-from core import CurrencyWindow
-from database import ClientPage, PartnerPage, SupplierPage, get_connection
+from core import BasePageWidget, CurrencyWindow, run_in_background
+from core.utils.currency_rates import currency_rate_service
+from core.utils.db_worker import db_thread_pool
+from core.utils.profiler import profiler
+from core.utils.rate_history import store_rates
+from core.widgets.query_log_widget import QueryLogWidget
+from database import ChangeListener, ClientPage, ConnectionPool, PartnerPage, SupplierPage
 
 
 class MainWindow(QMainWindow):
+    # Pages are built (and load their rows) when first opened; these are built ahead, one at a time,
+    # once the window is idle, so they are usually ready when the user gets to them
+    PREFETCH_PAGES = ('Client', 'Supplier', 'Partner')
+    PREFETCH_DELAY_MS = 500  # After the first idle, and between two prefetched pages
+    RATES_START_DELAY_MS = 3000  # The currency rate service starts (and refreshes stale rates) after startup
+
     def __init__(self):
+        started = time.perf_counter()
         super().__init__()
         self.setWindowTitle('CRMMaster')
         self.resize(1200, 600)
@@ -29,8 +42,10 @@ class MainWindow(QMainWindow):
         self.currency_window = None
         self.dev_mode = True  # Set this for database access between dev and main
 
-        # This will be the main connection for any query to the SQL database
-        self.conn = get_connection()
+        # Every query checks a connection out of this pool, a dropped one is replaced on the next checkout.
+        # The first connection opens on a database thread, an unreachable server never freezes the window
+        self.conn = ConnectionPool(min_size=1, max_size=5)
+        db_thread_pool().start(self.conn.prefill)
 
         # Toolbar
         toolbar = QToolBar('Main Toolbar')
@@ -58,20 +73,38 @@ class MainWindow(QMainWindow):
         self.stack = QStackedWidget()
         self.setCentralWidget(self.stack)
 
+        # Live updates: rows changed by other sessions are pushed into the pages built so far
+        self.change_listener = ChangeListener(self)
+        self.change_listener.start()
+
         # Add pages based on privileges
         # 0 = super admin/master, 1 = admin, 2 = accounting, 3 = sales, 4 = others
         self.privilege = 0  # TODO: Set this once login is set up
-        self.pages = {'Home': self.create_page('🏠 Welcome to Home Page')}
+        self.pages = {}  # Menu name -> page widget, only the pages built so far
+        self.page_specs = {}  # Menu name -> create_page arguments of the pages not built yet
+        self.add_page('Home', '🏠 Welcome to Home Page')
         self.menu_list.addItem('Home')
         self.privileged_pages()
 
-        for page in self.pages.values():
-            self.stack.addWidget(page)
+        # Every rate download of the shared service is kept in the rate history table
+        self.rate_service = currency_rate_service()
+        self.rate_service.fetched.connect(self.record_rates)
+
+        self.prefetch_timer = QTimer(self)
+        self.prefetch_timer.setSingleShot(True)
+        self.prefetch_timer.setInterval(self.PREFETCH_DELAY_MS)
+        self.prefetch_timer.timeout.connect(self.prefetch_next_page)
 
         # Connect list click → change page
         self.menu_list.currentTextChanged.connect(self.switch_page)
         self.menu_list.setCurrentRow(0)  # Show Home by default
 
+        profiler.record('startup.main_window', time.perf_counter() - started)
+        if profiler.enabled:  # fires once the window is shown and the event loop idles
+            QTimer.singleShot(0, lambda: profiler.record('startup.first_idle', time.perf_counter() - started))
+        QTimer.singleShot(0, self.prefetch_timer.start)
+        QTimer.singleShot(self.RATES_START_DELAY_MS, self.rate_service.start)
+
     def create_page(self, text, main_window=None):
         widget = QWidget()
         layout = QVBoxLayout()
@@ -92,7 +125,7 @@ class MainWindow(QMainWindow):
         if text == 'Reports':
             layout.addWidget(QLabel(text))
         if text == 'Logs':
-            layout.addWidget(QLabel(text))
+            layout.addWidget(QueryLogWidget(parent=main_window))
         if text == '⚙️ Settings Page':
             layout.addWidget(QLabel(text))
         if text == 'ℹ️ About Page':
@@ -102,53 +135,92 @@ class MainWindow(QMainWindow):
 
     def privileged_pages(self):
         if self.privilege <= 3:
-            self.pages['Supplier'] = self.create_page('📦Supplier', self)
-            self.pages['Client'] = self.create_page('Client', self)
-            self.pages['Product'] = self.create_page('Product', self)
+            self.add_page('Supplier', '📦Supplier', self)
+            self.add_page('Client', 'Client', self)
+            self.add_page('Product', 'Product', self)
             self.menu_list.addItems(['Supplier', 'Client', 'Product'])
         if self.privilege <= 2:
-            self.pages['Partner'] = self.create_page('Partner', self)
-            self.pages['Supplier Invoice'] = self.create_page('Supplier Invoice', self)
-            self.pages['Client Invoice'] = self.create_page('Client Invoice', self)
+            self.add_page('Partner', 'Partner', self)
+            self.add_page('Supplier Invoice', 'Supplier Invoice', self)
+            self.add_page('Client Invoice', 'Client Invoice', self)
             self.menu_list.addItems(['Partner', 'Supplier Invoice', 'Client Invoice'])
         if self.privilege <= 1:
-            self.pages['Reports'] = self.create_page('Reports', self)
+            self.add_page('Reports', 'Reports', self)
             self.menu_list.addItem('Reports')
         if self.privilege == 0:
-            self.pages['Logs'] = self.create_page('Logs', self)
+            self.add_page('Logs', 'Logs', self)
             self.menu_list.addItem('Logs')
 
-        self.pages['Settings'] = self.create_page('⚙️ Settings Page')
-        self.pages['About'] = self.create_page('ℹ️ About Page')
+        self.add_page('Settings', '⚙️ Settings Page')
+        self.add_page('About', 'ℹ️ About Page')
         self.menu_list.addItems(['Settings', 'About'])
 
+    def add_page(self, name, text, main_window=None):
+        """Register the page of menu item `name`, `create_page(text, main_window)` builds it when first opened."""
+        self.page_specs[name] = (text, main_window)
+
+    def page(self, name):
+        """The page of menu item `name`, built on first use (an entity page starts loading its rows then)."""
+        if name not in self.pages:
+            page = self.pages[name] = self.create_page(*self.page_specs.pop(name))
+            self.stack.addWidget(page)
+            for entity_page in page.findChildren(BasePageWidget):
+                self.change_listener.register(entity_page)
+        return self.pages[name]
+
     def switch_page(self, name):
-        self.stack.setCurrentWidget(self.pages[name])
+        self.stack.setCurrentWidget(self.page(name))
+
+    def prefetch_next_page(self):
+        """Build the next PREFETCH_PAGES page not opened yet, then schedule the one after it."""
+        pending = [name for name in self.PREFETCH_PAGES if name in self.page_specs]
+        if pending:
+            self.page(pending[0])
+        if len(pending) > 1:
+            self.prefetch_timer.start()
 
     def toggle_menu(self):
         self.dock.setVisible(not self.dock.isVisible())
 
     def closeEvent(self, event):
+        self.change_listener.stop()
+        for page in self.findChildren(BasePageWidget):
+            page.flush_snapshot()
         if hasattr(self, 'conn') and self.conn:
-            self.conn.close()
+            self.conn.closeall()
         event.accept()
 
     def connection_test_window(self):
-        if self.conn:
-            try:
-                with self.conn.cursor() as cur:
-                    cur.execute('SELECT version();')
-                    version = cur.fetchone()
-                    QMessageBox.information(self, 'Database Connection',
-                                            f"✅ Connected to PostgreSQL:\n{version[0]}"
-                                            )
-            except Exception as e:
-                QMessageBox.critical(self, 'Database Error', f"⚠️ Query failed:\n{e}"
-                                     )
-        else:
-            QMessageBox.critical(self, 'Database Connection', '❌ Failed to connect to PostgreSQL!'
+        def fetch_version(db):
+            with db.cursor() as cur:
+                cur.execute('SELECT version();')
+                return cur.fetchone()
+
+        def on_finished(version):
+            stats = self.conn.stats()
+            QMessageBox.information(self, 'Database Connection',
+                                    f"✅ Connected to PostgreSQL:\n{version[0]}\n\n"
+                                    f"Pool: {stats['in_use']} in use, {stats['idle']} idle, "
+                                    f"{stats['reconnects']} reconnects\n"
+                                    f"Checkout wait: avg {stats['wait_avg'] * 1000:.1f} ms, "
+                                    f"max {stats['wait_max'] * 1000:.1f} ms"
+                                    )
+
+        def on_failed(error):
+            QMessageBox.critical(self, 'Database Connection', f"❌ Failed to connect to PostgreSQL!\n{error}"
                                  )
 
+        run_in_background(self.conn, fetch_version, on_finished=on_finished, on_failed=on_failed)
+
+    def record_rates(self, data):
+        table = 'currency_rate' + ('_dev' if self.dev_mode else '')
+        run_in_background(self.conn, store_rates, table, data.get('base_code') or 'USD', data['rates'],
+                          data.get('time_last_update_unix') or time.time(),
+                          on_failed=lambda error: print('Currency rates not recorded:', error))
+
     def show_currency_window(self):
-        self.currency_window = CurrencyWindow()
+        if self.currency_window is None:  # kept for the next click, the rates stay current through the service
+            self.currency_window = CurrencyWindow()
         self.currency_window.show()
+        self.currency_window.raise_()
+        self.currency_window.activateWindow()